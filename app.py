@@ -1,6 +1,6 @@
 from flask import Flask, render_template, jsonify, Response
 from flask_cors import CORS
-from routes.generator import generator_bp
+from routes.generator import generator_bp, get_services
 from utils.logger import logger, log_error
 from utils.exceptions import QuestionGeneratorError
 from werkzeug.exceptions import NotFound
@@ -68,6 +68,16 @@ def create_app(config_name: str = None) -> Flask:
     
     return app
 
+def warm_up() -> None:
+    """
+    라우트 서비스 객체와 처음 쓸 때 불러오는 토큰 인코딩, YouTube 클라이언트를 미리 준비합니다.
+    gunicorn preload_app으로 마스터에서 호출하면 fork된 워커들이 그대로 공유합니다. (gunicorn.conf.py)
+    """
+    services = get_services()
+    services.question_generator.warm_up()
+    services.content_processor.warm_up()
+    logger.info("warmed_up")
+
 if __name__ == '__main__':
     app = create_app()
     port = int(os.getenv('PORT', 8000))
@@ -0,0 +1,71 @@
+# benchmarks/chunking.py
+"""
+토큰 청크 분할 벤치마크: 10 MB 문서의 split/iter_split 시간을 tiktoken 전체 인코딩 한 번과 비교합니다.
+
+    python benchmarks/chunking.py --megabytes 10 --runs 3
+
+정확한 토큰 한도를 지키려면 문서 전체를 한 번은 인코딩해야 하므로, 인코딩 시간이 분할 시간의 하한입니다.
+회귀 예산은 tests/test_text_chunker.py의 SPLIT_BUDGET_SECONDS, SPLIT_OVERHEAD_RATIO로 검사합니다.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.text_chunker import TextChunker
+from services.tokenizer import get_encoding
+
+WORDS = [
+    "인공지능은", "인간의", "학습능력과", "추론능력을", "컴퓨터로", "구현하려는", "기술이다.",
+    "광합성은", "식물이", "빛", "에너지를", "이용해", "포도당을", "만든다.",
+    "Machine", "learning", "is", "a", "field", "of", "study", "in", "artificial", "intelligence."
+]
+
+
+def synthetic_pages(megabytes: float, seed: int = 0) -> list:
+    """한국어와 영어 단어, 숫자가 섞인 문단으로 된 페이지 목록 (UTF-8 기준 megabytes 크기)"""
+    rnd = random.Random(seed)
+    pages, size = [], 0
+    while size < megabytes * 1024 * 1024:
+        paragraphs = [
+            " ".join(rnd.choice(WORDS) + (str(rnd.randint(0, 999)) if rnd.random() < 0.1 else "") for _ in range(80))
+            for _ in range(8)
+        ]
+        page = "\n\n".join(paragraphs)
+        pages.append(page)
+        size += len(page.encode("utf-8")) + 2
+    return pages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="토큰 청크 분할 시간을 측정합니다.")
+    parser.add_argument("--megabytes", type=float, default=10)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    encoding = get_encoding()
+    chunker = TextChunker(encoding)
+    pages = synthetic_pages(args.megabytes)
+    text = "\n\n".join(pages)
+    steps = {
+        "encode": lambda: encoding.encode_ordinary(text),
+        "split": lambda: chunker.split(text, args.chunk_size),
+        "iter_split": lambda: list(chunker.iter_split(pages, args.chunk_size)),
+    }
+    print(f"{'step':<12}{'median s':>10}{'min s':>8}")
+    for name, step in steps.items():
+        seconds = []
+        for _ in range(args.runs):
+            started_at = time.perf_counter()
+            step()
+            seconds.append(time.perf_counter() - started_at)
+        print(f"{name:<12}{statistics.median(seconds):>10.3f}{min(seconds):>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
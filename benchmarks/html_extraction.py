@@ -0,0 +1,107 @@
+# benchmarks/html_extraction.py
+"""
+웹 페이지 본문 추출 벤치마크: 기존 BeautifulSoup find_all 방식과 HtmlExtractor를 비교합니다.
+
+    python benchmarks/html_extraction.py                 # 합성한 큰 페이지로 측정
+    python benchmarks/html_extraction.py saved/*.html    # 저장해 둔 페이지로 측정
+
+파일마다 추출 시간(여러 번 반복한 최솟값)과 결과 텍스트의 토큰 수(cl100k_base)를 출력합니다.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tiktoken
+from bs4 import BeautifulSoup
+from services.html_extractor import HtmlExtractor, decode_html
+
+SENTENCE = "광합성은 식물이 빛 에너지를 이용해, 이산화탄소와 물로부터 포도당과 산소를 만드는 과정이다. "
+
+
+def legacy_extract(html: str) -> str:
+    """user-023 이전의 process_website 추출 방식"""
+    soup = BeautifulSoup(html, 'html.parser')
+    text = ""
+    if soup.title:
+        text += f"제목: {soup.title.string}\n\n"
+    for tag in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+        text += f"{tag.get_text()}\n"
+    return text.strip()
+
+
+def engine_extract(html: str, use_lxml: bool = True) -> str:
+    content = HtmlExtractor(use_lxml=use_lxml).extract(html)
+    parts = [f"제목: {content.title}\n"] if content.title else []
+    parts.extend(content.blocks)
+    return "\n".join(parts).strip()
+
+
+def synthetic_page(paragraphs: int) -> str:
+    """메뉴/사이드바/댓글/푸터/쿠키 배너가 있는 뉴스 기사형 페이지"""
+    menu = "".join(f'<li><a href="/c/{i}">카테고리 {i}</a></li>' for i in range(60))
+    related = "".join(
+        f'<div class="related-item"><h3><a href="/r/{i}">관련 기사 제목 {i}</a></h3>'
+        f'<p>관련 기사 미리보기 문장입니다, 더 읽으려면 클릭하세요.</p></div>'
+        for i in range(80)
+    )
+    comments = "".join(
+        f'<div class="comment"><p>댓글 {i}: 좋은 글 감사합니다, 잘 읽었습니다. 다음 글도 기대할게요.</p></div>'
+        for i in range(paragraphs // 2)
+    )
+    body = "".join(
+        f"<h2>소제목 {i}</h2>" if i % 10 == 0 else f"<p>{SENTENCE * 4}({i})</p>"
+        for i in range(paragraphs)
+    )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>광합성의 원리 - 과학 뉴스</title>"
+        + "<script>" + "var tracking = {};" * 500 + "</script><style>" + ".a{color:red}" * 500 + "</style>"
+        + "</head><body>"
+        + f'<header><nav><ul>{menu}</ul></nav></header>'
+        + '<div id="cookie-consent"><p>이 사이트는 더 나은 서비스를 위해 쿠키를 사용합니다. 계속 이용하면 동의한 것으로 간주합니다.</p></div>'
+        + f'<div class="wrapper"><aside class="sidebar">{related}</aside>'
+        + f'<article class="article-body"><h1>광합성의 원리</h1>{body}</article>'
+        + f'<section class="comments">{comments}</section></div>'
+        + '<footer><p>© 2024 과학 뉴스. 무단 전재 및 재배포 금지. 주소: 서울시 어딘가, 전화: 02-000-0000</p></footer>'
+        + "</body></html>"
+    )
+
+
+def measure(func, html: str, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        text = func(html)
+        best = min(best, time.perf_counter() - started_at)
+    return best, text
+
+
+def main(paths) -> None:
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, "rb") as file:
+                pages.append((os.path.basename(path), decode_html(file.read())))
+    else:
+        pages = [(f"synthetic-{n}", synthetic_page(n)) for n in (200, 2000)]
+
+    encoding = tiktoken.get_encoding("cl100k_base")
+    print(
+        f"{'page':<20}{'KB':>8}{'legacy s':>10}{'lxml s':>10}{'stdlib s':>10}"
+        f"{'speedup':>9}{'legacy tok':>12}{'engine tok':>12}"
+    )
+    for name, html in pages:
+        legacy_seconds, legacy_text = measure(legacy_extract, html)
+        engine_seconds, engine_text = measure(engine_extract, html)
+        stdlib_seconds, _ = measure(lambda page: engine_extract(page, use_lxml=False), html)
+        print(
+            f"{name:<20}{len(html.encode('utf-8')) // 1024:>8}"
+            f"{legacy_seconds:>10.3f}{engine_seconds:>10.3f}{stdlib_seconds:>10.3f}"
+            f"{legacy_seconds / engine_seconds:>8.1f}x"
+            f"{len(encoding.encode(legacy_text)):>12}{len(encoding.encode(engine_text)):>12}"
+        )
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,76 @@
+# benchmarks/startup.py
+"""
+워커 부팅 시간 벤치마크: 매번 새 파이썬 프로세스에서 측정합니다.
+
+    python benchmarks/startup.py --runs 5
+
+- boot: wsgi 모듈 임포트 (설정 로드, 블루프린트 임포트, create_app)
+- first_tokens: 부팅 후 첫 토큰 계산 (tiktoken 인코딩 로드)
+- youtube_client: 부팅 후 YouTube Data API 클라이언트 생성
+- preload_worker: gunicorn preload처럼 부팅/워밍업한 프로세스에서 fork한 워커가 첫 토큰 계산까지 걸린 시간
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import json, os, sys, time
+started_at = time.perf_counter()
+import wsgi
+from routes import generator
+booted = time.perf_counter()
+mode = sys.argv[1]
+if mode == "first_tokens":
+    generator.get_services().question_generator.count_tokens("워커 부팅 시간 측정")
+elif mode == "youtube_client":
+    generator.get_services().content_processor.youtube
+elif mode == "preload_worker":
+    from app import warm_up
+    warm_up()
+    booted = time.perf_counter()
+    read, write = os.pipe()
+    if os.fork() == 0:
+        forked_at = time.perf_counter()
+        generator.get_services().question_generator.count_tokens("워커 부팅 시간 측정")
+        os.write(write, str(time.perf_counter() - forked_at).encode())
+        os._exit(0)
+    os.wait()
+    print(json.dumps({"boot": booted - started_at, "step": float(os.read(read, 64))}))
+    sys.exit(0)
+print(json.dumps({"boot": booted - started_at, "step": time.perf_counter() - booted}))
+"""
+
+
+def probe(mode: str) -> dict:
+    env = dict(os.environ, YOUTUBE_API_KEY=os.environ.get("YOUTUBE_API_KEY", "benchmark-key"))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE, mode],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="워커 부팅 시간을 측정합니다.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--preload", action="store_true", help="gunicorn preload(fork) 워커도 측정 (app.warm_up 필요)")
+    args = parser.parse_args()
+
+    modes = ["first_tokens", "youtube_client"] + (["preload_worker"] if args.preload else [])
+    boots = []
+    print(f"{'step':<16}{'median s':>10}{'min s':>8}")
+    for mode in modes:
+        results = [probe(mode) for _ in range(args.runs)]
+        boots.extend(result["boot"] for result in results if mode != "preload_worker")
+        steps = [result["step"] for result in results]
+        print(f"{mode:<16}{statistics.median(steps):>10.3f}{min(steps):>8.3f}")
+    print(f"{'boot':<16}{statistics.median(boots):>10.3f}{min(boots):>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
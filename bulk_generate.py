@@ -0,0 +1,53 @@
+# bulk_generate.py
+"""
+웹 서버 없이 여러 문서의 요약/문제를 일괄 생성합니다.
+
+    python bulk_generate.py --input textbooks/ --urls urls.txt --output bank.jsonl --workers 4
+
+중단된 실행은 같은 --output으로 다시 실행하면 끝난 문서를 건너뛰고 이어서 처리합니다.
+"""
+import argparse
+import sys
+from config import get_config
+from services.bulk_runner import BulkRunner, discover_files, read_url_list
+from services.pipeline import create_pipeline
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="문서 디렉터리/URL 목록으로 문제 세트를 일괄 생성합니다.")
+    parser.add_argument("--input", action="append", default=[], help="PDF/텍스트 파일이 있는 디렉터리 (여러 번 지정 가능)")
+    parser.add_argument("--urls", action="append", default=[], help="한 줄에 URL 하나인 목록 파일")
+    parser.add_argument("--output", required=True, help="결과 JSONL 경로 (체크포인트는 <output>.checkpoint)")
+    parser.add_argument("--workers", type=int, default=get_config().BATCH.WORKERS, help="동시에 처리할 문서 수")
+    parser.add_argument("--no-reuse", action="store_true", help="문제 은행에 있는 문서도 새로 생성")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    sources = []
+    for directory in args.input:
+        sources.extend(discover_files(directory))
+    for path in args.urls:
+        sources.extend(read_url_list(path))
+    if not sources:
+        print("처리할 문서가 없습니다.", file=sys.stderr)
+        return 1
+
+    pipeline = create_pipeline()
+    runner = BulkRunner(pipeline, args.output, workers=max(1, args.workers), reuse=False if args.no_reuse else None)
+
+    succeeded = failed = 0
+    for record in runner.run(sources):
+        if record["status"] == "succeeded":
+            succeeded += 1
+        else:
+            failed += 1
+        print(f"[{succeeded + failed}] {record['status']}: {record['source']} ({record['duration']}s)", flush=True)
+
+    print(f"완료: 성공 {succeeded}, 실패 {failed}, 이전 실행에서 완료 {len(sources) - succeeded - failed}")
+    return 0 if failed == 0 else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
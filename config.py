@@ -2,11 +2,9 @@ from typing import Dict, List, Optional
 from pydantic import Field, BaseSettings
 from enum import Enum
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# .env 파일 로드
-load_dotenv()
-
 class QuestionType(str, Enum):
     ANALYSIS = "analysis"
     SYNTHESIS = "synthesis"
@@ -42,6 +40,14 @@ class OpenAIConfig(BaseSettings):
     MODEL: str = Field(default="gpt-4")
     MAX_TOKENS: int = Field(default=2000)
     TEMPERATURE: float = Field(default=0.7)
+    MAX_CONCURRENCY: int = Field(default=4, ge=1)
+    REQUESTS_PER_MINUTE: int = Field(default=60, ge=1)
+    TOKENS_PER_MINUTE: int = Field(default=90000, ge=1)
+    MAX_RETRIES: int = Field(default=5, ge=0)
+    RETRY_BASE_DELAY: float = Field(default=1.0, gt=0)
+    RETRY_MAX_DELAY: float = Field(default=30.0, gt=0)
+    BREAKER_FAILURE_THRESHOLD: int = Field(default=5, ge=1)
+    BREAKER_RECOVERY_SECONDS: float = Field(default=30.0, gt=0)
     
     class Config:
         env_prefix = 'OPENAI_'
@@ -53,12 +59,118 @@ class GeminiConfig(BaseSettings):
     class Config:
         env_prefix = 'GEMINI_'
 
+class LLMConfig(BaseSettings):
+    BACKEND: str = Field(default="openai")  # openai, gemini, stub
+    FAST_MODEL: str = Field(default="")  # 비우면 백엔드 기본값 사용
+    STRONG_MODEL: str = Field(default="")
+    STAGE_MODELS: Dict[str, str] = Field(default_factory=dict)  # 예: {"reduce": "gemini:gemini-pro"}
+    STUB_LATENCY: float = Field(default=0.0, ge=0)
+    BATCH_CHUNKS: int = Field(default=1, ge=1)  # 한 요청에 묶을 최대 청크 수 (1이면 배치 끔)
+    BATCH_TOKENS: int = Field(default=3000, ge=1)  # 한 요청에 묶을 청크의 최대 토큰 수
+    
+    class Config:
+        env_prefix = 'LLM_'
+
+class PreSummaryConfig(BaseSettings):
+    ENABLED: bool = Field(default=False)
+    RATIO: float = Field(default=0.1, gt=0, le=1)  # 남길 토큰 비율
+    MIN_TOKENS: int = Field(default=8000, ge=1)  # 이보다 긴 입력에만 적용
+    
+    class Config:
+        env_prefix = 'PRESUMMARY_'
+
+class DedupConfig(BaseSettings):
+    ENABLED: bool = Field(default=True)
+    PAGE_RATIO: float = Field(default=0.3, gt=0, le=1)  # 이 비율 이상의 페이지에 반복되는 줄 제거
+    SIMILARITY: float = Field(default=0.85, gt=0, le=1)  # 중복 청크로 볼 MinHash 유사도
+    
+    class Config:
+        env_prefix = 'DEDUP_'
+
+class FeedbackConfig(BaseSettings):
+    PRECOMPUTE: bool = Field(default=False)  # 문제 생성 직후 모든 보기의 피드백을 미리 생성
+    TOKENS_PER_CHOICE: int = Field(default=120, ge=1)
+    
+    class Config:
+        env_prefix = 'FEEDBACK_'
+
+class PdfConfig(BaseSettings):
+    PARALLEL_MIN_PAGES: int = Field(default=32, ge=1)  # 이 페이지 수 이상이면 프로세스 풀에서 추출
+    WORKERS: int = Field(default=0, ge=0)  # 0이면 CPU 수
+    PAGES_PER_TASK: int = Field(default=8, ge=1)
+    STREAMING: bool = Field(default=True)  # 페이지를 추출하는 동안 앞쪽 청크 요약을 시작
+    
+    class Config:
+        env_prefix = 'PDF_'
+
+class HttpConfig(BaseSettings):
+    CONNECT_TIMEOUT: float = Field(default=5.0, gt=0)
+    READ_TIMEOUT: float = Field(default=15.0, gt=0)  # 데이터가 오지 않는 최대 간격
+    TOTAL_TIMEOUT: float = Field(default=30.0, gt=0)  # 다운로드 전체 시간 한도
+    MAX_BYTES: int = Field(default=5 * 1024 * 1024, ge=1)
+    POOL_SIZE: int = Field(default=10, ge=1)
+    USER_AGENT: str = Field(default="QuestionGenerator/1.0")
+    CACHE_ENABLED: bool = Field(default=True)  # ETag/Last-Modified 응답을 캐시하고 조건부 요청으로 재검증
+    
+    class Config:
+        env_prefix = 'HTTP_'
+
 class YouTubeConfig(BaseSettings):
     API_KEY: str = Field(default="")
+    DAILY_QUOTA: int = Field(default=10000, ge=1)  # Data API 일일 할당량 (단위)
+    QUOTA_RESERVE: int = Field(default=500, ge=0)  # 할당량 초과 전에 호출을 멈추는 여유분
+    QUOTA_PATH: str = Field(default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "youtube_quota.db"))
+    METADATA_TTL_SECONDS: int = Field(default=24 * 60 * 60, ge=1)
+    TRANSCRIPT_TTL_SECONDS: int = Field(default=30 * 24 * 60 * 60, ge=1)
+    WORKERS: int = Field(default=4, ge=1)  # 자막을 동영상 정보와 동시에 가져오는 스레드 수
+    TIMEOUT: float = Field(default=15.0, gt=0)
     
     class Config:
         env_prefix = 'YOUTUBE_'
 
+class CacheConfig(BaseSettings):
+    ENABLED: bool = Field(default=True)
+    PATH: str = Field(default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "cache.db"))
+    MAX_ENTRIES: int = Field(default=10000, ge=1)
+    TTL_SECONDS: int = Field(default=7 * 24 * 60 * 60, ge=1)
+    
+    class Config:
+        env_prefix = 'CACHE_'
+
+class ArtifactConfig(BaseSettings):
+    ENABLED: bool = Field(default=True)  # 같은 업로드 파일은 PDF를 다시 파싱하지 않고 저장된 페이지 텍스트 사용
+    PATH: str = Field(default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "artifacts.db"))
+    MAX_BYTES: int = Field(default=512 * 1024 * 1024, ge=1)  # 압축된 페이지 텍스트 합계 한도
+    
+    class Config:
+        env_prefix = 'ARTIFACT_'
+
+class JobConfig(BaseSettings):
+    WORKERS: int = Field(default=2, ge=1)
+    MAX_QUEUE: int = Field(default=100, ge=1)
+    PATH: str = Field(default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "jobs.db"))
+    STALE_SECONDS: int = Field(default=15 * 60, ge=1)
+    RETENTION_SECONDS: int = Field(default=24 * 60 * 60, ge=1)
+    
+    class Config:
+        env_prefix = 'JOB_'
+
+class BatchConfig(BaseSettings):
+    WORKERS: int = Field(default=4, ge=1)  # 모든 /process/batch 요청이 함께 쓰는 항목 처리 스레드 수
+    MAX_ITEMS: int = Field(default=20, ge=1)
+    
+    class Config:
+        env_prefix = 'BATCH_'
+
+class QuestionBankConfig(BaseSettings):
+    ENABLED: bool = Field(default=True)
+    PATH: str = Field(default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "question_bank.db"))
+    REUSE: bool = Field(default=True)  # 같은 문서의 문제 세트가 있으면 /process에서 재사용
+    SEARCH_LIMIT: int = Field(default=20, ge=1, le=100)
+    
+    class Config:
+        env_prefix = 'QUESTION_BANK_'
+
 class LogConfig(BaseSettings):
     LEVEL: str = Field(default="INFO")
     FORMAT: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -79,11 +191,22 @@ class Config(BaseSettings):
     QUESTION_TYPES: dict = Field(default=QUESTION_TYPES)
     
     # 컴포넌트별 설정
-    QUESTION: QuestionConfig = QuestionConfig()
-    OPENAI: OpenAIConfig = OpenAIConfig()
-    GEMINI: GeminiConfig = GeminiConfig()
-    YOUTUBE: YouTubeConfig = YouTubeConfig()
-    LOG: LogConfig = LogConfig()
+    QUESTION: QuestionConfig = Field(default_factory=QuestionConfig)
+    OPENAI: OpenAIConfig = Field(default_factory=OpenAIConfig)
+    GEMINI: GeminiConfig = Field(default_factory=GeminiConfig)
+    LLM: LLMConfig = Field(default_factory=LLMConfig)
+    PRESUMMARY: PreSummaryConfig = Field(default_factory=PreSummaryConfig)
+    DEDUP: DedupConfig = Field(default_factory=DedupConfig)
+    FEEDBACK: FeedbackConfig = Field(default_factory=FeedbackConfig)
+    PDF: PdfConfig = Field(default_factory=PdfConfig)
+    HTTP: HttpConfig = Field(default_factory=HttpConfig)
+    YOUTUBE: YouTubeConfig = Field(default_factory=YouTubeConfig)
+    CACHE: CacheConfig = Field(default_factory=CacheConfig)
+    ARTIFACT: ArtifactConfig = Field(default_factory=ArtifactConfig)
+    JOB: JobConfig = Field(default_factory=JobConfig)
+    BATCH: BatchConfig = Field(default_factory=BatchConfig)
+    QUESTION_BANK: QuestionBankConfig = Field(default_factory=QuestionBankConfig)
+    LOG: LogConfig = Field(default_factory=LogConfig)
     
     class Config:
         env_file = ".env"
@@ -105,14 +228,23 @@ class TestingConfig(Config):
     TESTING: bool = True
     DEBUG: bool = True
 
-# 환경별 설정 매핑
+# 환경별 설정 매핑 (요청한 환경의 설정만 처음 사용할 때 만듦)
 config_by_name = {
-    "development": DevelopmentConfig(),
-    "production": ProductionConfig(),
-    "testing": TestingConfig()
+    "development": DevelopmentConfig,
+    "production": ProductionConfig,
+    "testing": TestingConfig
 }
 
+@lru_cache(maxsize=1)
+def _load_env_file() -> bool:
+    """.env 파일을 처음 한 번만 환경 변수로 로드합니다."""
+    return load_dotenv()
+
+@lru_cache(maxsize=None)
+def _load_config(env: str) -> Config:
+    return config_by_name[env]()
+
 # 현재 환경 설정 가져오기
 def get_config() -> Config:
-    env = os.getenv("FLASK_ENV", "development")
-    return config_by_name[env] 
\ No newline at end of file
+    _load_env_file()
+    return _load_config(os.getenv("FLASK_ENV", "development")) 
\ No newline at end of file
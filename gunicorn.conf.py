@@ -0,0 +1,17 @@
+# gunicorn.conf.py
+"""
+gunicorn 설정 (gunicorn wsgi:app 실행 시 자동으로 읽힘)
+
+preload_app으로 마스터 프로세스에서 앱을 한 번만 불러오고, 토큰 인코딩 등 무거운 자원을
+미리 준비한 뒤 워커를 fork합니다. 워커 재시작/증설 시 이 작업을 반복하지 않고 메모리도 공유합니다.
+SQLite 연결과 스레드/프로세스 풀은 워커에서 처음 쓸 때 새로 만듭니다.
+"""
+import os
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() != "false"
+
+
+def when_ready(server):
+    if preload_app:
+        from app import warm_up
+        warm_up()
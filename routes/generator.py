@@ -1,22 +1,72 @@
-from typing import Dict, Any, List, Union
-from flask import Blueprint, request, jsonify, render_template, Response
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, Union
+from flask import Blueprint, current_app, request, jsonify, render_template, Response, stream_with_context
+from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
+from config import get_config
 from services.content_processor import ContentProcessor
 from services.question_generator import QuestionGenerator
-from utils.logger import log_request, log_error
+from services.pipeline import SUPPORTED_CONTENT_TYPES, create_pipeline
+from services.job_queue import JobQueue, JobStore
+from services.token_budget import UsageMeter, run_with_usage, iterate_with_usage
+from utils.logger import logger, log_request, log_error
 from utils.exceptions import (
     QuestionGeneratorError,
     ValidationError,
-    ContentProcessingError
+    ContentProcessingError,
+    JobNotFoundError,
+    ArtifactNotFoundError
 )
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
 import os
+import queue
+import time
+import uuid
 
 generator_bp = Blueprint('generator', __name__)
-content_processor = ContentProcessor()
-question_generator = QuestionGenerator()
+
+class RouteServices:
+    """라우트가 공유하는 서비스 객체 묶음 (get_services로 처음 쓸 때 만듦)"""
+    def __init__(self) -> None:
+        config = get_config()
+        self.content_processor = ContentProcessor()
+        self.question_generator = QuestionGenerator()
+        self.pipeline = create_pipeline(self.content_processor, self.question_generator, config)
+        self.question_bank = self.pipeline.question_bank
+        job_config = config.JOB
+        self.job_queue = JobQueue(
+            JobStore(
+                job_config.PATH,
+                max_queue=job_config.MAX_QUEUE,
+                stale_seconds=job_config.STALE_SECONDS,
+                retention_seconds=job_config.RETENTION_SECONDS
+            ),
+            run_job,
+            workers=job_config.WORKERS,
+            cleanup=remove_upload
+        )
+
+@lru_cache(maxsize=None)
+def get_services() -> RouteServices:
+    """
+    라우트 서비스 객체들을 처음 호출될 때 만들어 반환합니다.
+    모듈 임포트만으로는 DB 연결이나 클라이언트를 만들지 않습니다. (app.warm_up에서 미리 호출)
+    """
+    return RouteServices()
+
+def run_job(payload: Dict[str, Any], progress: Callable[[str, Dict[str, Any]], None]) -> Dict[str, Any]:
+    """대기열 작업 하나를 파이프라인으로 처리합니다."""
+    return get_services().pipeline.run(payload['type'], payload.get('content'), payload.get('file_path'), progress)
+
+def remove_upload(payload: Dict[str, Any]) -> None:
+    """작업이 끝나면(성공, 실패, 반복 중단) 업로드 임시 파일을 지웁니다. 재시도할 작업은 파일을 남겨 둡니다."""
+    file_path = payload.get('file_path')
+    if file_path and os.path.exists(file_path):
+        os.remove(file_path)
 
 ALLOWED_EXTENSIONS = {'pdf', 'png', 'jpg', 'jpeg'}
+SSE_KEEPALIVE_SECONDS = 15  # 프록시 타임아웃 방지용 주석 이벤트 간격
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -64,6 +114,104 @@ def validate_feedback_request(data: Dict[str, Any]) -> None:
     if not data.get('user_level'):
         raise ValidationError("사용자 선택 수준이 없습니다.")
 
+def read_content_request() -> Tuple[str, Any]:
+    """
+    폼 또는 JSON 요청에서 콘텐츠 타입과 내용을 읽습니다.
+    
+    Returns:
+        (콘텐츠 타입, 콘텐츠)
+        
+    Raises:
+        ValidationError: 요청 데이터나 콘텐츠 타입이 없는 경우
+    """
+    content_type = request.form.get('type')
+    if not content_type:
+        data = request.get_json()
+        if not data:
+            raise ValidationError("요청 데이터가 없습니다.")
+        content_type = data.get('type')
+        content = data.get('content')
+    else:
+        content = request.form.get('content')
+
+    if not content_type:
+        raise ValidationError("콘텐츠 타입이 지정되지 않았습니다.")
+
+    return content_type, content
+
+def get_uploaded_file(content_type: str) -> Optional[FileStorage]:
+    """
+    pdf/image 요청의 업로드 파일을 검증하고 반환합니다.
+    
+    Returns:
+        업로드 파일 (파일이 필요 없는 타입이면 None)
+        
+    Raises:
+        ValidationError: 파일이 없거나 지원하지 않는 형식인 경우
+    """
+    if content_type not in ['pdf', 'image']:
+        return None
+
+    if 'file' not in request.files:
+        raise ValidationError(f"파일이 제공되지 않았습니다.")
+    
+    file = request.files['file']
+    if file.filename == '':
+        raise ValidationError(f"선택된 파일이 없습니다.")
+    
+    if not allowed_file(file.filename):
+        raise ValidationError(f"지원하지 않는 파일 형식입니다.")
+
+    return file
+
+def read_reuse_flag() -> Optional[bool]:
+    """?reuse=false면 문제 은행에 같은 문서의 세트가 있어도 새로 생성합니다. (없으면 설정값)"""
+    reuse = request.args.get('reuse')
+    return None if reuse is None else reuse.lower() not in ('0', 'false', 'no')
+
+def read_batch_request() -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    배치 요청에서 항목 목록과 병합 여부를 읽습니다.
+    
+    JSON 요청: {"items": [{"type": "text", "content": "..."}, ...], "merge": true}
+    폼 요청: items 필드에 같은 JSON 배열, 파일 항목은 {"type": "pdf", "file": "업로드 필드 이름"}
+    
+    Returns:
+        (항목 리스트, 병합 여부)
+        
+    Raises:
+        ValidationError: 항목 목록이 없거나 너무 많은 경우
+    """
+    if request.form.get('items'):
+        try:
+            items = json.loads(request.form['items'])
+        except json.JSONDecodeError:
+            raise ValidationError("items는 JSON 배열이어야 합니다.")
+        merge = request.form.get('merge', '').lower() in ('1', 'true', 'yes')
+    else:
+        data = request.get_json(silent=True) or {}
+        items = data.get('items')
+        merge = bool(data.get('merge'))
+
+    if not isinstance(items, list) or not items:
+        raise ValidationError("처리할 항목이 없습니다.")
+    max_items = get_config().BATCH.MAX_ITEMS
+    if len(items) > max_items:
+        raise ValidationError(f"한 번에 최대 {max_items}개까지 처리할 수 있습니다.")
+
+    parsed = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValidationError("각 항목은 객체여야 합니다.")
+        item = dict(item)
+        # 파일 항목은 업로드 필드 이름을 실제 파일로 바꿈 (없으면 항목별 오류로 처리)
+        field = item.pop('file', None)
+        upload = request.files.get(field) if isinstance(field, str) else None
+        if upload and upload.filename and allowed_file(upload.filename):
+            item['file'] = upload
+        parsed.append(item)
+    return parsed, merge
+
 @generator_bp.route('/process', methods=['POST'])
 @log_request
 def process_content() -> Union[Response, tuple[Response, int]]:
@@ -74,138 +222,225 @@ def process_content() -> Union[Response, tuple[Response, int]]:
         JSON 응답 또는 에러 응답
     """
     try:
-        content_type = request.form.get('type')
-        if not content_type:
-            data = request.get_json()
-            if not data:
-                raise ValidationError("요청 데이터가 없습니다.")
-            content_type = data.get('type')
-            content = data.get('content')
-        else:
-            content = request.form.get('content')
-
-        if not content_type:
-            raise ValidationError("콘텐츠 타입이 지정되지 않았습니다.")
-
-        # 콘텐츠 처리
-        try:
-            if content_type == 'text':
-                if not content:
-                    raise ValidationError("텍스트가 없습니다.")
-                processed_content = content_processor.process_text(content)
-            
-            elif content_type in ['pdf', 'image']:
-                if 'file' not in request.files:
-                    raise ValidationError(f"파일이 제공되지 않았습니다.")
-                
-                file = request.files['file']
-                if file.filename == '':
-                    raise ValidationError(f"선택된 파일이 없습니다.")
-                
-                if not allowed_file(file.filename):
-                    raise ValidationError(f"지원하지 않는 파일 형식입니다.")
-                
-                if content_type == 'pdf':
-                    processed_content = content_processor.process_pdf(file)
-                else:  # image
-                    processed_content = content_processor.process_image(file)
-            
-            elif content_type == 'youtube':
-                if not content:
-                    raise ValidationError("유튜브 URL이 없습니다.")
-                if not isinstance(content, str):
-                    raise ValidationError("올바른 유튜브 URL이 제공되지 않았습니다.")
-                processed_content = content_processor.process_youtube(content)
-            
-            else:  # website
-                if not content:
-                    raise ValidationError("웹사이트 URL이 없습니다.")
-                if not isinstance(content, str):
-                    raise ValidationError("올바른 웹사이트 URL이 제공되지 않았습니다.")
-                processed_content = content_processor.process_website(content)
-
-            # 오류 메시지 확인
-            if isinstance(processed_content, str) and any(error_text in processed_content for error_text in [
-                "처리 중 오류가 발생했습니다",
-                "찾을 수 없습니다",
-                "접근할 수 없습니다",
-                "올바르지 않은",
-                "제공되지 않았습니다"
-            ]):
-                raise ContentProcessingError(processed_content)
+        content_type, content = read_content_request()
+        result = get_services().pipeline.run(
+            content_type,
+            content,
+            get_uploaded_file(content_type),
+            reuse=read_reuse_flag()
+        )
+        return jsonify(result)
 
-        except Exception as e:
-            raise ContentProcessingError(f"콘텐츠 처리 중 오류 발생: {str(e)}")
+    except QuestionGeneratorError as e:
+        log_error(e)
+        return jsonify({'error': e.message}), e.status_code
+    except Exception as e:
+        log_error(e)
+        return jsonify({'error': str(e)}), 500
+
+@generator_bp.route('/process/batch', methods=['POST'])
+@log_request
+def process_batch() -> Union[Response, tuple[Response, int]]:
+    """
+    여러 텍스트/파일/URL을 한 번에 처리하고 항목별 결과와 오류를 반환합니다.
+    merge가 참이면 성공한 항목들을 합친 문제 세트(merged)도 생성합니다.
+    
+    Returns:
+        JSON 응답 또는 에러 응답
+    """
+    try:
+        items, merge = read_batch_request()
+        return jsonify(get_services().pipeline.run_batch(items, merge=merge, reuse=read_reuse_flag()))
+
+    except QuestionGeneratorError as e:
+        log_error(e)
+        return jsonify({'error': e.message}), e.status_code
+    except Exception as e:
+        log_error(e)
+        return jsonify({'error': str(e)}), 500
 
-        if not processed_content:
-            raise ContentProcessingError("처리된 콘텐츠가 없습니다.")
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 형식의 메시지를 만듭니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
-        # 요약 및 주제 추출
+@generator_bp.route('/process/stream', methods=['POST'])
+@log_request
+def process_content_stream() -> Response:
+    """
+    콘텐츠를 처리하면서 진행 상황과 부분 결과를 Server-Sent Events로 전송합니다.
+    
+    이벤트 순서:
+        extracted → chunk_summarized/summaries_reduced → summary → question... → done
+        (실패 시 error, done에는 토큰/비용 사용량 포함)
+    
+    Returns:
+        text/event-stream 응답
+    """
+    def generate() -> Iterator[str]:
+        usage = UsageMeter()
         try:
-            summary_and_topics = question_generator.generate_summary_and_topics(processed_content)
-            summary_data = json.loads(summary_and_topics)
-            
-            if not isinstance(summary_data, dict) or '요약' not in summary_data or '핵심 주제' not in summary_data:
-                raise QuestionGeneratorError(
-                    message="잘못된 요약 데이터 형식입니다.",
-                    error_code="INVALID_SUMMARY_FORMAT"
+            content_type, content = read_content_request()
+
+            file = get_uploaded_file(content_type)
+            services = get_services()
+            pipeline = services.pipeline
+
+            key = pipeline.upload_key(content_type, file)
+            if pipeline.streams_pdf(content_type, key):
+                # PDF는 페이지를 추출하는 대로 요약 (extracted 이벤트는 추출이 끝날 때 전송)
+                def summarize(report):
+                    return pipeline.summarize_pdf_stream(file, report, key)
+            else:
+                try:
+                    processed_content, metadata, pages = pipeline.extract(content_type, content, file, key)
+                except QuestionGeneratorError:
+                    raise
+                except Exception as e:
+                    raise ContentProcessingError(f"콘텐츠 처리 중 오류 발생: {str(e)}")
+
+                if not processed_content:
+                    raise ContentProcessingError("처리된 콘텐츠가 없습니다.")
+
+                yield format_sse('extracted', metadata)
+
+                def summarize(report):
+                    return (
+                        pipeline.summarize(processed_content, report, pages),
+                        services.question_generator.fingerprint(processed_content)
+                    )
+
+            # 요약은 별도 스레드에서 실행하고 진행 이벤트를 큐로 받아 전달
+            events: queue.Queue = queue.Queue()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(
+                    run_with_usage,
+                    usage,
+                    summarize,
+                    lambda event, data: events.put((event, data))
                 )
-        except json.JSONDecodeError as e:
-            raise QuestionGeneratorError(
-                message=f"요약 및 주제 데이터 파싱 중 오류 발생: {str(e)}",
-                error_code="JSON_PARSE_ERROR"
-            )
-        except Exception as e:
-            raise QuestionGeneratorError(
-                message=f"요약 및 주제 추출 중 오류 발생: {str(e)}",
-                error_code="SUMMARY_GENERATION_ERROR"
-            )
+                last_sent = time.monotonic()
+                while not future.done() or not events.empty():
+                    try:
+                        event, data = events.get(timeout=0.1)
+                    except queue.Empty:
+                        if time.monotonic() - last_sent > SSE_KEEPALIVE_SECONDS:
+                            last_sent = time.monotonic()
+                            yield ": keep-alive\n\n"
+                        continue
+                    last_sent = time.monotonic()
+                    yield format_sse(event, data)
 
-        # 질문 생성
-        try:
-            questions = question_generator.generate_questions(
+                summary_data, document_hash = future.result()
+
+            yield format_sse('summary', {
+                'summary': summary_data['요약'],
+                'topics': summary_data['핵심 주제']
+            })
+
+            questions = []
+            for question in iterate_with_usage(usage, services.question_generator.generate_questions_stream(
                 summary_data['요약'],
                 summary_data['핵심 주제']
-            )
-            questions_data = json.loads(questions)
-            
-            if not isinstance(questions_data, dict) or 'questions' not in questions_data:
-                raise QuestionGeneratorError(
-                    message="잘못된 질문 데이터 형식입니다.",
-                    error_code="INVALID_QUESTIONS_FORMAT"
-                )
+            )):
+                yield format_sse('question', {'index': len(questions), 'question': question})
+                questions.append(question)
 
-            return jsonify({
-                'summary': summary_data['요약'],
-                'topics': summary_data['핵심 주제'],
-                'questions': questions_data['questions']
+            question_set_id = pipeline.save(content_type, document_hash, summary_data, questions)
+            summary = usage.summary()
+            logger.info("request_usage", content_type=content_type, **summary)
+            yield format_sse('done', {
+                'questions': len(questions),
+                'question_set_id': question_set_id,
+                'usage': summary
             })
 
-        except json.JSONDecodeError as e:
-            raise QuestionGeneratorError(
-                message=f"질문 데이터 파싱 중 오류 발생: {str(e)}",
-                error_code="JSON_PARSE_ERROR"
-            )
+        except QuestionGeneratorError as e:
+            log_error(e)
+            yield format_sse('error', {'message': e.message, 'error_code': e.error_code})
         except Exception as e:
-            raise QuestionGeneratorError(
-                message=f"질문 생성 중 오류 발생: {str(e)}",
-                error_code="QUESTION_GENERATION_ERROR"
-            )
-
-        # 각 질문에 대한 객관식 문항 생성
-        for question in questions_data['questions']:
-            try:
-                multiple_choice = question_generator.generate_multiple_choice(question['질문'])
-                question['객관식'] = json.loads(multiple_choice)
-            except Exception as e:
-                raise QuestionGeneratorError(
-                    message=f"객관식 문항 생성 중 오류 발생: {str(e)}",
-                    error_code="MULTIPLE_CHOICE_GENERATION_ERROR"
-                )
+            log_error(e)
+            yield format_sse('error', {'message': str(e), 'error_code': 'INTERNAL_SERVER_ERROR'})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+def format_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """작업 레코드를 API 응답 형식으로 변환합니다."""
+    return {
+        'job_id': job['id'],
+        'status': job['status'],
+        'progress': job['progress'],
+        'result': job['result'],
+        'error': job['error'],
+        'created_at': job['created_at'],
+        'updated_at': job['updated_at']
+    }
+
+@generator_bp.route('/jobs', methods=['POST'])
+@log_request
+def submit_job() -> Union[Response, tuple[Response, int]]:
+    """
+    콘텐츠 처리를 백그라운드 작업으로 등록하고 작업 ID를 바로 반환합니다.
+    
+    Returns:
+        202 응답과 작업 정보 또는 에러 응답
+    """
+    try:
+        content_type, content = read_content_request()
+        if content_type not in SUPPORTED_CONTENT_TYPES:
+            raise ValidationError("지원하지 않는 콘텐츠 타입입니다.")
+
+        payload: Dict[str, Any] = {'type': content_type, 'content': content}
+
+        # 업로드 파일은 워커가 읽을 수 있도록 디스크에 저장
+        file = get_uploaded_file(content_type)
+        if file:
+            filename = f"{uuid.uuid4().hex}_{secure_filename(file.filename)}"
+            file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
+            file.save(file_path)
+            payload['file_path'] = file_path
+
+        try:
+            job = get_services().job_queue.submit(payload)
+        except QuestionGeneratorError:
+            if payload.get('file_path'):
+                os.remove(payload['file_path'])
+            raise
+
+        response = format_job(job)
+        response['status_url'] = f"/jobs/{job['id']}"
+        return jsonify(response), 202
 
     except QuestionGeneratorError as e:
         log_error(e)
-        return jsonify({'error': e.message}), e.status_code
+        return jsonify({'error': e.message, 'error_code': e.error_code}), e.status_code
+    except Exception as e:
+        log_error(e)
+        return jsonify({'error': str(e)}), 500
+
+@generator_bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id: str) -> Union[Response, tuple[Response, int]]:
+    """
+    작업 상태, 진행 상황, 결과를 조회합니다.
+    
+    Returns:
+        JSON 응답 또는 에러 응답
+    """
+    try:
+        # 재시작 후 남아 있는 작업도 처리되도록 워커를 확인
+        job_queue = get_services().job_queue
+        job_queue.start()
+        job = job_queue.store.get(job_id)
+        if job is None:
+            raise JobNotFoundError("작업을 찾을 수 없습니다.")
+        return jsonify(format_job(job))
+
+    except QuestionGeneratorError as e:
+        log_error(e)
+        return jsonify({'error': e.message, 'error_code': e.error_code}), e.status_code
     except Exception as e:
         log_error(e)
         return jsonify({'error': str(e)}), 500
@@ -223,12 +458,91 @@ def get_feedback() -> Union[Response, tuple[Response, int]]:
         data = request.json
         validate_feedback_request(data)
 
+        question_generator = get_services().question_generator
+
+        # 문제 생성 때 미리 만든 피드백이 있으면 LLM 호출 없이 반환
+        question_id = data.get('question_id')
+        if question_id:
+            feedback = question_generator.lookup_feedback(question_id, data['user_level'])
+            if feedback is not None:
+                return jsonify({'feedback': feedback, 'source': 'precomputed'})
+
         feedback = question_generator.generate_feedback(
             data['question'],
             data['gpt_level'],
             data['user_level']
         )
-        return jsonify({'feedback': feedback})
+        if question_id:
+            question_generator.store_feedback(question_id, data['user_level'], feedback)
+        return jsonify({'feedback': feedback, 'source': 'live'})
+
+    except QuestionGeneratorError as e:
+        log_error(e)
+        return jsonify({'error': e.message}), e.status_code
+    except Exception as e:
+        log_error(e)
+        return jsonify({'error': str(e)}), 500
+
+@generator_bp.route('/bank/documents/<document_hash>', methods=['GET'])
+def get_bank_document(document_hash: str) -> Union[Response, tuple[Response, int]]:
+    """
+    문서 해시(/process 응답의 document_hash)로 저장된 문제 세트를 최신순으로 조회합니다.
+    
+    Returns:
+        JSON 응답 또는 에러 응답
+    """
+    try:
+        search_limit = get_config().QUESTION_BANK.SEARCH_LIMIT
+        sets = get_services().question_bank.find_by_fingerprint(document_hash, limit=search_limit)
+        return jsonify({'document_hash': document_hash, 'sets': sets})
+
+    except Exception as e:
+        log_error(e)
+        return jsonify({'error': str(e)}), 500
+
+@generator_bp.route('/bank/search', methods=['GET'])
+def search_bank() -> Union[Response, tuple[Response, int]]:
+    """
+    주제 키워드(?q=)로 문제 세트를 관련도순으로 검색합니다.
+    
+    Returns:
+        JSON 응답 또는 에러 응답
+    """
+    try:
+        keyword = request.args.get('q', '').strip()
+        if not keyword:
+            raise ValidationError("검색어가 없습니다.")
+        search_limit = get_config().QUESTION_BANK.SEARCH_LIMIT
+        limit = min(request.args.get('limit', search_limit, type=int), search_limit)
+        return jsonify({'query': keyword, 'sets': get_services().question_bank.search(keyword, limit=max(1, limit))})
+
+    except QuestionGeneratorError as e:
+        log_error(e)
+        return jsonify({'error': e.message}), e.status_code
+    except Exception as e:
+        log_error(e)
+        return jsonify({'error': str(e)}), 500
+
+@generator_bp.route('/artifacts/<sha256>', methods=['GET'])
+def get_artifact(sha256: str) -> Union[Response, tuple[Response, int]]:
+    """
+    업로드 파일 해시(extracted 진행 이벤트의 metadata.sha256)로 저장된 PDF 추출 결과를 조회합니다.
+    ?start=&end=로 페이지 범위(1부터, end 포함)를 지정할 수 있습니다.
+    
+    Returns:
+        JSON 응답 또는 에러 응답
+    """
+    try:
+        artifacts = get_services().content_processor.artifacts
+        metadata = artifacts.get(sha256)
+        if metadata is None:
+            raise ArtifactNotFoundError("저장된 추출 결과가 없습니다.", {"sha256": sha256})
+        start = max(1, request.args.get('start', 1, type=int))
+        end = request.args.get('end', metadata.get('pages', 0), type=int)
+        if end < start:
+            raise ValidationError("페이지 범위가 올바르지 않습니다.")
+        pages = list(artifacts.iter_pages(sha256, start - 1, end))
+        return jsonify({'sha256': sha256, 'metadata': metadata, 'start': start, 'pages': pages})
 
     except QuestionGeneratorError as e:
         log_error(e)
@@ -237,6 +551,23 @@ def get_feedback() -> Union[Response, tuple[Response, int]]:
         log_error(e)
         return jsonify({'error': str(e)}), 500
 
+@generator_bp.route('/stats', methods=['GET'])
+def get_stats() -> Response:
+    """
+    API 호출 재시도/속도 제한/서킷 브레이커 카운터와 캐시, 작업 대기열 통계를 반환합니다.
+    
+    Returns:
+        JSON 응답
+    """
+    services = get_services()
+    return jsonify({
+        **services.question_generator.stats(),
+        'jobs': services.job_queue.store.counts(),
+        'question_bank': services.question_bank.stats(),
+        'artifacts': services.content_processor.artifacts.stats(),
+        'youtube': services.content_processor.youtube_fetcher.stats()
+    })
+
 @generator_bp.route('/form')
 def form() -> str:
     """
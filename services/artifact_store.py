@@ -0,0 +1,300 @@
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from utils.cache import thread_connection
+
+
+def upload_key(source: Union[str, BinaryIO]) -> str:
+    """업로드 원본 바이트의 SHA-256 (파일 객체는 읽은 뒤 처음 위치로 되돌림)"""
+    digest = hashlib.sha256()
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    source.seek(0)
+    for block in iter(lambda: source.read(1 << 20), b""):
+        digest.update(block)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+class ArtifactStore:
+    """
+    업로드 파일 해시로 찾는 추출 결과 저장소 (SQLite)
+
+    페이지별 추출 텍스트를 zlib으로 압축해 메타데이터(페이지 수, 빈 페이지, 추출 시간 등)와
+    함께 보관하므로, 같은 파일을 다시 올리면 PDF를 파싱하지 않고 페이지 범위만 꺼내 쓸 수 있습니다.
+    gunicorn 워커들이 같은 파일을 공유합니다. 페이지는 추출되는 대로 writer로 나눠 기록하고
+    (pending_artifacts에 표시), commit에서 메타데이터를 기록해야 조회됩니다.
+    압축된 크기의 합이 max_bytes를 넘으면 가장 오래 사용되지 않은 문서부터 제거합니다.
+    조회는 SELECT만 하고, 사용 시각은 메모리에 모았다가 FLUSH_EVERY건 또는 FLUSH_SECONDS초마다
+    (그리고 저장 시 정리 전에) 한 트랜잭션으로 기록합니다. (PersistentCache와 같은 방식)
+    """
+    FLUSH_EVERY = 64
+    FLUSH_SECONDS = 5.0
+    PENDING_TIMEOUT = 60 * 60  # 이보다 오래된 미완성 문서(추출 중 프로세스 종료)의 페이지는 정리
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, enabled: bool = True) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._local = threading.local()
+        self._pending_lock = threading.Lock()
+        self._pending_access: Dict[str, float] = {}
+        self._flushed_at = time.monotonic()
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._setup()
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결을 반환합니다."""
+        return thread_connection(self._local, self.path)
+
+    def _setup(self) -> None:
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS artifacts (
+                sha256 TEXT PRIMARY KEY,
+                pages INTEGER NOT NULL,
+                metadata TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS artifact_pages (
+                sha256 TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                text BLOB NOT NULL,
+                PRIMARY KEY (sha256, page)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS pending_artifacts (
+                sha256 TEXT PRIMARY KEY,
+                started_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_access ON artifacts (last_access)")
+
+    def _write_access(self, conn: sqlite3.Connection) -> None:
+        """모아 둔 사용 시각을 기록합니다. (호출하는 쪽의 쓰기 트랜잭션 안에서 실행)"""
+        with self._pending_lock:
+            access, self._pending_access = self._pending_access, {}
+            self._flushed_at = time.monotonic()
+        if access:
+            conn.executemany(
+                "UPDATE artifacts SET last_access = MAX(last_access, ?) WHERE sha256 = ?",
+                [(accessed_at, sha256) for sha256, accessed_at in access.items()]
+            )
+
+    def flush(self) -> None:
+        """모아 둔 사용 시각을 한 트랜잭션으로 기록합니다."""
+        if not self.enabled:
+            return
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._write_access(conn)
+
+    def get(self, sha256: str) -> Optional[Dict[str, Any]]:
+        """저장된 문서의 메타데이터를 반환하고 사용 시각을 기록해 둡니다. 없으면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+        row = self._connection().execute("SELECT metadata FROM artifacts WHERE sha256 = ?", (sha256,)).fetchone()
+        if row is None:
+            return None
+        with self._pending_lock:
+            self._pending_access[sha256] = time.time()
+            due = (
+                len(self._pending_access) >= self.FLUSH_EVERY
+                or time.monotonic() - self._flushed_at >= self.FLUSH_SECONDS
+            )
+        if due:
+            self.flush()
+        return json.loads(row["metadata"])
+
+    def contains(self, sha256: str) -> bool:
+        """저장된 문서인지 확인합니다. (사용 시각은 갱신하지 않음)"""
+        if not self.enabled:
+            return False
+        row = self._connection().execute("SELECT 1 FROM artifacts WHERE sha256 = ?", (sha256,)).fetchone()
+        return row is not None
+
+    def iter_pages(self, sha256: str, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+        """
+        페이지 텍스트를 순서대로 내보냅니다.
+
+        Args:
+            start: 시작 페이지 (0부터)
+            end: 끝 페이지 (포함하지 않음, None이면 마지막까지)
+        """
+        cursor = self._connection().execute(
+            "SELECT text FROM artifact_pages WHERE sha256 = ? AND page >= ? AND page < ? ORDER BY page",
+            (sha256, start, end if end is not None else 2 ** 62)
+        )
+        for row in cursor:
+            yield zlib.decompress(row["text"]).decode("utf-8")
+
+    def writer(self, sha256: str) -> "ArtifactWriter":
+        """문서 하나의 압축된 페이지를 추출되는 대로 기록하는 writer를 반환합니다."""
+        return ArtifactWriter(self, sha256)
+
+    def put(self, sha256: str, pages: List[bytes], metadata: Dict[str, Any]) -> bool:
+        """
+        압축된 페이지 텍스트(compress_page)와 메타데이터를 저장하고 크기 한도에 맞춰 오래된 문서를 지웁니다.
+
+        Returns:
+            저장 여부 (문서 하나가 한도보다 크면 저장하지 않음)
+        """
+        writer = self.writer(sha256)
+        for page in pages:
+            writer.add(page)
+        return writer.commit(metadata)
+
+    def _write_pages(self, sha256: str, pages: List[Tuple[int, bytes]], first: bool) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if first:
+                # 다시 기록하는 문서는 commit 전까지 조회되지 않도록 기존 항목을 지움
+                conn.execute("DELETE FROM artifacts WHERE sha256 = ?", (sha256,))
+                conn.execute("DELETE FROM artifact_pages WHERE sha256 = ?", (sha256,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO pending_artifacts (sha256, started_at) VALUES (?, ?)",
+                    (sha256, time.time())
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO artifact_pages (sha256, page, text) VALUES (?, ?, ?)",
+                ((sha256, number, page) for number, page in pages)
+            )
+
+    def _commit(self, sha256: str, pages: int, size: int, metadata: Dict[str, Any]) -> None:
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # 정리 전에 최근 사용 시각을 반영해 LRU 순서를 맞춤
+            self._write_access(conn)
+            conn.execute("DELETE FROM pending_artifacts WHERE sha256 = ?", (sha256,))
+            conn.execute("DELETE FROM artifact_pages WHERE sha256 = ? AND page >= ?", (sha256, pages))
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO artifacts (sha256, pages, metadata, size_bytes, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (sha256, pages, json.dumps(metadata, ensure_ascii=False), size, now, now)
+            )
+            total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM artifacts").fetchone()[0]
+            while total > self.max_bytes:
+                oldest = conn.execute(
+                    "SELECT sha256, size_bytes FROM artifacts WHERE sha256 != ? ORDER BY last_access LIMIT 1",
+                    (sha256,)
+                ).fetchone()
+                if oldest is None:
+                    break
+                conn.execute("DELETE FROM artifacts WHERE sha256 = ?", (oldest["sha256"],))
+                conn.execute("DELETE FROM artifact_pages WHERE sha256 = ?", (oldest["sha256"],))
+                total -= oldest["size_bytes"]
+            abandoned = conn.execute(
+                "SELECT sha256 FROM pending_artifacts WHERE started_at < ?", (now - self.PENDING_TIMEOUT,)
+            ).fetchall()
+            for row in abandoned:
+                conn.execute("DELETE FROM artifact_pages WHERE sha256 = ?", (row["sha256"],))
+                conn.execute("DELETE FROM pending_artifacts WHERE sha256 = ?", (row["sha256"],))
+
+    def _discard(self, sha256: str) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            pending = conn.execute("DELETE FROM pending_artifacts WHERE sha256 = ?", (sha256,)).rowcount
+            if pending:
+                conn.execute("DELETE FROM artifact_pages WHERE sha256 = ?", (sha256,))
+
+    @staticmethod
+    def compress_page(text: str) -> bytes:
+        return zlib.compress(text.encode("utf-8"), 6)
+
+    def stats(self) -> Dict[str, Any]:
+        """저장된 문서 수와 압축된 크기를 반환합니다."""
+        if not self.enabled:
+            return {"enabled": False}
+        row = self._connection().execute(
+            "SELECT COUNT(*) AS documents, COALESCE(SUM(size_bytes), 0) AS size_bytes FROM artifacts"
+        ).fetchone()
+        return {
+            "enabled": True,
+            "documents": row["documents"],
+            "size_bytes": row["size_bytes"],
+            "max_bytes": self.max_bytes
+        }
+
+
+class ArtifactWriter:
+    """
+    문서 하나의 압축된 페이지를 BATCH_BYTES씩 모아 저장소에 기록합니다.
+    추출이 끝날 때까지 문서 전체를 메모리에 들고 있지 않으며, commit 전에는 조회되지 않습니다.
+    크기 한도를 넘는 문서는 기록을 멈추고 버립니다.
+    """
+    BATCH_BYTES = 1 << 20
+
+    def __init__(self, store: ArtifactStore, sha256: str) -> None:
+        self.store = store
+        self.sha256 = sha256
+        self.pages = 0
+        self.size_bytes = 0
+        self.dropped = not store.enabled
+        self._batch: List[Tuple[int, bytes]] = []
+        self._batch_bytes = 0
+        self._started = False
+
+    def add(self, page: bytes) -> None:
+        """압축된 페이지 텍스트(compress_page) 하나를 추가합니다."""
+        number = self.pages
+        self.pages += 1
+        self.size_bytes += len(page)
+        if self.dropped:
+            return
+        if self.size_bytes > self.store.max_bytes:
+            self.discard()
+            return
+        self._batch.append((number, page))
+        self._batch_bytes += len(page)
+        if self._batch_bytes >= self.BATCH_BYTES:
+            self._write()
+
+    def _write(self) -> None:
+        if self._batch:
+            self.store._write_pages(self.sha256, self._batch, first=not self._started)
+            self._started = True
+        self._batch, self._batch_bytes = [], 0
+
+    def commit(self, metadata: Dict[str, Any]) -> bool:
+        """
+        남은 페이지와 메타데이터를 기록해 문서를 조회할 수 있게 합니다.
+
+        Returns:
+            저장 여부 (저장소가 꺼져 있거나 문서가 한도보다 크면 False)
+        """
+        if self.dropped:
+            return False
+        self._write()
+        self.store._commit(self.sha256, self.pages, self.size_bytes, metadata)
+        return True
+
+    def discard(self) -> None:
+        """기록 중인 페이지를 버립니다. (추출 실패 또는 크기 초과)"""
+        if self.dropped and not self._started:
+            return
+        self.dropped = True
+        self._batch, self._batch_bytes = [], 0
+        if self._started:
+            self.store._discard(self.sha256)
+            self._started = False
@@ -0,0 +1,162 @@
+from typing import Any, Dict, Iterator, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from urllib.parse import urlparse
+import hashlib
+import json
+import os
+import threading
+import time
+from services.pipeline import QuestionPipeline
+from utils.exceptions import QuestionGeneratorError
+from utils.logger import logger, log_error
+
+# 디렉터리에서 처리할 파일 확장자: 콘텐츠 타입
+FILE_TYPES = {".pdf": "pdf", ".txt": "text", ".md": "text"}
+YOUTUBE_HOSTS = ("youtube.com", "youtu.be")
+
+
+@dataclass
+class BulkSource:
+    """일괄 처리할 문서 하나"""
+    key: str  # 체크포인트 키 (파일은 내용 해시, URL은 URL)
+    source: str  # 파일 경로 또는 URL
+    content_type: str
+
+
+def file_key(path: str) -> str:
+    """파일 내용의 SHA-256 체크포인트 키 (이름이 바뀌어도 같은 파일은 다시 처리하지 않음)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def discover_files(directory: str) -> List[BulkSource]:
+    """디렉터리를 재귀적으로 돌며 PDF/텍스트 파일을 경로 순서대로 찾습니다."""
+    sources = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            content_type = FILE_TYPES.get(os.path.splitext(name)[1].lower())
+            if content_type:
+                path = os.path.join(root, name)
+                sources.append(BulkSource(file_key(path), path, content_type))
+    return sources
+
+
+def read_url_list(path: str) -> List[BulkSource]:
+    """한 줄에 URL 하나인 목록 파일을 읽습니다. 빈 줄과 #으로 시작하는 줄은 무시합니다."""
+    sources = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            url = line.strip()
+            if not url or url.startswith("#"):
+                continue
+            host = urlparse(url).netloc.lower()
+            content_type = "youtube" if host.endswith(YOUTUBE_HOSTS) else "website"
+            sources.append(BulkSource(f"url:{url}", url, content_type))
+    return sources
+
+
+class BulkRunner:
+    """
+    Flask 없이 여러 문서를 파이프라인으로 처리해 JSONL로 저장하는 일괄 실행기
+
+    문서가 끝날 때마다 결과 한 줄을 output에 쓰고, 성공한 문서의 키를
+    체크포인트 파일(output + ".checkpoint")에 기록합니다. 다시 실행하면
+    체크포인트에 있는 문서는 건너뛰고, 실패한 문서만 다시 처리합니다.
+    청크 단위 재개는 QuestionGenerator의 영구 캐시(CACHE_ENABLED)가 맡으므로
+    중단된 문서도 이미 요약한 청크는 API를 다시 호출하지 않습니다.
+
+    Args:
+        pipeline: 문서를 처리할 파이프라인
+        output: 결과 JSONL 경로
+        workers: 동시에 처리할 문서 수
+        reuse: 문제 은행의 기존 세트 재사용 여부
+    """
+    def __init__(
+        self,
+        pipeline: QuestionPipeline,
+        output: str,
+        workers: int = 4,
+        reuse: Optional[bool] = None
+    ) -> None:
+        self.pipeline = pipeline
+        self.output = output
+        self.checkpoint = output + ".checkpoint"
+        self.workers = workers
+        self.reuse = reuse
+        self._write_lock = threading.Lock()
+
+    def completed(self) -> Set[str]:
+        """체크포인트에 기록된 완료 문서 키 (중단으로 잘린 마지막 줄은 무시)"""
+        if not os.path.exists(self.checkpoint):
+            return set()
+        with open(self.checkpoint, encoding="utf-8") as file:
+            return {line.rstrip("\n") for line in file if line.endswith("\n")}
+
+    def _process(self, source: BulkSource) -> Dict[str, Any]:
+        started_at = time.monotonic()
+        record: Dict[str, Any] = {"key": source.key, "source": source.source, "type": source.content_type}
+        try:
+            content, file = source.source, None
+            if source.content_type == "pdf":
+                content, file = None, source.source
+            elif source.content_type == "text":
+                with open(source.source, encoding="utf-8", errors="replace") as text_file:
+                    content = text_file.read()
+            result = self.pipeline.run(source.content_type, content, file, reuse=self.reuse)
+            record.update(status="succeeded", result=result)
+        except QuestionGeneratorError as e:
+            log_error(e, {"source": source.source})
+            record.update(status="failed", error=e.message, error_code=e.error_code)
+        except Exception as e:
+            log_error(e, {"source": source.source})
+            record.update(status="failed", error=str(e), error_code="INTERNAL_SERVER_ERROR")
+        record["duration"] = round(time.monotonic() - started_at, 3)
+        return record
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """결과 줄을 쓰고 디스크에 반영한 뒤에 체크포인트를 기록합니다."""
+        with self._write_lock:
+            with open(self.output, "a", encoding="utf-8") as file:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+            if record["status"] == "succeeded":
+                with open(self.checkpoint, "a", encoding="utf-8") as file:
+                    file.write(record["key"] + "\n")
+                    file.flush()
+                    os.fsync(file.fileno())
+
+    def run(self, sources: List[BulkSource]) -> Iterator[Dict[str, Any]]:
+        """
+        완료되지 않은 문서를 병렬로 처리하고, 끝나는 순서대로 결과를 기록하며 반환합니다.
+        """
+        done = self.completed()
+        pending: List[BulkSource] = []
+        seen: Set[str] = set()
+        for source in sources:
+            if source.key not in done and source.key not in seen:
+                seen.add(source.key)
+                pending.append(source)
+        logger.info("bulk_started", total=len(sources), pending=len(pending), workers=self.workers)
+
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bulk")
+        try:
+            futures = [executor.submit(self._process, source) for source in pending]
+            for future in as_completed(futures):
+                record = future.result()
+                self._write(record)
+                logger.info(
+                    "bulk_document_finished",
+                    source=record["source"],
+                    status=record["status"],
+                    duration=record["duration"]
+                )
+                yield record
+        finally:
+            # 중단(Ctrl+C) 시 시작하지 않은 문서는 취소하고 다음 실행에서 이어서 처리
+            executor.shutdown(wait=True, cancel_futures=True)
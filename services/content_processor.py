@@ -1,63 +1,216 @@
 import PyPDF2
-from bs4 import BeautifulSoup
-import requests
-from pytube import YouTube
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.formatters import TextFormatter
 import io
+import os
 import re
+import threading
 from PIL import Image
 # import pytesseract  # OCR 기능 임시 비활성화
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 from config import get_config
+from utils.cache import PersistentCache
+from services.artifact_store import ArtifactStore, upload_key
+from services.html_extractor import HtmlExtractor, decode_html
+from services.http_fetcher import HttpFetcher
+from services.pdf_extractor import PdfExtractor
+from services.youtube_fetcher import QuotaLedger, YouTubeFetcher
+from utils.exceptions import ContentProcessingError
+
+YOUTUBE_DISCOVERY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "vendor", "googleapis", "youtube.v3.json"
+)
 
 class ContentProcessor:
     def __init__(self):
         self.config = get_config()
-        if self.config.YOUTUBE.API_KEY:
-            self.youtube = build('youtube', 'v3', developerKey=self.config.YOUTUBE.API_KEY)
-        else:
-            self.youtube = None
+        self.pdf_extractor = PdfExtractor(
+            min_parallel_pages=self.config.PDF.PARALLEL_MIN_PAGES,
+            workers=self.config.PDF.WORKERS,
+            pages_per_task=self.config.PDF.PAGES_PER_TASK
+        )
+        self.artifacts = ArtifactStore(
+            self.config.ARTIFACT.PATH,
+            max_bytes=self.config.ARTIFACT.MAX_BYTES,
+            enabled=self.config.ARTIFACT.ENABLED
+        )
+        http = self.config.HTTP
+        self.fetcher = HttpFetcher(
+            cache=PersistentCache(
+                self.config.CACHE.PATH,
+                namespace="http_response",
+                max_entries=self.config.CACHE.MAX_ENTRIES,
+                ttl_seconds=self.config.CACHE.TTL_SECONDS,
+                enabled=self.config.CACHE.ENABLED
+            ) if http.CACHE_ENABLED else None,
+            connect_timeout=http.CONNECT_TIMEOUT,
+            read_timeout=http.READ_TIMEOUT,
+            total_timeout=http.TOTAL_TIMEOUT,
+            max_bytes=http.MAX_BYTES,
+            pool_size=http.POOL_SIZE,
+            user_agent=http.USER_AGENT
+        )
+        self.html_extractor = HtmlExtractor()
+        # YouTube Data API 클라이언트는 처음 쓸 때 만듦 (워커 부팅 시간 단축)
+        self._youtube = None
+        self._youtube_lock = threading.Lock()
+        youtube = self.config.YOUTUBE
+        self.youtube_fetcher = YouTubeFetcher(
+            lambda: self.youtube,
+            metadata_cache=PersistentCache(
+                self.config.CACHE.PATH,
+                namespace="youtube_metadata",
+                max_entries=self.config.CACHE.MAX_ENTRIES,
+                ttl_seconds=youtube.METADATA_TTL_SECONDS,
+                enabled=self.config.CACHE.ENABLED
+            ),
+            transcript_cache=PersistentCache(
+                self.config.CACHE.PATH,
+                namespace="youtube_transcript",
+                max_entries=self.config.CACHE.MAX_ENTRIES,
+                ttl_seconds=youtube.TRANSCRIPT_TTL_SECONDS,
+                enabled=self.config.CACHE.ENABLED
+            ),
+            ledger=QuotaLedger(youtube.QUOTA_PATH, youtube.DAILY_QUOTA, youtube.QUOTA_RESERVE),
+            workers=youtube.WORKERS,
+            timeout=youtube.TIMEOUT
+        )
+
+    @property
+    def youtube(self):
+        """
+        YouTube Data API 클라이언트 (API 키가 없으면 None)
+        저장소에 포함된 discovery 문서(vendor/googleapis)로 만들므로 네트워크를 쓰지 않습니다.
+        """
+        if self._youtube is None and self.config.YOUTUBE.API_KEY:
+            with self._youtube_lock:
+                if self._youtube is None:
+                    from googleapiclient.discovery import build_from_document
+                    with open(YOUTUBE_DISCOVERY_PATH, encoding="utf-8") as file:
+                        self._youtube = build_from_document(file.read(), developerKey=self.config.YOUTUBE.API_KEY)
+        return self._youtube
+
+    def warm_up(self):
+        """YouTube 클라이언트를 미리 만듭니다. (gunicorn preload 시 워커들이 공유)"""
+        return self.youtube
 
     @staticmethod
     def process_text(text):
         return text.strip()
 
-    @staticmethod
-    def process_pdf(pdf_file):
+    def process_pdf(self, pdf_file):
         """PDF 파일을 처리합니다."""
+        text, _ = self.process_pdf_with_metadata(pdf_file)
+        return text
+
+    def process_pdf_with_metadata(self, pdf_file):
+        """
+        PDF 파일을 처리하고 (텍스트, 페이지 정보)를 반환합니다.
+        큰 PDF는 페이지 범위별로 나눠 프로세스 풀에서 추출합니다. (PdfExtractor)
+        """
+        metadata = {"pages": 0, "empty_pages": 0}
+        try:
+            text = list(self.iter_pdf_pages(pdf_file, metadata))
+            return "\n\n".join(text), metadata  # 페이지 간 구분을 위해 개행 추가
+        except ContentProcessingError as e:
+            return e.message, metadata
+
+    def process_pdf_pages(self, pdf_file, key=None):
+        """
+        PDF 파일을 처리하고 (비어 있지 않은 페이지별 텍스트 목록, 페이지 정보)를 반환합니다.
+        key는 pdf_key로 미리 구한 저장소 키입니다. (없으면 여기서 계산)
+
+        Raises:
+            ContentProcessingError: 파일을 열 수 없거나 텍스트가 없는 경우
+        """
+        metadata = {"pages": 0, "empty_pages": 0}
+        return list(self.iter_pdf_pages(pdf_file, metadata, key)), metadata
+
+    def pdf_key(self, pdf_file):
+        """
+        추출 결과 저장소에서 쓰는 업로드 파일 키(원본 바이트의 SHA-256)를 반환합니다.
+        저장소가 꺼져 있거나 파일을 읽을 수 없으면 None을 반환합니다.
+        """
+        if not self.artifacts.enabled or not pdf_file:
+            return None
+        try:
+            return upload_key(pdf_file)
+        except OSError:
+            return None
+
+    def has_extracted_pdf(self, key):
+        """pdf_key로 구한 키의 추출 결과가 저장소에 있는지 확인합니다."""
+        return key is not None and self.artifacts.contains(key)
+
+    def _iter_extracted_pages(self, pdf_file, metadata, key=None):
+        """
+        PDF의 페이지 텍스트(빈 페이지 포함)를 순서대로 내보냅니다.
+        같은 업로드 파일(원본 바이트의 SHA-256)을 이미 추출했다면 파싱 없이 추출 결과 저장소에서 읽고,
+        처음 보는 파일은 추출되는 대로 페이지를 기록하고 끝까지 마치면 commit합니다.
+        """
+        if not self.artifacts.enabled:
+            yield from self.pdf_extractor.iter_pages(pdf_file, metadata)
+            return
+
+        key = key or upload_key(pdf_file)
+        stored = self.artifacts.get(key)
+        if stored is not None:
+            served = 0
+            for page_text in self.artifacts.iter_pages(key):
+                served += 1
+                yield page_text
+            # 조회 직후 다른 프로세스가 지운 경우가 아니면 저장된 결과로 끝
+            if served or not stored.get("pages"):
+                metadata.update(stored, sha256=key, cached=True)
+                return
+
+        extracted = {}
+        empty_pages = 0
+        writer = self.artifacts.writer(key)
+        try:
+            for page_text in self.pdf_extractor.iter_pages(pdf_file, extracted):
+                writer.add(ArtifactStore.compress_page(page_text))
+                if not page_text.strip():
+                    empty_pages += 1
+                yield page_text
+        except BaseException:
+            # 추출 실패나 소비 중단(GeneratorExit) 시 기록하던 페이지를 버림
+            writer.discard()
+            raise
+        extracted["empty_pages"] = empty_pages
+        writer.commit(extracted)
+        metadata.update(extracted, sha256=key, cached=False)
+
+    def iter_pdf_pages(self, pdf_file, metadata, key=None):
+        """
+        비어 있지 않은 페이지 텍스트를 추출되는 대로 하나씩 내보냅니다. (스트리밍 요약용)
+        다 읽으면 metadata에 페이지 정보를 채웁니다. key는 pdf_key로 미리 구한 저장소 키입니다.
+
+        Raises:
+            ContentProcessingError: 파일을 열 수 없거나 텍스트가 없는 경우
+        """
+        metadata.setdefault("empty_pages", 0)
+        found = False
         try:
             if not pdf_file:
                 raise ValueError("PDF 파일이 제공되지 않았습니다.")
 
-            # 파일 객체로 처리
-            if hasattr(pdf_file, 'read'):
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-            else:
-                # 파일 경로로 처리
-                with open(pdf_file, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-            
-            text = []
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text.strip():  # 빈 페이지가 아닌 경우만 추가
-                    text.append(page_text.strip())
-            
-            if not text:
-                return "PDF에서 텍스트를 추출할 수 없습니다."
-            
-            return "\n\n".join(text)  # 페이지 간 구분을 위해 개행 추가
-            
+            # 파일 객체 또는 파일 경로
+            for page_text in self._iter_extracted_pages(pdf_file, metadata, key):
+                if page_text.strip():  # 빈 페이지가 아닌 경우만 내보냄
+                    found = True
+                    yield page_text.strip()
+                else:
+                    metadata["empty_pages"] += 1
+
         except FileNotFoundError:
-            return "PDF 파일을 찾을 수 없습니다."
+            raise ContentProcessingError("PDF 파일을 찾을 수 없습니다.")
         except PermissionError:
-            return "PDF 파일에 접근할 수 없습니다."
-        except PyPDF2.PdfReadError:
-            return "올바르지 않은 PDF 파일입니다."
+            raise ContentProcessingError("PDF 파일에 접근할 수 없습니다.")
+        except PyPDF2.errors.PdfReadError:
+            raise ContentProcessingError("올바르지 않은 PDF 파일입니다.")
         except Exception as e:
-            return f"PDF 처리 중 오류가 발생했습니다: {str(e)}"
+            raise ContentProcessingError(f"PDF 처리 중 오류가 발생했습니다: {str(e)}")
+
+        if not found:
+            raise ContentProcessingError("PDF에서 텍스트를 추출할 수 없습니다.")
 
     @staticmethod
     def process_image(image_file):
@@ -93,112 +246,48 @@ class ContentProcessor:
             if not video_id:
                 return "유튜브 동영상 ID를 추출할 수 없습니다."
 
-            if not self.youtube:
+            if not self.config.YOUTUBE.API_KEY:
                 return "YouTube API 키가 설정되지 않았습니다. 관리자에게 문의하세요."
 
             try:
-                # YouTube Data API를 사용하여 동영상 정보 가져오기
-                video_response = self.youtube.videos().list(
-                    part='snippet',
-                    id=video_id
-                ).execute()
-
-                if not video_response['items']:
-                    return "동영상을 찾을 수 없습니다."
-
-                video_data = video_response['items'][0]['snippet']
-                title = video_data.get('title', '제목 없음')
-                description = video_data.get('description', '설명 없음')
-
-            except HttpError as e:
-                if e.resp.status == 403:
-                    return "YouTube API 키가 유효하지 않거나 할당량이 초과되었습니다."
-                elif e.resp.status == 404:
-                    return "동영상을 찾을 수 없습니다."
-                else:
-                    print(f"YouTube API 오류: {str(e)}")
-                    return "동영상 정보를 가져오는 중 오류가 발생했습니다."
+                # 동영상 정보(Data API)와 자막을 동시에 가져옴 (video_id별 캐시)
+                metadata, transcript = self.youtube_fetcher.fetch(video_id)
+            except ContentProcessingError as e:
+                return e.message
 
-            try:
-                # 자막 가져오기
-                transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-                
-                # 한국어 자막 우선, 없으면 영어 자막 시도
-                transcript = None
-                try:
-                    transcript = transcript_list.find_transcript(['ko'])
-                except:
-                    try:
-                        transcript = transcript_list.find_transcript(['en'])
-                    except:
-                        try:
-                            # 자동 생성된 자막 시도
-                            transcript = transcript_list.find_manually_created_transcript()
-                        except:
-                            try:
-                                transcript = transcript_list.find_generated_transcript()
-                            except:
-                                pass
-
-                if transcript:
-                    # 자막을 텍스트로 변환
-                    formatter = TextFormatter()
-                    transcript_text = formatter.format_transcript(transcript.fetch())
-                    
-                    return f"""
+            title, description = metadata['title'], metadata['description']
+            if transcript['status'] == 'ok':
+                return f"""
 제목: {title}
 설명: {description}
 
 내용:
-{transcript_text.strip()}
-                    """
-                else:
-                    return f"""
-제목: {title}
-설명: {description}
-※ 자막을 찾을 수 없습니다.
+{transcript['text']}
                     """
-
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "transcript are disabled" in error_msg:
-                    return f"""
+            notes = {
+                'not_found': "※ 자막을 찾을 수 없습니다.",
+                'disabled': "※ 이 동영상은 자막이 비활성화되어 있습니다.",
+                'none': "※ 이 동영상에는 자막이 없습니다."
+            }
+            return f"""
 제목: {title}
 설명: {description}
-※ 이 동영상은 자막이 비활성화되어 있습니다.
-                    """
-                elif "no transcript" in error_msg:
-                    return f"""
-제목: {title}
-설명: {description}
-※ 이 동영상에는 자막이 없습니다.
-                    """
-                else:
-                    print(f"자막 처리 중 오류: {str(e)}")
-                    return f"""
-제목: {title}
-설명: {description}
-※ 자막을 가져오는 중 오류가 발생했습니다.
+{notes.get(transcript['status'], "※ 자막을 가져오는 중 오류가 발생했습니다.")}
                     """
 
         except Exception as e:
             print(f"전체 처리 중 오류: {str(e)}")
             return "유튜브 동영상 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
 
-    @staticmethod
-    def process_website(url):
+    def process_website(self, url):
         try:
-            response = requests.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            # 메타 태그와 주요 콘텐츠 추출
-            text = ""
-            if soup.title:
-                text += f"제목: {soup.title.string}\n\n"
-            
-            # 주요 콘텐츠 영역에서 텍스트 추출
-            for tag in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                text += f"{tag.get_text()}\n"
-            
-            return text.strip()
+            page = self.fetcher.fetch(url)
+            content = self.html_extractor.extract(decode_html(page.content, page.encoding))
+            # 제목과 본문 블록을 한 번에 연결
+            parts = [f"제목: {content.title}\n"] if content.title else []
+            parts.extend(content.blocks)
+            return "\n".join(parts).strip()
+        except ContentProcessingError as e:
+            return f"웹사이트 처리 중 오류가 발생했습니다: {e.message}"
         except Exception as e:
             return f"웹사이트 처리 중 오류가 발생했습니다: {str(e)}" 
\ No newline at end of file
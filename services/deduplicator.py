@@ -0,0 +1,157 @@
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+import re
+import zlib
+from collections import Counter
+from itertools import chain, islice
+import numpy as np
+
+DIGITS = re.compile(r'\d+')
+# 쪽 번호만 있는 줄 ("- 12 -", "Page 3 of 10", "3/10")
+PAGE_NUMBER = re.compile(r'^\W*(?:page\s*)?\d+(?:\s*(?:/|of)\s*\d+)?\W*$', re.IGNORECASE)
+MERSENNE_PRIME = (1 << 61) - 1
+
+
+class Deduplicator:
+    """
+    요약 전에 반복되는 머리글/바닥글과 거의 같은 청크를 제거하는 중복 제거기
+
+    - 줄 단위: PDF 페이지 중 min_page_ratio 이상에 나오는 짧은 줄
+      ("- 12 -", "Page 3" 같은 쪽 번호 포함)을 모두 지웁니다. 페이지가 없는 콘텐츠에는 쓰지 않습니다.
+    - 청크 단위: 어절 3-gram MinHash 서명으로 앞선 청크와의 자카드 유사도를
+      추정해 similarity 이상이면 버립니다.
+
+    Args:
+        min_page_ratio: 반복 줄로 판단할 페이지 비율
+        similarity: 중복 청크로 판단할 자카드 유사도
+        max_line_length: 머리글/바닥글로 볼 수 있는 최대 줄 길이
+    """
+    def __init__(
+        self,
+        min_page_ratio: float = 0.3,
+        similarity: float = 0.85,
+        max_line_length: int = 100,
+        num_perm: int = 64
+    ) -> None:
+        self.min_page_ratio = min_page_ratio
+        self.similarity = similarity
+        self.max_line_length = max_line_length
+        # 32비트 해시와 32비트 계수를 쓰면 a * x + b가 uint64를 넘지 않음
+        rng = np.random.default_rng(1)
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    @staticmethod
+    def _line_key(line: str) -> str:
+        """줄 비교 키. 쪽 번호만 있는 줄은 숫자를 정규화합니다. ("Step 1" 같은 번호 붙은 제목은 그대로)"""
+        line = " ".join(line.split())
+        if PAGE_NUMBER.match(line):
+            return DIGITS.sub("0", line)
+        return line
+
+    def _repeated_keys(self, pages: List[str]) -> Set[str]:
+        """pages 중 min_page_ratio 이상(최소 3쪽)에 나오는 짧은 줄의 키"""
+        if len(pages) < 3:
+            return set()
+        page_counts = Counter(
+            key
+            for page in pages
+            for key in {self._line_key(line) for line in page.splitlines() if line.strip()}
+            if len(key) <= self.max_line_length
+        )
+        threshold = max(3, self.min_page_ratio * len(pages))
+        return {key for key, count in page_counts.items() if count >= threshold}
+
+    def _strip_page(self, page: str, repeated: Set[str], stats: Dict[str, int]) -> str:
+        kept = []
+        for line in page.splitlines():
+            if line.strip() and self._line_key(line) in repeated:
+                stats["removed_lines"] += 1
+                stats["removed_characters"] += len(line)
+                continue
+            kept.append(line)
+        return "\n".join(kept).strip()
+
+    def strip_repeated_lines(self, pages: List[str]) -> Tuple[str, Dict[str, int]]:
+        """
+        여러 페이지에 반복되는 줄을 지우고 페이지를 빈 줄로 이어 붙입니다.
+
+        Args:
+            pages: PDF 페이지별 텍스트
+
+        Returns:
+            (정리된 텍스트, {"removed_lines", "removed_characters"})
+        """
+        stats = {"removed_lines": 0, "removed_characters": 0}
+        repeated = self._repeated_keys(pages)
+        if not repeated:
+            return "\n\n".join(pages), stats
+
+        cleaned_pages = [cleaned for cleaned in (self._strip_page(page, repeated, stats) for page in pages) if cleaned]
+        return "\n\n".join(cleaned_pages), stats
+
+    def iter_strip_repeated_lines(
+        self,
+        pages: Iterable[str],
+        stats: Dict[str, int],
+        warmup_pages: int = 8
+    ) -> Iterator[str]:
+        """
+        페이지 스트림에서 반복되는 줄을 지웁니다.
+
+        처음 warmup_pages쪽으로 머리글/바닥글을 찾은 뒤에는 페이지를 모으지 않고 바로 내보내므로
+        문서 전체를 메모리에 올리지 않습니다. stats에 지운 줄/문자 수를 누적합니다.
+        """
+        stats.setdefault("removed_lines", 0)
+        stats.setdefault("removed_characters", 0)
+        pages = iter(pages)
+        head = list(islice(pages, warmup_pages))
+        repeated = self._repeated_keys(head)
+        for page in chain(head, pages):
+            cleaned = self._strip_page(page, repeated, stats) if repeated else page
+            if cleaned:
+                yield cleaned
+
+    def signature(self, text: str) -> np.ndarray:
+        """어절 3-gram 집합의 MinHash 서명을 계산합니다."""
+        words = text.split()
+        shingles = {" ".join(words[i:i + 3]) for i in range(max(1, len(words) - 2))}
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        permuted = (np.multiply.outer(self._a, hashes) + self._b[:, None]) % np.uint64(MERSENNE_PRIME)
+        return permuted.min(axis=1)
+
+    def iter_unique_chunks(self, chunks: Iterable[str], stats: Dict[str, int]) -> Iterator[str]:
+        """
+        앞선 청크와 거의 같은 청크를 버리며 나머지를 순서대로 내보냅니다.
+        stats에 버린 청크/문자 수를 누적합니다.
+        """
+        stats.setdefault("removed_chunks", 0)
+        stats.setdefault("removed_characters", 0)
+        signatures = np.empty((0, len(self._a)), dtype=np.uint64)
+        kept = 0
+        for chunk in chunks:
+            signature = self.signature(chunk)
+            if kept and float((signatures[:kept] == signature).mean(axis=1).max()) >= self.similarity:
+                stats["removed_chunks"] += 1
+                stats["removed_characters"] += len(chunk)
+                continue
+            if kept == len(signatures):
+                # 서명 배열을 두 배씩 늘림
+                signatures = np.resize(signatures, (max(16, kept * 2), len(self._a)))
+            signatures[kept] = signature
+            kept += 1
+            yield chunk
+
+    def drop_duplicate_chunks(self, chunks: List[str]) -> Tuple[List[str], Dict[str, int]]:
+        """
+        앞선 청크와 거의 같은 청크를 버립니다. 순서는 유지됩니다.
+
+        Returns:
+            (남은 청크, {"removed_chunks", "removed_characters"})
+        """
+        stats: Dict[str, int] = {}
+        kept = list(self.iter_unique_chunks(chunks, stats))
+        return kept, stats
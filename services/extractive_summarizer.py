@@ -0,0 +1,160 @@
+from typing import Dict, List, Tuple
+import math
+import re
+from collections import Counter
+import numpy as np
+from services.text_chunker import TextChunker
+
+# 문장 경계: 문장부호 뒤 공백 또는 줄바꿈
+SENTENCE_PATTERN = re.compile(r'[^\n.!?。？！]+(?:[.!?。？！]+["\')\]]*|\n|$)')
+TERM_PATTERN = re.compile(r'[가-힣]+|[A-Za-z][A-Za-z\'-]*|\d+')
+
+ENGLISH_STOPWORDS = frozenset("""
+a an and are as at be but by for from has have he her his i in is it its of on or our she
+that the their them there these they this to was we were which who will with you your
+""".split())
+
+
+class ExtractiveSummarizer:
+    """
+    네트워크 없이 중요한 문장만 골라 긴 텍스트를 줄이는 추출 요약기
+
+    문서 전체의 IDF로 가중한 TF-IDF 문장 벡터를 만들고, 문장 블록마다
+    코사인 유사도 그래프에서 TextRank 점수를 계산해 상위 문장을 원래 순서대로 남깁니다.
+    블록 단위로 예산을 나누므로 문서 뒷부분의 주제도 빠지지 않습니다.
+
+    한국어는 조사/어미가 붙은 어절을 그대로 비교하면 일치하지 않으므로
+    한글 어절은 글자 바이그램으로, 영어는 소문자 단어로 색인합니다.
+
+    Args:
+        ratio: 남길 토큰 비율 (0~1)
+        block_sentences: TextRank를 계산할 문장 블록 크기
+        redundancy: 이미 고른 문장과의 코사인 유사도가 이 값을 넘으면 제외
+    """
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        block_sentences: int = 256,
+        redundancy: float = 0.7,
+        iterations: int = 30,
+        damping: float = 0.85
+    ) -> None:
+        self.ratio = ratio
+        self.block_sentences = block_sentences
+        self.redundancy = redundancy
+        self.iterations = iterations
+        self.damping = damping
+
+    @staticmethod
+    def split_sentences(text: str) -> List[str]:
+        sentences = (match.group().strip() for match in SENTENCE_PATTERN.finditer(text))
+        return [sentence for sentence in sentences if sentence]
+
+    @staticmethod
+    def terms(sentence: str) -> List[str]:
+        """문장을 색인어 목록으로 바꿉니다."""
+        terms = []
+        for word in TERM_PATTERN.findall(sentence):
+            if '가' <= word[0] <= '힣':
+                if len(word) == 1:
+                    terms.append(word)
+                else:
+                    terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+            else:
+                word = word.lower()
+                if len(word) > 1 and word not in ENGLISH_STOPWORDS:
+                    terms.append(word)
+        return terms
+
+    def _textrank(self, vectors: np.ndarray) -> np.ndarray:
+        """행 정규화된 TF-IDF 행렬로 TextRank 점수를 계산합니다."""
+        count = vectors.shape[0]
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, 0.0)
+        row_sums = similarity.sum(axis=1, keepdims=True)
+        # 다른 문장과 겹치는 단어가 없는 문장은 모든 문장으로 균등하게 이동
+        transition = np.divide(
+            similarity,
+            row_sums,
+            out=np.full_like(similarity, 1.0 / count),
+            where=row_sums > 0
+        )
+        scores = np.full(count, 1.0 / count, dtype=np.float32)
+        for _ in range(self.iterations):
+            scores = (1 - self.damping) / count + self.damping * (transition.T @ scores)
+        return scores
+
+    def _block_vectors(self, block: List[List[str]], idf: Dict[str, float]) -> np.ndarray:
+        vocabulary: Dict[str, int] = {}
+        rows, cols, values = [], [], []
+        for row, terms in enumerate(block):
+            for term, count in Counter(terms).items():
+                col = vocabulary.setdefault(term, len(vocabulary))
+                rows.append(row)
+                cols.append(col)
+                values.append((1 + math.log(count)) * idf[term])
+        vectors = np.zeros((len(block), max(1, len(vocabulary))), dtype=np.float32)
+        vectors[rows, cols] = values
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    def select(self, sentences: List[str], budget: int) -> List[int]:
+        """
+        토큰 예산 안에서 점수가 높은 문장의 인덱스를 원래 순서대로 반환합니다.
+        """
+        terms = [self.terms(sentence) for sentence in sentences]
+        document_frequency = Counter(term for sentence_terms in terms for term in set(sentence_terms))
+        total = len(sentences)
+        idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()}
+        lengths = np.array([TextChunker.estimate_tokens(sentence) for sentence in sentences])
+        total_tokens = int(lengths.sum())
+
+        selected: List[int] = []
+        for start in range(0, total, self.block_sentences):
+            end = min(total, start + self.block_sentences)
+            # 블록 크기에 비례해 예산을 나눔
+            block_budget = budget * int(lengths[start:end].sum()) / max(1, total_tokens)
+            vectors = self._block_vectors(terms[start:end], idf)
+            scores = self._textrank(vectors)
+            used = 0
+            chosen: List[int] = []
+            for index in np.argsort(-scores, kind="stable"):
+                length = int(lengths[start + index])
+                if used + length > block_budget and used > 0:
+                    continue
+                # 이미 고른 문장과 거의 같은 문장은 건너뛰어 다양한 주제를 남김
+                if chosen and float((vectors[chosen] @ vectors[index]).max()) > self.redundancy:
+                    continue
+                chosen.append(int(index))
+                selected.append(start + int(index))
+                used += length
+                if used >= block_budget:
+                    break
+        return sorted(selected)
+
+    def condense(self, text: str, target_tokens: int = 0) -> Tuple[str, Dict[str, int]]:
+        """
+        텍스트를 목표 토큰 수(지정하지 않으면 ratio 비율) 이하로 줄입니다.
+
+        Returns:
+            (줄인 텍스트, {"sentences", "kept_sentences", "original_tokens", "condensed_tokens"})
+        """
+        sentences = self.split_sentences(text)
+        original_tokens = TextChunker.estimate_tokens(text)
+        budget = target_tokens or max(1, int(original_tokens * self.ratio))
+        if len(sentences) < 2 or original_tokens <= budget:
+            return text, {
+                "sentences": len(sentences),
+                "kept_sentences": len(sentences),
+                "original_tokens": original_tokens,
+                "condensed_tokens": original_tokens
+            }
+
+        kept = [sentences[index] for index in self.select(sentences, budget)]
+        condensed = "\n".join(kept)
+        return condensed, {
+            "sentences": len(sentences),
+            "kept_sentences": len(kept),
+            "original_tokens": original_tokens,
+            "condensed_tokens": TextChunker.estimate_tokens(condensed)
+        }
@@ -0,0 +1,267 @@
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+import re
+
+try:
+    from lxml import etree
+except ImportError:  # lxml이 없으면 표준 라이브러리 파서 사용
+    etree = None
+
+# 본문이 아닌 요소: 하위 텍스트를 모두 버림
+SKIP_TAGS = frozenset({
+    "script", "style", "noscript", "template", "svg", "canvas", "iframe",
+    "nav", "footer", "aside", "form", "button", "select", "textarea"
+})
+# 텍스트 블록을 끊는 요소
+BLOCK_TAGS = frozenset({
+    "p", "div", "section", "article", "main", "header", "li", "ul", "ol", "dl", "dt", "dd",
+    "table", "tr", "td", "th", "pre", "blockquote", "figure", "figcaption", "body",
+    "h1", "h2", "h3", "h4", "h5", "h6"
+})
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"
+})
+# 본문 후보 요소와 기본 가중치 (readability)
+CONTAINER_WEIGHTS = {"body": 0, "main": 10, "article": 10, "section": 3, "div": 5, "td": 3, "blockquote": 3}
+
+BOILERPLATE_PATTERN = re.compile(
+    r"cookie|consent|banner|gdpr|popup|modal|newsletter|subscribe|share|social|sns|"
+    r"nav|menu|breadcrumb|footer|sidebar|widget|related|recommend|comment|advert|\bads?\b|promo|sponsor",
+    re.IGNORECASE
+)
+POSITIVE_PATTERN = re.compile(r"article|content|main|post|entry|body|text|story|blog|news", re.IGNORECASE)
+META_CHARSET_PATTERN = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def decode_html(content: bytes, encoding: Optional[str] = None) -> str:
+    """응답 헤더의 charset, 없으면 문서 앞부분의 <meta charset>, 그것도 없으면 UTF-8로 디코딩합니다."""
+    if not encoding:
+        match = META_CHARSET_PATTERN.search(content[:4096])
+        encoding = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        return content.decode(encoding, errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+@dataclass
+class _Container:
+    tag: str
+    parent: Optional[int]
+    weight: float
+    score: float = 0.0
+    chars: int = 0
+    link_chars: int = 0
+
+
+@dataclass
+class _Block:
+    text: str
+    container: int
+    heading: bool
+    link_density: float
+
+
+@dataclass
+class HtmlContent:
+    """HTML에서 추출한 제목과 본문 블록"""
+    title: str
+    blocks: List[str] = field(default_factory=list)
+
+
+class _BlockCollector:
+    """
+    태그 트리를 만들지 않고 한 번 훑으면서 텍스트 블록과 본문 후보 요소를 모읍니다.
+    lxml 파서의 target 인터페이스(start/end/data/close)를 따릅니다.
+    """
+    def __init__(self) -> None:
+        self.title: List[str] = []
+        self.blocks: List[_Block] = []
+        self.containers: List[_Container] = []
+        # (태그, 이 요소가 만든 후보 번호)
+        self._stack: List[Tuple[str, Optional[int]]] = []
+        self._skip_depth: Optional[int] = None
+        self._in_title = False
+        self._link_depth = 0
+        self._parts: List[str] = []
+        self._link_chars = 0
+        self._heading = False
+
+    def _current_container(self) -> int:
+        for _, index in reversed(self._stack):
+            if index is not None:
+                return index
+        if not self.containers:
+            self.containers.append(_Container("body", None, 0))
+        return 0
+
+    def _flush(self) -> None:
+        if not self._parts:
+            return
+        text = WHITESPACE_PATTERN.sub(" ", "".join(self._parts)).strip()
+        link_chars, heading = self._link_chars, self._heading
+        self._parts, self._link_chars, self._heading = [], 0, False
+        if not text:
+            return
+        container = self._current_container()
+        self.blocks.append(_Block(text, container, heading, min(1.0, link_chars / len(text))))
+        index: Optional[int] = container
+        while index is not None:
+            self.containers[index].chars += len(text)
+            self.containers[index].link_chars += link_chars
+            index = self.containers[index].parent
+
+    def start(self, tag: str, attrs: Dict[str, Optional[str]]) -> None:
+        if tag in VOID_TAGS:
+            if tag == "br" and self._skip_depth is None:
+                self._parts.append(" ")
+            return
+        if tag == "title":
+            self._in_title = True
+        if tag in BLOCK_TAGS:
+            self._flush()
+
+        container: Optional[int] = None
+        if self._skip_depth is None:
+            names = " ".join(filter(None, (attrs.get("id"), attrs.get("class"))))
+            if (
+                tag in SKIP_TAGS
+                or (tag == "header" and not any(name in ("article", "main") for name, _ in self._stack))
+                or (names and tag not in ("body", "main", "article") and BOILERPLATE_PATTERN.search(names)
+                    and not POSITIVE_PATTERN.search(names))
+                or "hidden" in attrs or attrs.get("aria-hidden") == "true"
+            ):
+                self._skip_depth = len(self._stack)
+            elif tag in CONTAINER_WEIGHTS:
+                weight = CONTAINER_WEIGHTS[tag] + (25 if names and POSITIVE_PATTERN.search(names) else 0)
+                parent = self._current_container() if tag != "body" or self.containers else None
+                self.containers.append(_Container(tag, parent, weight))
+                container = len(self.containers) - 1
+        if tag in HEADING_TAGS:
+            self._heading = True
+        if tag == "a":
+            self._link_depth += 1
+        self._stack.append((tag, container))
+
+    def end(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        if tag == "a" and self._link_depth:
+            self._link_depth -= 1
+        # 닫히지 않은 요소가 있어도 가장 가까운 같은 태그까지 닫음
+        for position in range(len(self._stack) - 1, -1, -1):
+            if self._stack[position][0] == tag:
+                if tag in BLOCK_TAGS:
+                    self._flush()
+                del self._stack[position:]
+                if self._skip_depth is not None and len(self._stack) <= self._skip_depth:
+                    self._skip_depth = None
+                return
+
+    def data(self, data: str) -> None:
+        if self._in_title:
+            self.title.append(data)
+        elif self._skip_depth is None and self._stack:
+            self._parts.append(data)
+            if self._link_depth:
+                self._link_chars += len(data.strip())
+
+    def close(self) -> None:
+        self._flush()
+
+
+class _StdlibParser(HTMLParser):
+    """lxml이 없을 때 쓰는 표준 라이브러리 스트리밍 파서 (이벤트를 _BlockCollector로 전달)"""
+    def __init__(self, target: _BlockCollector) -> None:
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self.target.start(tag, dict(attrs))
+
+    def handle_endtag(self, tag: str) -> None:
+        self.target.end(tag)
+
+    def handle_data(self, data: str) -> None:
+        self.target.data(data)
+
+    def close(self) -> None:
+        super().close()
+        self.target.close()
+
+
+class HtmlExtractor:
+    """
+    웹 페이지 본문 추출기
+
+    lxml(C 구현)이 있으면 그 파서로, 없으면 표준 라이브러리 HTMLParser로 문서를 한 번만 훑으며
+    텍스트 블록을 모읍니다. (BeautifulSoup처럼 태그 트리를 만들지 않음) 스크립트, 메뉴, 푸터, 쿠키 배너 등
+    본문이 아닌 요소는 건너뛰고, readability 방식으로 문단 길이/쉼표 수/링크 비율을 점수로
+    매겨 가장 점수가 높은 본문 후보와 점수가 비슷한 형제 요소의 블록만 남깁니다.
+
+    Args:
+        min_block_chars: 본문 점수에 반영할 블록의 최소 글자 수
+        max_link_density: 링크 텍스트 비율이 이 값을 넘는 블록은 버림
+        use_lxml: lxml이 설치되어 있으면 사용
+    """
+    def __init__(self, min_block_chars: int = 25, max_link_density: float = 0.5, use_lxml: bool = True) -> None:
+        self.min_block_chars = min_block_chars
+        self.max_link_density = max_link_density
+        self.use_lxml = use_lxml and etree is not None
+
+    def _select(self, parser: _BlockCollector) -> Optional[set]:
+        """본문으로 쓸 후보 요소 번호들을 고릅니다. 점수를 받은 후보가 없으면 None"""
+        containers = parser.containers
+        for block in parser.blocks:
+            if block.heading or len(block.text) < self.min_block_chars:
+                continue
+            score = (1 + block.text.count(",") + min(len(block.text) // 100, 3)) * (1 - block.link_density)
+            container = containers[block.container]
+            container.score += score
+            if container.parent is not None:
+                containers[container.parent].score += score / 2
+
+        scores: Dict[int, float] = {}
+        for index, container in enumerate(containers):
+            if container.score > 0:
+                link_density = container.link_chars / container.chars if container.chars else 0
+                scores[index] = (container.score + container.weight) * (1 - link_density)
+        if not scores:
+            return None
+
+        top = max(scores, key=scores.get)
+        threshold = max(10.0, scores[top] * 0.2)
+        parent = containers[top].parent
+        return {top} | {
+            index for index, score in scores.items()
+            if index != top and containers[index].parent == parent and parent is not None and score >= threshold
+        }
+
+    def extract(self, html: str) -> HtmlContent:
+        """HTML 문자열에서 제목과 본문 블록을 문서 순서대로 추출합니다."""
+        parser = _BlockCollector()
+        if self.use_lxml:
+            feeder = etree.HTMLParser(target=parser)
+        else:
+            feeder = _StdlibParser(parser)
+        feeder.feed(html)
+        feeder.close()
+
+        selected = self._select(parser)
+        inside: Dict[int, bool] = {}
+
+        def in_selected(index: int) -> bool:
+            if index not in inside:
+                parent = parser.containers[index].parent
+                inside[index] = index in selected or (parent is not None and in_selected(parent))
+            return inside[index]
+
+        blocks = [
+            block.text for block in parser.blocks
+            if block.link_density <= self.max_link_density and (selected is None or in_selected(block.container))
+        ]
+        title = WHITESPACE_PATTERN.sub(" ", "".join(parser.title)).strip()
+        return HtmlContent(title, blocks)
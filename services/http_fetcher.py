@@ -0,0 +1,180 @@
+from typing import Any, Dict, Optional
+from dataclasses import dataclass
+import base64
+import json
+import os
+import re
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from utils.cache import PersistentCache, make_cache_key
+from utils.exceptions import ContentProcessingError
+from utils.logger import logger
+
+CHARSET_PATTERN = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+@dataclass
+class FetchResult:
+    """가져온 웹 페이지"""
+    url: str  # 리다이렉트를 따라간 최종 URL
+    content: bytes
+    encoding: Optional[str]  # Content-Type 헤더의 charset (없으면 None)
+    cached: bool = False  # 304 응답으로 캐시된 본문을 쓴 경우
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+class HttpFetcher:
+    """
+    웹사이트 수집용 HTTP 클라이언트
+
+    프로세스마다 keep-alive 연결 풀을 가진 Session 하나를 공유하고, 연결/읽기 타임아웃과
+    전체 다운로드 시간 한도를 둡니다. 본문은 스트리밍으로 받으면서 max_bytes를 넘으면 중단합니다.
+    ETag나 Last-Modified가 있는 응답은 영구 캐시에 저장해 두었다가 조건부 요청
+    (If-None-Match / If-Modified-Since)으로 재검증하고, 304면 저장된 본문을 그대로 씁니다.
+
+    Args:
+        cache: 응답 캐시 (None이면 캐시하지 않음)
+        connect_timeout: 연결 타임아웃 (초)
+        read_timeout: 읽기 타임아웃 (초, 데이터가 오지 않는 최대 간격)
+        total_timeout: 다운로드 전체 시간 한도 (초)
+        max_bytes: 본문 크기 한도
+        pool_size: 호스트별 유지할 연결 수
+        user_agent: User-Agent 헤더
+    """
+    def __init__(
+        self,
+        cache: Optional[PersistentCache] = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+        total_timeout: float = 30.0,
+        max_bytes: int = 5 * 1024 * 1024,
+        pool_size: int = 10,
+        user_agent: str = "QuestionGenerator/1.0"
+    ) -> None:
+        self.cache = cache
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self.max_bytes = max_bytes
+        self.pool_size = pool_size
+        self.user_agent = user_agent
+        self._session: Optional[requests.Session] = None
+        self._session_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def session(self) -> requests.Session:
+        """연결 풀을 가진 Session (fork된 워커에서는 새로 만듦)"""
+        with self._lock:
+            if self._session is None or self._session_pid != os.getpid():
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = self.user_agent
+                self._session = session
+                self._session_pid = os.getpid()
+            return self._session
+
+    def _read_body(self, response: requests.Response, started_at: float) -> bytes:
+        """본문을 크기/시간 한도 안에서 읽습니다."""
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit() and int(length) > self.max_bytes:
+            raise ContentProcessingError(
+                "웹 페이지가 너무 큽니다.",
+                {"url": response.url, "bytes": int(length), "max_bytes": self.max_bytes}
+            )
+        body = bytearray()
+        for block in response.iter_content(chunk_size=64 * 1024):
+            body.extend(block)
+            if len(body) > self.max_bytes:
+                raise ContentProcessingError(
+                    "웹 페이지가 너무 큽니다.",
+                    {"url": response.url, "max_bytes": self.max_bytes}
+                )
+            if time.monotonic() - started_at > self.total_timeout:
+                raise ContentProcessingError(
+                    "웹 페이지 응답 시간이 초과되었습니다.",
+                    {"url": response.url, "timeout": self.total_timeout}
+                )
+        return bytes(body)
+
+    def fetch(self, url: str) -> FetchResult:
+        """
+        URL의 본문을 가져옵니다.
+
+        Raises:
+            ContentProcessingError: 연결 실패, 시간 초과, 오류 응답, 크기 초과
+        """
+        key = make_cache_key(url)
+        entry = None
+        if self.cache is not None:
+            raw = self.cache.get(key)
+            entry = json.loads(raw) if raw else None
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        started_at = time.monotonic()
+        try:
+            with self.session().get(
+                url,
+                headers=headers,
+                stream=True,
+                timeout=(self.connect_timeout, self.read_timeout)
+            ) as response:
+                if response.status_code == 304 and entry:
+                    logger.info("http_fetched", url=url, status=304, cached=True)
+                    return FetchResult(
+                        entry["url"],
+                        base64.b64decode(entry["content"]),
+                        entry["encoding"],
+                        cached=True
+                    )
+                if response.status_code >= 400:
+                    raise ContentProcessingError(
+                        f"웹 페이지를 가져오지 못했습니다. (HTTP {response.status_code})",
+                        {"url": url, "status": response.status_code}
+                    )
+                content = self._read_body(response, started_at)
+                match = CHARSET_PATTERN.search(response.headers.get("Content-Type", ""))
+                result = FetchResult(response.url, content, match.group(1) if match else None)
+                self._store(key, response, result)
+        except requests.Timeout:
+            raise ContentProcessingError("웹 페이지 응답 시간이 초과되었습니다.", {"url": url})
+        except requests.RequestException as e:
+            raise ContentProcessingError(f"웹 페이지에 연결할 수 없습니다: {str(e)}", {"url": url})
+
+        logger.info(
+            "http_fetched",
+            url=url,
+            status=response.status_code,
+            bytes=len(content),
+            duration=round(time.monotonic() - started_at, 3)
+        )
+        return result
+
+    def _store(self, key: str, response: requests.Response, result: FetchResult) -> None:
+        """재검증할 수 있는 응답(ETag/Last-Modified)만 캐시합니다."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.cache is None or not (etag or last_modified):
+            return
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return
+        entry: Dict[str, Any] = {
+            "url": result.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": result.encoding,
+            "content": base64.b64encode(result.content).decode("ascii")
+        }
+        self.cache.set(key, json.dumps(entry))
@@ -0,0 +1,357 @@
+from typing import Any, Callable, Dict, List, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from utils.cache import thread_connection
+from utils.exceptions import QuestionGeneratorError, JobQueueFullError
+from utils.logger import logger, log_error
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+MAX_ATTEMPTS = 3  # 워커가 죽어 다시 대기열로 돌아간 작업의 최대 실행 횟수
+
+# 작업 처리 함수: (payload, progress 콜백) -> 결과
+JobHandler = Callable[[Dict[str, Any], Callable[[str, Dict[str, Any]], None]], Dict[str, Any]]
+# 작업이 끝났을 때(성공, 실패, 반복 중단) payload를 정리하는 함수
+JobCleanup = Callable[[Dict[str, Any]], None]
+
+
+class JobStore:
+    """
+    SQLite 기반 작업 저장소
+
+    여러 gunicorn 워커가 같은 파일을 공유하며, 작업 할당은 트랜잭션으로
+    원자적으로 처리하므로 한 작업이 두 번 실행되지 않습니다.
+    """
+    def __init__(
+        self,
+        path: str,
+        max_queue: int = 100,
+        stale_seconds: int = 15 * 60,
+        retention_seconds: int = 24 * 60 * 60
+    ) -> None:
+        self.path = path
+        self.max_queue = max_queue
+        self.stale_seconds = stale_seconds
+        self.retention_seconds = retention_seconds
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._setup()
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결을 반환합니다."""
+        return thread_connection(self._local, self.path)
+
+    def _setup(self) -> None:
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                progress TEXT,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        for column in ("payload", "progress", "result", "error"):
+            if job[column] is not None:
+                job[column] = json.loads(job[column])
+        return job
+
+    def create(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        새 작업을 대기열에 추가합니다.
+
+        Raises:
+            JobQueueFullError: 대기 중인 작업 수가 max_queue 이상인 경우
+        """
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # 보관 기간이 지난 완료 작업 정리
+            conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (SUCCEEDED, FAILED, now - self.retention_seconds)
+            )
+            queued = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (QUEUED,)
+            ).fetchone()[0]
+            if queued >= self.max_queue:
+                raise JobQueueFullError(
+                    "작업 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.",
+                    details={"queued": queued, "max_queue": self.max_queue}
+                )
+            conn.execute(
+                """
+                INSERT INTO jobs (id, status, payload, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (job_id, QUEUED, json.dumps(payload, ensure_ascii=False), now, now)
+            )
+        return self.get(job_id)
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """가장 오래된 대기 작업을 실행 중으로 바꾸고 반환합니다."""
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (RUNNING, time.time(), row["id"])
+            )
+        return self.get(row["id"])
+
+    def update_progress(self, job_id: str, attempt: int, progress: Dict[str, Any]) -> None:
+        """진행 상황을 기록합니다. 실행 중인 작업의 생존 신호 역할도 합니다."""
+        conn = self._connection()
+        conn.execute(
+            "UPDATE jobs SET progress = ?, updated_at = ? WHERE id = ? AND status = ? AND attempts = ?",
+            (json.dumps(progress, ensure_ascii=False), time.time(), job_id, RUNNING, attempt)
+        )
+
+    def heartbeat(self, job_id: str, attempt: int) -> bool:
+        """
+        실행 중인 작업의 갱신 시각만 기록합니다. (한 단계가 오래 걸려도 다시 대기열로 돌아가지 않도록)
+
+        Returns:
+            이 실행(attempt)이 아직 작업을 맡고 있으면 True
+        """
+        cursor = self._connection().execute(
+            "UPDATE jobs SET updated_at = ? WHERE id = ? AND status = ? AND attempts = ?",
+            (time.time(), job_id, RUNNING, attempt)
+        )
+        return cursor.rowcount > 0
+
+    def _complete(self, job_id: str, attempt: int, status: str, column: str, value: Dict[str, Any]) -> bool:
+        # 다시 대기열에 들어가 다른 실행이 맡은 작업이면 기록하지 않음
+        cursor = self._connection().execute(
+            f"UPDATE jobs SET status = ?, {column} = ?, updated_at = ? WHERE id = ? AND status = ? AND attempts = ?",
+            (status, json.dumps(value, ensure_ascii=False), time.time(), job_id, RUNNING, attempt)
+        )
+        return cursor.rowcount > 0
+
+    def finish(self, job_id: str, attempt: int, result: Dict[str, Any]) -> bool:
+        """
+        작업을 성공으로 표시하고 결과를 저장합니다.
+
+        Returns:
+            기록했으면 True, 이 실행이 더 이상 작업을 맡고 있지 않으면 False
+        """
+        return self._complete(job_id, attempt, SUCCEEDED, "result", result)
+
+    def fail(self, job_id: str, attempt: int, error: Dict[str, Any]) -> bool:
+        """
+        작업을 실패로 표시하고 오류를 저장합니다.
+
+        Returns:
+            기록했으면 True, 이 실행이 더 이상 작업을 맡고 있지 않으면 False
+        """
+        return self._complete(job_id, attempt, FAILED, "error", error)
+
+    def abandon_stale(self) -> List[Dict[str, Any]]:
+        """
+        최대 실행 횟수만큼 중단된 실행 중 작업을 실패로 표시합니다.
+
+        Returns:
+            실패로 표시한 작업 목록 (업로드 파일 정리용)
+        """
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? AND updated_at < ? AND attempts >= ?",
+                (RUNNING, now - self.stale_seconds, MAX_ATTEMPTS)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                [
+                    (
+                        FAILED,
+                        json.dumps({"message": "작업이 반복해서 중단되었습니다.", "error_code": "JOB_ABANDONED"}),
+                        now, row["id"]
+                    )
+                    for row in rows
+                ]
+            )
+        return [self._to_dict(row) for row in rows]
+
+    def requeue_stale(self) -> int:
+        """
+        오랫동안 갱신되지 않은 실행 중 작업(워커 재시작 등)을 다시 대기열에 넣습니다.
+        최대 실행 횟수에 이른 작업은 abandon_stale이 실패로 처리합니다.
+
+        Returns:
+            다시 대기열에 넣은 작업 수
+        """
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ? AND updated_at < ? AND attempts < ?",
+                (QUEUED, now, RUNNING, now - self.stale_seconds, MAX_ATTEMPTS)
+            )
+        return cursor.rowcount
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업을 조회합니다."""
+        row = self._connection().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수를 반환합니다."""
+        rows = self._connection().execute(
+            "SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"
+        ).fetchall()
+        return {row["status"]: row["count"] for row in rows}
+
+
+class JobQueue:
+    """
+    JobStore의 작업을 로컬 스레드 풀로 처리하는 대기열
+
+    워커 스레드는 첫 사용 시점에 시작되며, 프로세스가 fork되면
+    자식 프로세스에서 다시 시작됩니다. 실행 중인 작업은 heartbeat_interval마다
+    생존 신호를 기록하고, 작업이 끝나면 cleanup(payload)으로 업로드 파일 등을 정리합니다.
+    """
+    def __init__(
+        self,
+        store: JobStore,
+        handler: JobHandler,
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        heartbeat_interval: Optional[float] = None,
+        cleanup: Optional[JobCleanup] = None
+    ) -> None:
+        self.store = store
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval or store.stale_seconds / 3
+        self.cleanup = cleanup
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._pid: Optional[int] = None
+
+    def start(self) -> None:
+        """워커 스레드를 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다."""
+        with self._lock:
+            if self._pid == os.getpid() and all(thread.is_alive() for thread in self._threads):
+                return
+            self._pid = os.getpid()
+            self._threads = [
+                threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """작업을 등록하고 워커를 깨웁니다."""
+        self.start()
+        job = self.store.create(payload)
+        self._wakeup.set()
+        logger.info("job_submitted", job_id=job["id"], content_type=payload.get("type"))
+        return job
+
+    def _run(self) -> None:
+        last_requeue = 0.0
+        while True:
+            try:
+                if time.monotonic() - last_requeue > self.poll_interval * 30:
+                    last_requeue = time.monotonic()
+                    for abandoned in self.store.abandon_stale():
+                        self._cleanup(abandoned)
+                    self.store.requeue_stale()
+
+                job = self.store.claim()
+                if job is None:
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+                    continue
+
+                self._execute(job)
+            except Exception as e:
+                log_error(e, {"component": "job_worker"})
+                time.sleep(self.poll_interval)
+
+    def _cleanup(self, job: Dict[str, Any]) -> None:
+        if self.cleanup is None:
+            return
+        try:
+            self.cleanup(job["payload"])
+        except Exception as e:
+            log_error(e, {"job_id": job["id"], "component": "job_cleanup"})
+
+    def _heartbeat(self, job_id: str, attempt: int, stop: threading.Event) -> None:
+        while not stop.wait(self.heartbeat_interval):
+            try:
+                if not self.store.heartbeat(job_id, attempt):
+                    return
+            except Exception as e:
+                log_error(e, {"job_id": job_id, "component": "job_heartbeat"})
+
+    def _execute(self, job: Dict[str, Any]) -> None:
+        job_id, attempt = job["id"], job["attempts"]
+        started_at = time.monotonic()
+
+        def progress(event: str, data: Dict[str, Any]) -> None:
+            self.store.update_progress(job_id, attempt, {"stage": event, **data})
+
+        # 한 단계가 오래 걸려도 다른 워커가 다시 실행하지 않도록 생존 신호를 따로 기록
+        stop = threading.Event()
+        beat = threading.Thread(
+            target=self._heartbeat, args=(job_id, attempt, stop), name=f"job-heartbeat-{job_id[:8]}", daemon=True
+        )
+        beat.start()
+        try:
+            result = self.handler(job["payload"], progress)
+        except QuestionGeneratorError as e:
+            log_error(e, {"job_id": job_id})
+            completed = self.store.fail(job_id, attempt, {"message": e.message, "error_code": e.error_code})
+        except Exception as e:
+            log_error(e, {"job_id": job_id})
+            completed = self.store.fail(job_id, attempt, {"message": str(e), "error_code": "INTERNAL_SERVER_ERROR"})
+        else:
+            completed = self.store.finish(job_id, attempt, result)
+            if completed:
+                logger.info(
+                    "job_finished",
+                    job_id=job_id,
+                    duration=time.monotonic() - started_at
+                )
+        finally:
+            stop.set()
+            beat.join()
+
+        if completed:
+            self._cleanup(job)
+        else:
+            # 이 실행이 중단된 것으로 처리되어 다른 실행이 작업을 맡은 경우
+            logger.warning("job_result_discarded", job_id=job_id, attempt=attempt)
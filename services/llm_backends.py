@@ -0,0 +1,279 @@
+from typing import Any, Dict, Iterator, List, Optional
+from collections import Counter
+import hashlib
+import json
+import re
+import time
+import openai
+from utils.exceptions import ConfigurationError
+from utils.resilience import THROTTLE, RETRY
+
+Messages = List[Dict[str, str]]
+
+
+class LLMBackend:
+    """
+    LLM 백엔드 인터페이스
+
+    complete/stream은 원본 예외를 그대로 올리고, 재시도 여부는
+    classify_error/retry_after로 ResilientCaller에 알려줍니다.
+    """
+    name = "base"
+    default_fast_model = ""
+    default_strong_model = ""
+
+    def complete(self, model: str, messages: Messages, max_tokens: int, temperature: float) -> str:
+        """응답 본문 전체를 반환합니다."""
+        raise NotImplementedError
+
+    def stream(self, model: str, messages: Messages, max_tokens: int, temperature: float) -> Iterator[str]:
+        """응답 본문을 조각 단위로 내보냅니다."""
+        yield self.complete(model, messages, max_tokens, temperature)
+
+    def classify_error(self, error: Exception) -> Optional[str]:
+        """예외를 THROTTLE, RETRY 또는 None(재시도 불가)으로 분류합니다."""
+        return None
+
+    def retry_after(self, error: Exception) -> Optional[float]:
+        """예외에 담긴 Retry-After 대기 시간(초)을 반환합니다."""
+        return None
+
+
+def classify_openai_error(error: Exception) -> Optional[str]:
+    """OpenAI 예외를 재시도 정책에 맞게 분류합니다."""
+    if isinstance(error, openai.error.RateLimitError):
+        # 할당량 소진은 기다려도 해결되지 않음
+        if getattr(error, 'code', None) == 'insufficient_quota':
+            return None
+        return THROTTLE
+    if isinstance(error, (
+        openai.error.Timeout,
+        openai.error.APIConnectionError,
+        openai.error.ServiceUnavailableError,
+        openai.error.TryAgain
+    )):
+        return RETRY
+    if isinstance(error, openai.error.APIError):
+        status = error.http_status
+        if status == 429:
+            return THROTTLE
+        if status is None or status >= 500:
+            return RETRY
+    return None
+
+
+def openai_retry_after(error: Exception) -> Optional[float]:
+    """응답의 Retry-After 헤더 값(초)을 반환합니다."""
+    headers = getattr(error, 'headers', None) or {}
+    value = headers.get('retry-after') or headers.get('Retry-After')
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class OpenAIBackend(LLMBackend):
+    """openai.ChatCompletion 백엔드"""
+    name = "openai"
+    default_fast_model = "gpt-3.5-turbo"
+    default_strong_model = "gpt-4"
+
+    def __init__(self, api_key: str, strong_model: str = "") -> None:
+        openai.api_key = api_key
+        openai.timeout = 60.0  # 타임아웃 설정 추가
+        if strong_model:
+            self.default_strong_model = strong_model
+
+    def complete(self, model: str, messages: Messages, max_tokens: int, temperature: float) -> str:
+        response = openai.ChatCompletion.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        return response.choices[0].message['content']
+
+    def stream(self, model: str, messages: Messages, max_tokens: int, temperature: float) -> Iterator[str]:
+        response = openai.ChatCompletion.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        for chunk in response:
+            delta = chunk['choices'][0]['delta'].get('content')
+            if delta:
+                yield delta
+
+    def classify_error(self, error: Exception) -> Optional[str]:
+        return classify_openai_error(error)
+
+    def retry_after(self, error: Exception) -> Optional[float]:
+        return openai_retry_after(error)
+
+
+class GeminiBackend(LLMBackend):
+    """
+    Google Gemini 백엔드
+
+    google-generativeai 패키지가 필요하며, 처음 사용할 때 불러옵니다.
+    """
+    name = "gemini"
+    default_fast_model = "gemini-pro"
+    default_strong_model = "gemini-pro"
+
+    def __init__(self, api_key: str, strong_model: str = "") -> None:
+        if not api_key:
+            raise ConfigurationError("Gemini API 키가 설정되지 않았습니다.")
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            raise ConfigurationError("Gemini 백엔드를 사용하려면 google-generativeai 패키지를 설치해주세요.")
+        genai.configure(api_key=api_key)
+        self.genai = genai
+        if strong_model:
+            self.default_strong_model = strong_model
+
+    @staticmethod
+    def _contents(messages: Messages) -> List[Dict[str, Any]]:
+        roles = {"assistant": "model"}
+        return [
+            {"role": roles.get(message["role"], "user"), "parts": [message["content"]]}
+            for message in messages
+        ]
+
+    def _generate(self, model: str, messages: Messages, max_tokens: int, temperature: float, stream: bool):
+        return self.genai.GenerativeModel(model).generate_content(
+            self._contents(messages),
+            generation_config={"max_output_tokens": max_tokens, "temperature": temperature},
+            stream=stream
+        )
+
+    def complete(self, model: str, messages: Messages, max_tokens: int, temperature: float) -> str:
+        return self._generate(model, messages, max_tokens, temperature, stream=False).text
+
+    def stream(self, model: str, messages: Messages, max_tokens: int, temperature: float) -> Iterator[str]:
+        for chunk in self._generate(model, messages, max_tokens, temperature, stream=True):
+            if chunk.text:
+                yield chunk.text
+
+    def classify_error(self, error: Exception) -> Optional[str]:
+        from google.api_core import exceptions as google_exceptions
+        if isinstance(error, (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)):
+            return THROTTLE
+        if isinstance(error, (
+            google_exceptions.ServiceUnavailable,
+            google_exceptions.InternalServerError,
+            google_exceptions.DeadlineExceeded
+        )):
+            return RETRY
+        return None
+
+
+class StubBackend(LLMBackend):
+    """
+    네트워크 없이 결정적인 응답을 돌려주는 로컬 백엔드 (오프라인 테스트, 벤치마크용)
+
+    프롬프트가 요구하는 JSON 형식(요약/주제, 문제 세트)을 흉내 내며,
+    같은 입력에는 항상 같은 응답을 반환합니다.
+    """
+    name = "stub"
+    default_fast_model = "stub-fast"
+    default_strong_model = "stub-strong"
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+
+    def complete(self, model: str, messages: Messages, max_tokens: int, temperature: float) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        prompt = messages[-1]["content"]
+
+        if '"questions"' in prompt:
+            return json.dumps(self._questions(prompt), ensure_ascii=False)
+        if '"번호"' in prompt:
+            sections = re.findall(r'\[조각 (\d+)\]\n"""(.*?)"""', prompt, re.DOTALL)
+            return json.dumps([
+                {"번호": int(number), **self._summary(f'"""{body}"""')}
+                for number, body in sections
+            ], ensure_ascii=False)
+        if '"요약"' in prompt:
+            return json.dumps(self._summary(prompt), ensure_ascii=False)
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+        return f"[{model}:{digest}] {self._sentences(prompt, 2)}"
+
+    def stream(self, model: str, messages: Messages, max_tokens: int, temperature: float) -> Iterator[str]:
+        text = self.complete(model, messages, max_tokens, temperature)
+        for start in range(0, len(text), 20):
+            yield text[start:start + 20]
+
+    @staticmethod
+    def _body(prompt: str) -> str:
+        """프롬프트에서 분석 대상 텍스트 부분을 꺼냅니다."""
+        quoted = re.search(r'"""(.*?)"""', prompt, re.DOTALL)
+        if quoted:
+            return quoted.group(1)
+        if "[요약]" in prompt:
+            return prompt.split("[요약]", 1)[1]
+        return prompt
+
+    @staticmethod
+    def _sentences(text: str, count: int) -> str:
+        sentences = re.split(r'(?<=[.!?])\s+', " ".join(text.split()))
+        return " ".join(sentences[:count])[:300]
+
+    @staticmethod
+    def _keywords(text: str, count: int) -> List[str]:
+        words = re.findall(r'[가-힣A-Za-z]{2,}', text)
+        return [word for word, _ in Counter(words).most_common(count)]
+
+    def _summary(self, prompt: str) -> Dict[str, Any]:
+        body = self._body(prompt)
+        if "[주제 목록]" in prompt:
+            topics = [
+                topic.strip() for topic in prompt.split("[주제 목록]", 1)[1].split(",") if topic.strip()
+            ][:3]
+            body = body.split("[주제 목록]", 1)[0]
+        else:
+            topics = self._keywords(body, 3)
+        return {"요약": self._sentences(body, 2), "핵심 주제": topics}
+
+    def _questions(self, prompt: str) -> Dict[str, Any]:
+        topics = re.findall(r'^\s*- (.+)$', prompt.split("[핵심 주제]", 1)[-1], re.MULTILINE) or ["주제"]
+        questions = []
+        for i in range(3):
+            topic = topics[i % len(topics)]
+            answer = "ABC"[i]
+            questions.append({
+                "질문": f"아래 보기 중 입력된 내용의 {i + 1}번째 핵심 개념에 가장 가까운 주제를 고르시오.",
+                "보기": {
+                    key: {
+                        "질문": f"{topic}에 대한 {key} 관점의 질문은 무엇인가?",
+                        "근접도": 90 if key == answer else 30 + 10 * index
+                    }
+                    for index, key in enumerate("ABCDE")
+                },
+                "정답": answer,
+                "해설": {
+                    "정답_설명": f"{answer}는 '{topic}'의 핵심을 직접 다룹니다.",
+                    "오답_설명": "다른 보기는 핵심 개념의 주변 내용을 다룹니다."
+                }
+            })
+        return {"questions": questions}
+
+
+def create_backend(name: str, config: Any) -> LLMBackend:
+    """
+    설정에 맞는 백엔드를 생성합니다.
+
+    Raises:
+        ConfigurationError: 알 수 없는 백엔드 이름이거나 필요한 설정이 없는 경우
+    """
+    if name == "openai":
+        return OpenAIBackend(config.OPENAI.API_KEY, config.OPENAI.MODEL)
+    if name == "gemini":
+        return GeminiBackend(config.GEMINI.API_KEY, config.GEMINI.MODEL)
+    if name == "stub":
+        return StubBackend(config.LLM.STUB_LATENCY)
+    raise ConfigurationError(f"알 수 없는 LLM 백엔드입니다: {name}")
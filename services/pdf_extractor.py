@@ -0,0 +1,180 @@
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager, nullcontext
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import PyPDF2
+from utils.logger import logger, log_error
+
+# (페이지 번호(0부터), 텍스트, 걸린 시간(초), 오류 메시지)
+PageResult = Tuple[int, str, float, Optional[str]]
+
+
+def iter_range(reader: PyPDF2.PdfReader, start: int, end: int) -> Iterator[PageResult]:
+    """페이지 범위의 텍스트를 한 페이지씩 추출합니다. 한 페이지가 실패해도 나머지 페이지는 계속 처리합니다."""
+    for number in range(start, end):
+        started_at = time.perf_counter()
+        try:
+            text, error = reader.pages[number].extract_text() or "", None
+        except Exception as e:
+            text, error = "", f"{type(e).__name__}: {e}"
+        yield number, text, time.perf_counter() - started_at, error
+
+
+def extract_range(reader: PyPDF2.PdfReader, start: int, end: int) -> List[PageResult]:
+    return list(iter_range(reader, start, end))
+
+
+def _extract_range_from_path(path: str, start: int, end: int) -> List[PageResult]:
+    """프로세스 풀 작업: 파일을 직접 열어 페이지 범위를 추출합니다."""
+    return extract_range(PyPDF2.PdfReader(path), start, end)
+
+
+class PdfExtractor:
+    """
+    PDF 페이지 텍스트 추출기
+
+    PyPDF2의 extract_text는 순수 파이썬이라 CPU를 많이 씁니다. min_parallel_pages 이상인
+    PDF는 pages_per_task 쪽씩 나눠 프로세스 풀에서 동시에 추출하고, 그보다 작으면
+    풀 오버헤드를 피해 현재 프로세스에서 추출합니다. 결과는 항상 페이지 순서대로 합칩니다.
+
+    프로세스 풀은 첫 사용 시 spawn 방식으로 만들어 (스레드가 있는 웹 워커에서 fork하지 않음)
+    요청 간에 재사용하며, 풀 작업이 실패한 범위는 현재 프로세스에서 다시 추출합니다.
+
+    Args:
+        min_parallel_pages: 프로세스 풀을 쓰기 시작하는 페이지 수
+        workers: 프로세스 수 (0이면 CPU 수)
+        pages_per_task: 작업 하나가 맡는 페이지 수
+    """
+    def __init__(self, min_parallel_pages: int = 32, workers: int = 0, pages_per_task: int = 8) -> None:
+        self.min_parallel_pages = min_parallel_pages
+        self.workers = workers or os.cpu_count() or 1
+        self.pages_per_task = pages_per_task
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                self._pool_pid = os.getpid()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @contextmanager
+    def _readable_path(self, source: Union[str, BinaryIO]) -> Iterator[str]:
+        """작업 프로세스가 열 수 있는 경로를 제공합니다. 업로드 파일 객체는 임시 파일로 저장합니다."""
+        if isinstance(source, str):
+            yield source
+            return
+        source.seek(0)
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as spooled:
+            shutil.copyfileobj(source, spooled)
+            spooled.flush()
+            yield spooled.name
+
+    def _iter_parallel(self, reader: PyPDF2.PdfReader, path: str, count: int) -> Iterator[PageResult]:
+        """
+        페이지 범위를 프로세스 풀에 맡기고 페이지 순서대로 내보냅니다.
+        소비자가 느리면 메모리가 쌓이지 않도록 workers * 2개 범위까지만 미리 제출합니다.
+        """
+        ranges = iter([(start, min(count, start + self.pages_per_task)) for start in range(0, count, self.pages_per_task)])
+        executor = self._executor()
+        pending: Deque[Tuple[Tuple[int, int], Future]] = deque()
+
+        def submit_next() -> None:
+            page_range = next(ranges, None)
+            if page_range:
+                pending.append((page_range, executor.submit(_extract_range_from_path, path, *page_range)))
+
+        for _ in range(self.workers * 2):
+            submit_next()
+        while pending:
+            (start, end), future = pending.popleft()
+            try:
+                results = future.result()
+            except Exception as e:
+                # 작업 프로세스가 죽은 경우 등: 해당 범위만 현재 프로세스에서 다시 추출
+                log_error(e, {"stage": "pdf_extract", "pages": f"{start + 1}-{end}"})
+                if isinstance(e, BrokenProcessPool):
+                    self._reset_pool()
+                    executor = self._executor()
+                results = extract_range(reader, start, end)
+            submit_next()
+            yield from results
+
+    def iter_pages(
+        self,
+        source: Union[str, BinaryIO],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        PDF의 페이지 텍스트를 순서대로 하나씩 내보냅니다.
+        다 읽으면 metadata에 {"pages", "parallel", "failed_pages", "page_seconds", "extraction_seconds"}를 채웁니다.
+
+        Raises:
+            FileNotFoundError, PermissionError, PyPDF2.errors.PdfReadError: 파일을 열 수 없는 경우
+        """
+        started_at = time.perf_counter()
+        reader = PyPDF2.PdfReader(source)
+        count = len(reader.pages)
+        parallel = count >= self.min_parallel_pages and self.workers > 1
+        failed_pages: List[int] = []
+        page_seconds: List[float] = []
+
+        with self._readable_path(source) if parallel else nullcontext() as path:
+            results = self._iter_parallel(reader, path, count) if parallel else iter_range(reader, 0, count)
+            for number, text, seconds, error in results:
+                if error:
+                    failed_pages.append(number + 1)
+                page_seconds.append(round(seconds, 4))
+                yield text
+
+        extraction_seconds = round(time.perf_counter() - started_at, 3)
+        if metadata is not None:
+            metadata.update({
+                "pages": count,
+                "parallel": parallel,
+                "failed_pages": failed_pages,
+                "page_seconds": page_seconds,
+                "extraction_seconds": extraction_seconds
+            })
+        logger.info(
+            "pdf_extracted",
+            pages=count,
+            parallel=parallel,
+            failed_pages=len(failed_pages),
+            duration=extraction_seconds
+        )
+
+    def extract(self, source: Union[str, BinaryIO]) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        PDF의 페이지별 텍스트를 추출합니다.
+
+        Args:
+            source: 파일 경로 또는 파일 객체
+
+        Returns:
+            (페이지 순서의 텍스트 리스트, {"pages", "parallel", "failed_pages", "page_seconds", "extraction_seconds"})
+
+        Raises:
+            FileNotFoundError, PermissionError, PyPDF2.errors.PdfReadError: 파일을 열 수 없는 경우
+        """
+        metadata: Dict[str, Any] = {}
+        pages = list(self.iter_pages(source, metadata))
+        return pages, metadata
@@ -0,0 +1,485 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import threading
+import time
+from config import get_config
+from services.content_processor import ContentProcessor
+from services.question_bank import QuestionBank
+from services.question_generator import QuestionGenerator, ProgressCallback, ContentFingerprint
+from services.token_budget import track_usage
+from utils.json_stream import loads_tolerant
+from utils.logger import logger, log_error
+from utils.exceptions import (
+    QuestionGeneratorError,
+    ValidationError,
+    ContentProcessingError
+)
+
+SUPPORTED_CONTENT_TYPES = ['text', 'pdf', 'youtube', 'website', 'image']
+
+# ContentProcessor가 예외 대신 반환하는 오류 메시지의 공통 문구
+EXTRACTION_ERROR_MARKERS = [
+    "처리 중 오류가 발생했습니다",
+    "찾을 수 없습니다",
+    "접근할 수 없습니다",
+    "올바르지 않은",
+    "제공되지 않았습니다"
+]
+
+class QuestionPipeline:
+    """
+    콘텐츠 추출 → 요약/주제 추출 → 문제 생성 과정을 묶은 파이프라인
+
+    question_bank가 있으면 생성한 문제 세트를 저장하고, 같은 문서의 세트가
+    이미 있으면 요약/문제 생성 없이 재사용합니다.
+
+    여러 문서를 한 번에 처리하는 run_batch는 모든 요청이 공유하는 batch_workers 크기의
+    스레드 풀을 쓰며, LLM 호출은 QuestionGenerator의 속도 제한기를 함께 거칩니다.
+
+    stream_pdf가 켜져 있으면 PDF는 전체 텍스트를 만들지 않고 페이지를 추출하는 대로 요약합니다.
+    (사전 요약이 켜져 있거나 이미 추출해 둔 업로드 파일이면 기존 방식 사용)
+    """
+    def __init__(
+        self,
+        content_processor: ContentProcessor,
+        question_generator: QuestionGenerator,
+        question_bank: Optional[QuestionBank] = None,
+        reuse: bool = True,
+        batch_workers: int = 4,
+        stream_pdf: bool = False
+    ):
+        self.content_processor = content_processor
+        self.question_generator = question_generator
+        self.question_bank = question_bank
+        self.reuse = reuse
+        self.batch_workers = batch_workers
+        self.stream_pdf = stream_pdf
+        # 배치 스레드 풀 (첫 사용 시 생성, fork된 자식 프로세스에서는 새로 생성)
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_pid: Optional[int] = None
+        self._batch_lock = threading.Lock()
+
+    def extract(
+        self,
+        content_type: str,
+        content: Any,
+        file: Any = None,
+        key: Optional[str] = None
+    ) -> Tuple[str, Dict[str, Any], Optional[List[str]]]:
+        """
+        콘텐츠에서 텍스트를 추출합니다.
+
+        Args:
+            content_type: 콘텐츠 타입 (text, pdf, image, youtube, website)
+            content: 텍스트 또는 URL
+            file: pdf/image 타입의 파일 객체 또는 파일 경로
+            key: upload_key로 미리 구한 PDF의 추출 결과 저장소 키
+
+        Returns:
+            (추출된 텍스트, 추출 메타데이터, PDF의 페이지별 텍스트 또는 페이지가 없는 콘텐츠면 None)
+
+        Raises:
+            ValidationError: 입력이 유효하지 않은 경우
+            ContentProcessingError: 추출 결과가 오류 메시지이거나 PDF를 읽을 수 없는 경우
+        """
+        metadata: Dict[str, Any] = {}
+        pages: Optional[List[str]] = None
+        if content_type == 'text':
+            if not content:
+                raise ValidationError("텍스트가 없습니다.")
+            processed_content = self.content_processor.process_text(content)
+
+        elif content_type in ['pdf', 'image']:
+            if not file:
+                raise ValidationError("파일이 제공되지 않았습니다.")
+
+            if content_type == 'pdf':
+                pages, metadata = self.content_processor.process_pdf_pages(file, key)
+                processed_content = "\n\n".join(pages)  # 페이지 간 구분을 위해 개행 추가
+            else:  # image
+                processed_content = self.content_processor.process_image(file)
+
+        elif content_type == 'youtube':
+            if not content:
+                raise ValidationError("유튜브 URL이 없습니다.")
+            if not isinstance(content, str):
+                raise ValidationError("올바른 유튜브 URL이 제공되지 않았습니다.")
+            processed_content = self.content_processor.process_youtube(content)
+
+        elif content_type == 'website':
+            if not content:
+                raise ValidationError("웹사이트 URL이 없습니다.")
+            if not isinstance(content, str):
+                raise ValidationError("올바른 웹사이트 URL이 제공되지 않았습니다.")
+            processed_content = self.content_processor.process_website(content)
+
+        else:
+            raise ValidationError("지원하지 않는 콘텐츠 타입입니다.")
+
+        # 오류 메시지 확인
+        if isinstance(processed_content, str) and any(
+            error_text in processed_content for error_text in EXTRACTION_ERROR_MARKERS
+        ):
+            raise ContentProcessingError(processed_content)
+
+        metadata['characters'] = len(processed_content)
+        return processed_content, metadata, pages
+
+    def summarize(
+        self,
+        processed_content: str,
+        progress: Optional[ProgressCallback] = None,
+        pages: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        요약과 핵심 주제를 추출하고 형식을 검증합니다.
+
+        Args:
+            pages: PDF의 페이지별 텍스트 (반복되는 머리글/바닥글 제거에 사용)
+
+        Returns:
+            '요약'과 '핵심 주제' 키를 가진 딕셔너리
+        """
+        return self._parse_summary(
+            lambda: self.question_generator.generate_summary_and_topics(processed_content, progress, pages)
+        )
+
+    def upload_key(self, content_type: str, file: Any = None) -> Optional[str]:
+        """
+        PDF 업로드의 추출 결과 저장소 키(원본 바이트의 SHA-256)를 구합니다.
+        업로드 파일을 한 번만 해시하도록 streams_pdf, extract, summarize_pdf_stream에 그대로 넘깁니다.
+        """
+        if content_type != 'pdf' or not file:
+            return None
+        return self.content_processor.pdf_key(file)
+
+    def streams_pdf(self, content_type: str, key: Optional[str] = None) -> bool:
+        """
+        이 콘텐츠를 추출과 요약을 겹쳐서 처리할지 여부
+
+        추출 결과 저장소에 있는 업로드 파일(key는 upload_key의 결과)은 파싱 없이 바로 읽히므로,
+        요약 전에 문서 해시로 문제 은행과 요약 캐시를 확인하는 기존 방식으로 처리합니다.
+        """
+        return (
+            content_type == 'pdf'
+            and self.stream_pdf
+            and not self.question_generator.config.PRESUMMARY.ENABLED
+            and not self.content_processor.has_extracted_pdf(key)
+        )
+
+    def summarize_pdf_stream(
+        self,
+        file: Any,
+        progress: Optional[ProgressCallback] = None,
+        key: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        PDF 페이지를 추출하는 대로 요약합니다. 추출이 끝나면 'extracted' 진행 이벤트를 보냅니다.
+
+        Returns:
+            (요약 데이터, 문서 해시)
+
+        Raises:
+            ValidationError: 파일이 없는 경우
+            ContentProcessingError: PDF를 읽을 수 없거나 텍스트가 없는 경우
+        """
+        if not file:
+            raise ValidationError("파일이 제공되지 않았습니다.")
+        report: Callable[[str, Dict[str, Any]], None] = progress or (lambda event, data: None)
+        metadata: Dict[str, Any] = {"pages": 0, "empty_pages": 0}
+        fingerprint = ContentFingerprint()
+
+        def pages():
+            characters = 0
+            for page in self.content_processor.iter_pdf_pages(file, metadata, key):
+                fingerprint.update(page)
+                # process_pdf_with_metadata가 만드는 전체 텍스트("\n\n"으로 연결)와 같은 길이
+                characters += len(page) + (2 if characters else 0)
+                yield page
+            metadata['characters'] = characters
+            report('extracted', metadata)
+
+        summary_data = self._parse_summary(
+            lambda: self.question_generator.summarize_pages(pages(), progress)
+        )
+        return summary_data, fingerprint.hexdigest()
+
+    def _parse_summary(self, produce: Callable[[], str]) -> Dict[str, Any]:
+        try:
+            summary_and_topics = produce()
+            summary_data = loads_tolerant(summary_and_topics)
+
+            if not isinstance(summary_data, dict) or '요약' not in summary_data or '핵심 주제' not in summary_data:
+                raise QuestionGeneratorError(
+                    message="잘못된 요약 데이터 형식입니다.",
+                    error_code="INVALID_SUMMARY_FORMAT"
+                )
+        except QuestionGeneratorError:
+            raise
+        except json.JSONDecodeError as e:
+            raise QuestionGeneratorError(
+                message=f"요약 및 주제 데이터 파싱 중 오류 발생: {str(e)}",
+                error_code="JSON_PARSE_ERROR"
+            )
+        except Exception as e:
+            raise QuestionGeneratorError(
+                message=f"요약 및 주제 추출 중 오류 발생: {str(e)}",
+                error_code="SUMMARY_GENERATION_ERROR"
+            )
+        return summary_data
+
+    def generate_questions(self, summary_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        요약 데이터로 문제를 생성하고 형식을 검증합니다.
+
+        Returns:
+            문제 리스트
+        """
+        try:
+            questions = self.question_generator.generate_questions(
+                summary_data['요약'],
+                summary_data['핵심 주제']
+            )
+            questions_data = loads_tolerant(questions)
+
+            if not isinstance(questions_data, dict) or 'questions' not in questions_data:
+                raise QuestionGeneratorError(
+                    message="잘못된 질문 데이터 형식입니다.",
+                    error_code="INVALID_QUESTIONS_FORMAT"
+                )
+        except QuestionGeneratorError:
+            raise
+        except json.JSONDecodeError as e:
+            raise QuestionGeneratorError(
+                message=f"질문 데이터 파싱 중 오류 발생: {str(e)}",
+                error_code="JSON_PARSE_ERROR"
+            )
+        except Exception as e:
+            raise QuestionGeneratorError(
+                message=f"질문 생성 중 오류 발생: {str(e)}",
+                error_code="QUESTION_GENERATION_ERROR"
+            )
+        return questions_data['questions']
+
+    def save(
+        self,
+        content_type: str,
+        document_hash: str,
+        summary_data: Dict[str, Any],
+        questions: List[Dict[str, Any]]
+    ) -> Optional[str]:
+        """문제 세트를 문제 은행에 저장하고 세트 ID를 반환합니다. (문제 은행이 없으면 None)"""
+        if self.question_bank is None or not questions:
+            return None
+        return self.question_bank.add(
+            document_hash,
+            summary_data['요약'],
+            summary_data['핵심 주제'],
+            questions,
+            content_type
+        )
+
+    def run(
+        self,
+        content_type: str,
+        content: Any,
+        file: Any = None,
+        progress: Optional[ProgressCallback] = None,
+        reuse: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        전체 파이프라인을 실행합니다.
+
+        Args:
+            content_type: 콘텐츠 타입
+            content: 텍스트 또는 URL
+            file: pdf/image 타입의 파일 객체 또는 파일 경로
+            progress: 단계가 끝날 때마다 (이벤트 이름, 데이터)로 호출되는 콜백
+            reuse: 문제 은행의 기존 세트 재사용 여부 (None이면 파이프라인 설정)
+
+        Returns:
+            summary, topics, questions, document_hash, question_set_id, reused,
+            usage(토큰/비용 사용량) 키를 가진 결과
+        """
+        with track_usage() as meter:
+            result = self._run(content_type, content, file, progress, self.reuse if reuse is None else reuse)
+        usage = meter.summary()
+        logger.info("request_usage", content_type=content_type, **usage)
+        return {**result, 'usage': usage}
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._batch_lock:
+            if self._batch_executor is None or self._batch_pid != os.getpid():
+                self._batch_pid = os.getpid()
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=self.batch_workers,
+                    thread_name_prefix="batch"
+                )
+            return self._batch_executor
+
+    def _run_item(self, index: int, item: Dict[str, Any], reuse: Optional[bool]) -> Dict[str, Any]:
+        """배치 항목 하나를 처리합니다. 실패해도 예외 대신 항목별 오류를 반환합니다."""
+        try:
+            result = self.run(item.get('type'), item.get('content'), item.get('file'), reuse=reuse)
+            return {'index': index, 'status': 'succeeded', 'result': result}
+        except QuestionGeneratorError as e:
+            log_error(e, {'batch_index': index})
+            return {'index': index, 'status': 'failed', 'error': e.message, 'error_code': e.error_code}
+        except Exception as e:
+            log_error(e, {'batch_index': index})
+            return {'index': index, 'status': 'failed', 'error': str(e), 'error_code': 'INTERNAL_SERVER_ERROR'}
+
+    def merge(self, results: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        성공한 항목들의 요약과 주제를 합쳐 하나의 문제 세트를 생성합니다.
+
+        Returns:
+            summary, topics, questions, sources(합친 항목 번호), usage 키를 가진 결과
+            (성공한 항목이 없으면 None)
+        """
+        succeeded = [item for item in results if item['status'] == 'succeeded']
+        if not succeeded:
+            return None
+        summary_data = {
+            '요약': "\n\n".join(item['result']['summary'] for item in succeeded),
+            '핵심 주제': list(dict.fromkeys(
+                topic for item in succeeded for topic in item['result']['topics']
+            ))
+        }
+        with track_usage() as meter:
+            questions = self.generate_questions(summary_data)
+        return {
+            'summary': summary_data['요약'],
+            'topics': summary_data['핵심 주제'],
+            'questions': questions,
+            'sources': [item['index'] for item in succeeded],
+            'usage': meter.summary()
+        }
+
+    def run_batch(
+        self,
+        items: List[Dict[str, Any]],
+        merge: bool = False,
+        reuse: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 콘텐츠를 공유 스레드 풀에서 동시에 처리합니다.
+
+        Args:
+            items: {'type', 'content', 'file'} 항목 리스트
+            merge: 성공한 항목들을 합친 문제 세트도 생성할지 여부
+            reuse: 문제 은행의 기존 세트 재사용 여부
+
+        Returns:
+            items(항목별 결과 또는 오류, 입력 순서), succeeded, failed, merged(merge일 때) 키를 가진 결과
+        """
+        started_at = time.monotonic()
+        executor = self._executor()
+        futures = [executor.submit(self._run_item, index, item, reuse) for index, item in enumerate(items)]
+        results = [future.result() for future in futures]
+
+        succeeded = sum(1 for item in results if item['status'] == 'succeeded')
+        response: Dict[str, Any] = {
+            'items': results,
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded
+        }
+        if merge:
+            response['merged'] = self.merge(results)
+        logger.info(
+            "batch_processed",
+            items=len(results),
+            succeeded=succeeded,
+            merged=merge,
+            duration=round(time.monotonic() - started_at, 3)
+        )
+        return response
+
+    def _reused_result(self, document_hash: str, report: Callable[[str, Dict[str, Any]], None]) -> Optional[Dict[str, Any]]:
+        """문제 은행에 같은 문서의 세트가 있으면 결과 형식으로 반환합니다."""
+        if self.question_bank is None:
+            return None
+        question_set = self.question_bank.latest(document_hash)
+        if not question_set:
+            return None
+        report('reused', {'question_set_id': question_set['id']})
+        self.question_generator.schedule_feedback(question_set['questions'])
+        return {
+            'summary': question_set['summary'],
+            'topics': question_set['topics'],
+            'questions': question_set['questions'],
+            'document_hash': document_hash,
+            'question_set_id': question_set['id'],
+            'reused': True
+        }
+
+    def _run(
+        self,
+        content_type: str,
+        content: Any,
+        file: Any,
+        progress: Optional[ProgressCallback],
+        reuse: bool
+    ) -> Dict[str, Any]:
+        report: Callable[[str, Dict[str, Any]], None] = progress or (lambda event, data: None)
+
+        key = self.upload_key(content_type, file)
+        if self.streams_pdf(content_type, key):
+            # 처음 보는 업로드 파일만 이 경로로 옴 (다시 올린 파일은 저장된 추출 결과로 아래에서 처리)
+            # 추출과 요약을 겹쳐서 실행하므로 다른 파일의 같은 문서인지는 요약 후에 확인
+            summary_data, document_hash = self.summarize_pdf_stream(file, progress, key)
+            reused = self._reused_result(document_hash, report) if reuse else None
+            if reused:
+                return reused
+        else:
+            try:
+                processed_content, metadata, pages = self.extract(content_type, content, file, key)
+            except Exception as e:
+                raise ContentProcessingError(f"콘텐츠 처리 중 오류 발생: {str(e)}")
+
+            if not processed_content:
+                raise ContentProcessingError("처리된 콘텐츠가 없습니다.")
+            report('extracted', metadata)
+
+            document_hash = self.question_generator.fingerprint(processed_content)
+            reused = self._reused_result(document_hash, report) if reuse else None
+            if reused:
+                return reused
+
+            summary_data = self.summarize(processed_content, progress, pages)
+        report('summary', {'topics': summary_data['핵심 주제']})
+
+        questions = self.generate_questions(summary_data)
+        report('questions', {'count': len(questions)})
+
+        return {
+            'summary': summary_data['요약'],
+            'topics': summary_data['핵심 주제'],
+            'questions': questions,
+            'document_hash': document_hash,
+            'question_set_id': self.save(content_type, document_hash, summary_data, questions),
+            'reused': False
+        }
+
+
+def create_pipeline(
+    content_processor: Optional[ContentProcessor] = None,
+    question_generator: Optional[QuestionGenerator] = None,
+    config: Any = None
+) -> QuestionPipeline:
+    """
+    설정(QUESTION_BANK, BATCH, PDF)에 맞춘 파이프라인을 만듭니다.
+    웹 서버와 일괄 생성 CLI가 같은 재사용/배치/스트리밍 설정으로 동작하도록 함께 사용합니다.
+    """
+    config = config or get_config()
+    bank = config.QUESTION_BANK
+    return QuestionPipeline(
+        content_processor or ContentProcessor(),
+        question_generator or QuestionGenerator(),
+        QuestionBank(bank.PATH, enabled=bank.ENABLED),
+        reuse=bank.REUSE,
+        batch_workers=config.BATCH.WORKERS,
+        stream_pdf=config.PDF.STREAMING
+    )
@@ -0,0 +1,183 @@
+from typing import Any, Dict, List, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+from services.extractive_summarizer import ExtractiveSummarizer
+from utils.cache import make_cache_key, thread_connection
+
+# 검색어 끝에서 떼어 볼 조사 (긴 것부터 검사)
+PARTICLES = sorted(
+    "은 는 이 가 을 를 의 에 와 과 도 만 로 으로 에서 에게 까지 부터 이란 이나 처럼 보다".split(),
+    key=len,
+    reverse=True
+)
+
+
+class QuestionBank:
+    """
+    생성된 문제 세트를 보관하고 문서 해시나 주제 키워드로 찾는 SQLite 문제 은행
+
+    문제 세트는 원본 콘텐츠 지문(QuestionGenerator.fingerprint), 요약, 핵심 주제,
+    보기별 근접도가 담긴 문제와 함께 저장됩니다. 같은 문서와 같은 문제는 한 번만 저장됩니다.
+
+    검색은 FTS5 색인을 씁니다. 한국어는 조사가 붙은 어절이 키워드와 일치하지 않으므로
+    추출 요약기와 같은 규칙(한글 글자 바이그램, 영어 소문자 단어)으로 색인하고
+    키워드도 같은 방식으로 나눠 구(phrase)로 검색합니다. 주제 열에 더 큰 가중치를 줍니다.
+    """
+    def __init__(self, path: str, enabled: bool = True) -> None:
+        self.path = path
+        self.enabled = enabled
+        self._local = threading.local()
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._setup()
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결을 반환합니다."""
+        return thread_connection(self._local, self.path)
+
+    def _setup(self) -> None:
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS question_sets (
+                id TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                content_type TEXT,
+                summary TEXT NOT NULL,
+                topics TEXT NOT NULL,
+                questions TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_question_sets_fingerprint ON question_sets (fingerprint, created_at)"
+        )
+        # rowid를 question_sets와 맞춰 검색 결과를 바로 조인
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS question_sets_fts USING fts5(topics, summary)")
+
+    @staticmethod
+    def index_terms(text: str) -> str:
+        """FTS5 색인용 공백 구분 색인어 문자열을 만듭니다."""
+        return " ".join(ExtractiveSummarizer.terms(text))
+
+    @staticmethod
+    def _match_phrase(word: str) -> str:
+        """
+        키워드 하나를 FTS5 구 검색식으로 바꿉니다.
+        조사가 붙은 한국어 키워드("광합성은")는 조사를 뗀 형태도 함께 찾습니다.
+        """
+        forms = [word]
+        particle = next((p for p in PARTICLES if word.endswith(p) and len(word) - len(p) >= 2), None)
+        if particle:
+            forms.append(word[:-len(particle)])
+        phrases = []
+        for form in forms:
+            terms = ExtractiveSummarizer.terms(form)
+            if terms:
+                phrases.append('"%s"' % " ".join(term.replace('"', '""') for term in terms))
+        return "(%s)" % " OR ".join(phrases) if phrases else ""
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        question_set = {key: row[key] for key in ("id", "fingerprint", "content_type", "summary", "created_at")}
+        question_set["topics"] = json.loads(row["topics"])
+        question_set["questions"] = json.loads(row["questions"])
+        return question_set
+
+    def add(
+        self,
+        fingerprint: str,
+        summary: str,
+        topics: List[str],
+        questions: List[Dict[str, Any]],
+        content_type: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        문제 세트를 저장합니다. 이미 같은 세트가 있으면 그대로 둡니다.
+
+        Returns:
+            문제 세트 ID (저장소가 꺼져 있으면 None)
+        """
+        if not self.enabled:
+            return None
+        set_id = make_cache_key(fingerprint, questions)[:16]
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(
+                """
+                INSERT OR IGNORE INTO question_sets
+                    (id, fingerprint, content_type, summary, topics, questions, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    set_id,
+                    fingerprint,
+                    content_type,
+                    summary,
+                    json.dumps(topics, ensure_ascii=False),
+                    json.dumps(questions, ensure_ascii=False),
+                    time.time()
+                )
+            )
+            if cursor.rowcount:
+                conn.execute(
+                    "INSERT INTO question_sets_fts (rowid, topics, summary) VALUES (?, ?, ?)",
+                    (cursor.lastrowid, self.index_terms(" ".join(topics)), self.index_terms(summary))
+                )
+        return set_id
+
+    def get(self, set_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 문제 세트를 조회합니다."""
+        if not self.enabled:
+            return None
+        row = self._connection().execute("SELECT * FROM question_sets WHERE id = ?", (set_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def find_by_fingerprint(self, fingerprint: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """같은 문서에서 만든 문제 세트를 최신순으로 반환합니다."""
+        if not self.enabled:
+            return []
+        rows = self._connection().execute(
+            "SELECT * FROM question_sets WHERE fingerprint = ? ORDER BY created_at DESC LIMIT ?",
+            (fingerprint, limit)
+        ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def latest(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """같은 문서의 가장 최근 문제 세트를 반환합니다."""
+        sets = self.find_by_fingerprint(fingerprint, limit=1)
+        return sets[0] if sets else None
+
+    def search(self, keyword: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        주제/요약에 키워드가 들어 있는 문제 세트를 관련도순으로 반환합니다.
+        공백으로 나뉜 여러 키워드는 모두 포함된 세트만 찾습니다.
+        """
+        if not self.enabled:
+            return []
+        phrases = [phrase for phrase in map(self._match_phrase, keyword.split()) if phrase]
+        if not phrases:
+            return []
+        rows = self._connection().execute(
+            """
+            SELECT question_sets.* FROM question_sets_fts
+            JOIN question_sets ON question_sets.rowid = question_sets_fts.rowid
+            WHERE question_sets_fts MATCH ?
+            ORDER BY bm25(question_sets_fts, 5.0, 1.0), question_sets.created_at DESC
+            LIMIT ?
+            """,
+            (" AND ".join(phrases), limit)
+        ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """저장된 문제 세트와 문서 수를 반환합니다."""
+        if not self.enabled:
+            return {"enabled": False}
+        row = self._connection().execute(
+            "SELECT COUNT(*) AS sets, COUNT(DISTINCT fingerprint) AS documents FROM question_sets"
+        ).fetchone()
+        return {"enabled": True, "sets": row["sets"], "documents": row["documents"]}
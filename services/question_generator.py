@@ -1,189 +1,809 @@
-from typing import Any, Dict, List
-import openai
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import chain, islice
+import hashlib
+import threading
+import unicodedata
 from config import get_config
+from services.llm_backends import LLMBackend, create_backend
+from services.deduplicator import Deduplicator
+from services.extractive_summarizer import ExtractiveSummarizer
+from services.text_chunker import TextChunker
+from services.tokenizer import get_encoding
+from services.token_budget import TokenBudget, UsageMeter, current_usage
+from utils.cache import PersistentCache, make_cache_key
+from services.question_schema import (
+    QUESTION_COUNT,
+    OPTION_KEYS,
+    normalize_feedback,
+    normalize_question,
+    normalize_summary,
+    question_id
+)
+from utils.json_stream import JsonArrayStream, is_truncated, loads_tolerant, strip_code_fences
+from utils.rate_limiter import RateLimiter
+from utils.resilience import ResilientCaller, CircuitBreaker
+from utils.logger import logger, log_error
+from utils.exceptions import QuestionGeneratorError, CircuitOpenError, ContentProcessingError
 import tiktoken
-import time
 import json
 
+# 진행 상황 콜백: (이벤트 이름, 데이터)
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+# 단계별 기본 모델 등급: 반복 호출되는 요약 단계는 빠르고 저렴한 모델,
+# 최종 문제 생성과 피드백은 고성능 모델을 사용
+STAGE_TIERS = {
+    "chunk_summary": "fast",
+    "reduce": "fast",
+    "summary": "fast",
+    "questions": "strong",
+    "feedback": "strong"
+}
+
+CHUNK_SUMMARY_TOKENS = 500  # 청크 요약 응답 한도
+
+class ContentFingerprint:
+    """
+    QuestionGenerator.fingerprint와 같은 해시를 텍스트 조각을 차례로 넣으며 계산합니다.
+    ("\n\n"으로 이어 붙인 전체 텍스트의 fingerprint와 같은 값)
+    """
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        self._started = False
+
+    def update(self, text: str) -> None:
+        words = unicodedata.normalize("NFC", text).split()
+        if not words:
+            return
+        if self._started:
+            self._hash.update(b" ")
+        self._hash.update(" ".join(words).encode("utf-8"))
+        self._started = True
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
 class QuestionGenerator:
     def __init__(self):
         config = get_config()
-        openai.api_key = config.OPENAI.API_KEY
-        openai.timeout = 60.0  # 타임아웃 설정 추가
-        self.model = config.OPENAI.MODEL
+        self.config = config
         self.max_tokens = config.OPENAI.MAX_TOKENS
         self.temperature = config.OPENAI.TEMPERATURE
-        self.encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
         self.chunk_size = 1000  # 청크 크기를 1000 토큰으로 줄임
+        # 토큰 인코딩과 분할기는 처음 쓸 때 불러옴 (워커 부팅 시간 단축)
+        self._chunker: Optional[TextChunker] = None
+        # 컨텍스트 윈도에 맞춘 입력/출력 한도 계산과 프로세스 전체 사용량 집계
+        self.budget = TokenBudget()
+        self.usage = UsageMeter()
+        # 긴 입력은 LLM 호출 전에 중요한 문장만 남겨 청크 수를 줄임 (선택 사항)
+        self.presummarizer = ExtractiveSummarizer(ratio=config.PRESUMMARY.RATIO)
+        # 페이지마다 반복되는 머리글/바닥글과 거의 같은 청크 제거
+        self.deduplicator = Deduplicator(
+            min_page_ratio=config.DEDUP.PAGE_RATIO,
+            similarity=config.DEDUP.SIMILARITY
+        )
+        self.max_concurrency = config.OPENAI.MAX_CONCURRENCY
+        # 고정 sleep 대신 RPM/TPM 한도에 맞춰 호출 속도를 조절
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=config.OPENAI.REQUESTS_PER_MINUTE,
+            tokens_per_minute=config.OPENAI.TOKENS_PER_MINUTE
+        )
+        # 백엔드별 인스턴스와 호출기 (기본 백엔드 외에는 처음 사용할 때 생성)
+        self.backend_name = config.LLM.BACKEND
+        self._backends: Dict[str, Tuple[LLMBackend, ResilientCaller]] = {}
+        self._backend_lock = threading.Lock()
+        self._backend(self.backend_name)
+        self.model = self.stage_model("questions")[1]
+        # 동일한 모델/프롬프트/파라미터 호출은 디스크 캐시에서 응답
+        self.cache = PersistentCache(
+            config.CACHE.PATH,
+            namespace="chat_completion",
+            max_entries=config.CACHE.MAX_ENTRIES,
+            ttl_seconds=config.CACHE.TTL_SECONDS,
+            enabled=config.CACHE.ENABLED
+        )
+        # 문서 단위 요약과 문제 세트 캐시
+        self.summary_cache = PersistentCache(
+            config.CACHE.PATH,
+            namespace="document_summary",
+            max_entries=config.CACHE.MAX_ENTRIES,
+            ttl_seconds=config.CACHE.TTL_SECONDS,
+            enabled=config.CACHE.ENABLED
+        )
+        self.question_cache = PersistentCache(
+            config.CACHE.PATH,
+            namespace="question_set",
+            max_entries=config.CACHE.MAX_ENTRIES,
+            ttl_seconds=config.CACHE.TTL_SECONDS,
+            enabled=config.CACHE.ENABLED
+        )
+        # 문제 ID별 보기 피드백 ({"A": "...", ...}), /feedback이 먼저 조회
+        self.feedback_cache = PersistentCache(
+            config.CACHE.PATH,
+            namespace="feedback_matrix",
+            max_entries=config.CACHE.MAX_ENTRIES,
+            ttl_seconds=config.CACHE.TTL_SECONDS,
+            enabled=config.CACHE.ENABLED
+        )
+        # 피드백 사전 생성용 백그라운드 스레드 (fork 이후 처음 사용할 때 생성)
+        self._feedback_executor: Optional[ThreadPoolExecutor] = None
+        self._feedback_pending: set = set()
+        self._feedback_lock = threading.Lock()
+
+    def _backend(self, name: str) -> Tuple[LLMBackend, ResilientCaller]:
+        """이름에 해당하는 백엔드와 재시도/서킷 브레이커 호출기를 반환합니다."""
+        with self._backend_lock:
+            if name not in self._backends:
+                backend = create_backend(name, self.config)
+                openai_config = self.config.OPENAI
+                # 429/5xx 재시도, 429 비율에 따른 동시성 조절, 장애 시 빠른 실패
+                caller = ResilientCaller(
+                    classify=backend.classify_error,
+                    retry_after=backend.retry_after,
+                    max_retries=openai_config.MAX_RETRIES,
+                    base_delay=openai_config.RETRY_BASE_DELAY,
+                    max_delay=openai_config.RETRY_MAX_DELAY,
+                    max_concurrency=openai_config.MAX_CONCURRENCY,
+                    breaker=CircuitBreaker(
+                        failure_threshold=openai_config.BREAKER_FAILURE_THRESHOLD,
+                        recovery_seconds=openai_config.BREAKER_RECOVERY_SECONDS
+                    )
+                )
+                self._backends[name] = (backend, caller)
+            return self._backends[name]
+
+    def stage_model(self, stage: str) -> Tuple[str, str]:
+        """
+        단계에 사용할 (백엔드 이름, 모델)을 반환합니다.
+
+        LLM_STAGE_MODELS에 "모델" 또는 "백엔드:모델"로 지정된 값이 우선하며,
+        없으면 단계 등급(fast/strong)에 맞는 기본 백엔드의 모델을 사용합니다.
+        """
+        spec = self.config.LLM.STAGE_MODELS.get(stage)
+        if spec:
+            if ":" in spec:
+                backend_name, model = spec.split(":", 1)
+                return backend_name, model
+            return self.backend_name, spec
+
+        backend, _ = self._backend(self.backend_name)
+        if STAGE_TIERS.get(stage, "strong") == "fast":
+            return self.backend_name, self.config.LLM.FAST_MODEL or backend.default_fast_model
+        return self.backend_name, self.config.LLM.STRONG_MODEL or backend.default_strong_model
+
+    @staticmethod
+    def fingerprint(content: str) -> str:
+        """유니코드와 공백을 정규화한 콘텐츠의 SHA-256 해시를 반환합니다."""
+        fingerprint = ContentFingerprint()
+        fingerprint.update(content)
+        return fingerprint.hexdigest()
+
+    def stats(self) -> Dict[str, Any]:
+        """백엔드별 재시도/속도 제한/서킷 브레이커 상태, 토큰 사용량, 캐시 통계를 반환합니다."""
+        return {
+            "api": {name: caller.stats() for name, (_, caller) in self._backends.items()},
+            "usage": self.usage.summary(),
+            "cache": {
+                "chat_completion": self.cache.stats(),
+                "document_summary": self.summary_cache.stats(),
+                "question_set": self.question_cache.stats(),
+                "feedback_matrix": self.feedback_cache.stats()
+            }
+        }
+
+    @property
+    def encoding(self) -> tiktoken.Encoding:
+        """프로세스 전체가 함께 쓰는 토큰 인코딩 (처음 쓸 때 저장소에 포함된 파일에서 불러옴)"""
+        return get_encoding()
+
+    @property
+    def chunker(self) -> TextChunker:
+        if self._chunker is None:
+            self._chunker = TextChunker(self.encoding)
+        return self._chunker
+
+    def warm_up(self) -> None:
+        """토큰 인코딩과 분할용 테이블을 미리 불러옵니다. (gunicorn preload 시 워커들이 공유)"""
+        self.chunker.warm_up()
 
     def count_tokens(self, text: str) -> int:
         """주어진 텍스트의 토큰 수를 계산합니다."""
         return len(self.encoding.encode(text))
 
+    def _record_usage(
+        self,
+        stage: str,
+        model: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cached: bool = False
+    ) -> None:
+        """호출 사용량을 프로세스 전체 집계와 현재 요청 계량기에 기록합니다."""
+        cost = self.budget.cost(model, prompt_tokens, completion_tokens)
+        for meter in (self.usage, current_usage()):
+            if meter is not None:
+                meter.record(stage, model, prompt_tokens, completion_tokens, cost, cached)
+
+    def _fit_input(self, text: str, stage: str, completion_tokens: int, overhead_tokens: int) -> str:
+        """
+        프롬프트 고정부와 응답 토큰을 뺀 입력 예산을 넘는 텍스트를 앞부분만 남기고 자릅니다.
+        """
+        _, model = self.stage_model(stage)
+        limit = self.budget.input_budget(model, completion_tokens, overhead_tokens)
+        if limit <= 0 or not self.chunker.exceeds(text, limit):
+            return text
+        logger.warning("input_trimmed", stage=stage, model=model, limit=limit)
+        return self.chunker.split(text, limit)[0]
+
+    def _chat_completion(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        use_cache: bool = True,
+        stage: str = "questions"
+    ) -> str:
+        """
+        단계에 맞는 백엔드/모델로 속도 제한을 지키며 호출하고 응답 본문을 반환합니다.
+
+        같은 (백엔드, 모델, 메시지, max_tokens, temperature) 조합은 캐시에서 응답하며,
+        use_cache=False이면 캐시를 건너뛰고 API를 호출합니다.
+        """
+        backend_name, model = self.stage_model(stage)
+        backend, caller = self._backend(backend_name)
+        prompt_tokens = self.count_tokens(prompt)
+        # 프롬프트 크기에 맞춰 응답 한도를 줄여 컨텍스트 초과 오류를 미리 막음
+        max_tokens = self.budget.completion_limit(model, prompt_tokens, max_tokens)
+        messages = [{"role": "user", "content": prompt}]
+        key = make_cache_key(backend_name, model, messages, max_tokens, temperature)
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._record_usage(stage, model, cached=True)
+                return cached
+
+        def request():
+            self.rate_limiter.acquire(prompt_tokens + max_tokens)
+            return backend.complete(model, messages, max_tokens, temperature)
+
+        content = caller.call(request)
+        self._record_usage(stage, model, prompt_tokens, self.count_tokens(content))
+        self.cache.set(key, content)
+        return content
+
+    def _chat_completion_stream(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        stage: str = "questions"
+    ) -> Iterator[str]:
+        """
+        _chat_completion의 스트리밍 버전으로, 응답 조각을 순서대로 내보냅니다.
+
+        캐시된 응답이 있으면 한 번에 내보내고, 스트림이 끝나면 전체 응답을 캐시합니다.
+        """
+        backend_name, model = self.stage_model(stage)
+        backend, caller = self._backend(backend_name)
+        prompt_tokens = self.count_tokens(prompt)
+        max_tokens = self.budget.completion_limit(model, prompt_tokens, max_tokens)
+        messages = [{"role": "user", "content": prompt}]
+        key = make_cache_key(backend_name, model, messages, max_tokens, temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._record_usage(stage, model, cached=True)
+            yield cached
+            return
+
+        def request():
+            self.rate_limiter.acquire(prompt_tokens + max_tokens)
+            stream = backend.stream(model, messages, max_tokens, temperature)
+            # 첫 조각까지 받아야 연결 오류가 드러남
+            return next(stream, None), stream
+
+        # 연결 단계만 재시도 (이미 내보낸 조각은 되돌릴 수 없음)
+        first, stream = caller.call(request)
+        parts = []
+        if first:
+            parts.append(first)
+            yield first
+        for delta in stream:
+            parts.append(delta)
+            yield delta
+        content = "".join(parts)
+        self._record_usage(stage, model, prompt_tokens, self.count_tokens(content))
+        self.cache.set(key, content)
+
+    def _chunk_limit(self) -> int:
+        """청크 크기. 청크 요약 모델의 컨텍스트 윈도가 작으면 그에 맞춰 줄입니다."""
+        _, model = self.stage_model("chunk_summary")
+        limit = self.budget.input_budget(
+            model,
+            CHUNK_SUMMARY_TOKENS,
+            self.count_tokens(self._build_chunk_prompt(""))
+        )
+        return max(1, min(self.chunk_size, limit))
+
     def split_text(self, text: str) -> List[str]:
         """텍스트를 토큰 제한에 맞게 나눕니다."""
-        chunks = []
-        current_chunk = []
-        current_length = 0
-        
-        # 문단 단위로 먼저 나누기
-        paragraphs = text.split('\n\n')
-        
-        for paragraph in paragraphs:
-            # 문단이 너무 길면 문장 단위로 나누기
-            if self.count_tokens(paragraph) > self.chunk_size:
-                sentences = paragraph.split('. ')
-                for sentence in sentences:
-                    sentence = sentence.strip() + '. '
-                    sentence_tokens = self.count_tokens(sentence)
-                    
-                    # 문장이 chunk_size를 초과하면 단어 단위로 나누기
-                    if sentence_tokens > self.chunk_size:
-                        words = sentence.split()
-                        temp_chunk = []
-                        temp_length = 0
-                        for word in words:
-                            word_tokens = self.count_tokens(word + ' ')
-                            if temp_length + word_tokens > self.chunk_size:
-                                chunks.append(' '.join(temp_chunk))
-                                temp_chunk = [word]
-                                temp_length = word_tokens
-                            else:
-                                temp_chunk.append(word)
-                                temp_length += word_tokens
-                        if temp_chunk:
-                            chunks.append(' '.join(temp_chunk))
-                    else:
-                        if current_length + sentence_tokens > self.chunk_size:
-                            chunks.append(''.join(current_chunk))
-                            current_chunk = [sentence]
-                            current_length = sentence_tokens
-                        else:
-                            current_chunk.append(sentence)
-                            current_length += sentence_tokens
-            else:
-                paragraph_tokens = self.count_tokens(paragraph)
-                if current_length + paragraph_tokens > self.chunk_size:
-                    chunks.append(''.join(current_chunk))
-                    current_chunk = [paragraph]
-                    current_length = paragraph_tokens
-                else:
-                    current_chunk.append(paragraph)
-                    current_length += paragraph_tokens
-        
-        if current_chunk:
-            chunks.append(''.join(current_chunk))
-        
-        return chunks
+        return self.chunker.split(text, self._chunk_limit())
+
+    def _build_chunk_prompt(self, chunk: str) -> str:
+        """청크 요약 프롬프트를 만듭니다."""
+        return f"""다음 텍스트 조각을 간단히 요약하고 주요 주제를 추출해주세요.
+        반드시 아래 JSON 형식으로 작성해주세요:
+
+        {{
+            "요약": "2-3문장으로 된 간단한 요약",
+            "핵심 주제": ["주제1", "주제2"]
+        }}
+
+        텍스트:
+        \"\"\"{chunk}\"\"\"
+        """
+
+    def _request_summary(self, prompt: str, max_tokens: int, stage: str) -> Optional[Dict[str, Any]]:
+        """
+        요약 응답을 관대하게 해석하고 형식을 검사합니다.
+
+        고쳐도 해석할 수 없는 응답이면 캐시를 건너뛰고 한 번만 다시 요청합니다.
+        응답 한도에 걸려 잘린 응답은 닫아서 해석하면 요약이 반쪽 문장이므로 실패로 보고,
+        한도를 두 배로 늘려 다시 요청합니다.
+        """
+        for use_cache in (True, False):
+            result = self._chat_completion(
+                prompt,
+                max_tokens=max_tokens,
+                temperature=0.3,  # 더 일관된 결과를 위해 온도 낮춤
+                use_cache=use_cache,
+                stage=stage
+            )
+            truncated = is_truncated(result)
+            try:
+                parsed = None if truncated else normalize_summary(loads_tolerant(result))
+            except json.JSONDecodeError:
+                parsed = None
+            if parsed is not None:
+                return parsed
+            logger.warning("invalid_model_output", stage=stage, truncated=truncated, will_retry=use_cache)
+            if truncated:
+                max_tokens *= 2
+        return None
+
+    def _summarize_chunk(self, chunk: str) -> Optional[Dict[str, Any]]:
+        """텍스트 조각 하나를 요약합니다. 실패하면 None을 반환합니다."""
+        prompt = self._build_chunk_prompt(chunk)
 
-    def generate_summary_and_topics(self, content: str) -> str:
-        """콘텐츠를 요약하고 핵심 주제를 추출합니다."""
         try:
-            # 텍스트가 너무 길면 나누어 처리
-            if self.count_tokens(content) > self.chunk_size:
-                chunks = self.split_text(content)
-                summaries = []
-                all_topics = set()
-                
-                for i, chunk in enumerate(chunks):
-                    # API 호출 간 딜레이 추가
-                    if i > 0:
-                        time.sleep(1)  # 1초 대기
-                    
-                    prompt = f"""다음 텍스트 조각을 간단히 요약하고 주요 주제를 추출해주세요.
-                    반드시 아래 JSON 형식으로 작성해주세요:
-
-                    {{
-                        "요약": "2-3문장으로 된 간단한 요약",
-                        "핵심 주제": ["주제1", "주제2"]
-                    }}
+            # 토큰 수 제한
+            return self._request_summary(prompt, CHUNK_SUMMARY_TOKENS, "chunk_summary")
+        except CircuitOpenError:
+            # 장애 중에는 나머지 청크도 실패하므로 요청 전체를 빠르게 실패시킴
+            raise
+        except Exception as e:
+            # 재시도 후에도 실패한 청크는 건너뛰고 기록만 남김
+            log_error(e, {"stage": "chunk_summary"})
+            return None
 
-                    텍스트:
-                    \"\"\"{chunk}\"\"\"
-                    """
-
-                    try:
-                        response = openai.ChatCompletion.create(
-                            model=self.model,
-                            messages=[{"role": "user", "content": prompt}],
-                            max_tokens=500,  # 토큰 수 제한
-                            temperature=0.3  # 더 일관된 결과를 위해 온도 낮춤
-                        )
-                        
-                        result = response.choices[0].message['content']
-                        parsed = json.loads(result)
-                        summaries.append(parsed["요약"])
-                        all_topics.update(parsed["핵심 주제"])
-                    except Exception as e:
-                        continue
-                
-                # 최종 요약 생성 (3초 대기 후)
-                time.sleep(3)
-                
-                # 요약문들을 더 작은 청크로 나누어 처리
-                combined_summary = " ".join(summaries)
-                if self.count_tokens(combined_summary) > self.chunk_size:
-                    summary_chunks = self.split_text(combined_summary)
-                    final_summary = []
-                    for chunk in summary_chunks:
-                        prompt = f"""다음 요약을 2-3문장으로 압축해주세요:
-
-                        {chunk}
-                        """
-                        response = openai.ChatCompletion.create(
-                            model=self.model,
-                            messages=[{"role": "user", "content": prompt}],
-                            max_tokens=200,
-                            temperature=0.3
-                        )
-                        final_summary.append(response.choices[0].message['content'])
-                        time.sleep(1)
-                    
-                    final_text = " ".join(final_summary)
-                else:
-                    final_text = combined_summary
-
-                return json.dumps({
-                    "요약": final_text,
-                    "핵심 주제": list(all_topics)[:5]  # 상위 5개 주제만 선택
-                }, ensure_ascii=False)
-            
-            # 텍스트가 충분히 짧으면 바로 처리
-            prompt = f"""다음 콘텐츠를 요약하고 핵심 주제를 추출해주세요.
-            반드시 아래 JSON 형식으로 작성해주세요:
-
-            {{
-                "요약": "여기에 전체 내용 요약을 작성",
-                "핵심 주제": ["주제1", "주제2", "주제3"]
-            }}
-
-            분석할 콘텐츠:
-            \"\"\"{content}\"\"\"
-            """
-
-            response = openai.ChatCompletion.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.3
+    def _pack_chunks(self, chunks: Iterable[str]) -> Iterator[List[str]]:
+        """
+        연속된 청크를 LLM_BATCH_CHUNKS개, LLM_BATCH_TOKENS 토큰 이하로 묶어 차례로 내보냅니다.
+
+        배치 모드가 꺼져 있으면(LLM_BATCH_CHUNKS=1) 청크마다 하나의 묶음을 만듭니다.
+        """
+        max_chunks = self.config.LLM.BATCH_CHUNKS
+        if max_chunks <= 1:
+            yield from ([chunk] for chunk in chunks)
+            return
+
+        # 묶음 전체와 청크별 응답이 컨텍스트 윈도에 들어가도록 토큰 한도를 줄임
+        _, model = self.stage_model("chunk_summary")
+        max_tokens = min(
+            self.config.LLM.BATCH_TOKENS,
+            self.budget.input_budget(
+                model,
+                CHUNK_SUMMARY_TOKENS * max_chunks,
+                self.count_tokens(self._build_batch_prompt([]))
             )
-            
-            return response.choices[0].message['content']
-            
+        )
+        current: List[str] = []
+        current_tokens = 0
+        for chunk in chunks:
+            tokens = self.chunker.estimate_tokens(chunk)
+            if current and (len(current) >= max_chunks or current_tokens + tokens > max_tokens):
+                yield current
+                current = []
+                current_tokens = 0
+            current.append(chunk)
+            current_tokens += tokens
+        if current:
+            yield current
+
+    def _build_batch_prompt(self, chunks: List[str]) -> str:
+        """여러 청크를 한 번에 요약하는 프롬프트를 만듭니다."""
+        sections = "\n\n".join(
+            f"[조각 {number}]\n\"\"\"{chunk}\"\"\""
+            for number, chunk in enumerate(chunks, start=1)
+        )
+        return f"""다음 텍스트 조각들을 각각 간단히 요약하고 주요 주제를 추출해주세요.
+        반드시 조각 순서대로 아래 JSON 배열 형식으로만 작성해주세요:
+
+        [
+            {{"번호": 1, "요약": "2-3문장으로 된 간단한 요약", "핵심 주제": ["주제1", "주제2"]}},
+            {{"번호": 2, "요약": "2-3문장으로 된 간단한 요약", "핵심 주제": ["주제1", "주제2"]}}
+        ]
+
+        {sections}
+        """
+
+    @staticmethod
+    def _parse_batch(result: str, count: int) -> List[Optional[Dict[str, Any]]]:
+        """
+        배치 응답에서 청크별 요약을 꺼냅니다. 형식이 잘못된 항목은 None으로 둡니다.
+
+        응답 앞뒤의 설명 문장, {"results": [...]} 형태, 번호가 빠지거나 뒤섞인 항목을 허용합니다.
+        잘린 응답은 끝까지 닫힌 항목만 쓰고, 쓰다 만 마지막 항목은 None으로 두어 다시 요청하게 합니다.
+        """
+        if is_truncated(result):
+            parsed = JsonArrayStream().feed(strip_code_fences(result))
+        else:
+            try:
+                parsed = loads_tolerant(result)
+            except json.JSONDecodeError:
+                parsed = None
+        if isinstance(parsed, dict):
+            parsed = next((value for value in parsed.values() if isinstance(value, list)), None)
+        if not isinstance(parsed, list):
+            return [None] * count
+
+        items: List[Optional[Dict[str, Any]]] = [None] * count
+        for position, item in enumerate(parsed):
+            summary = normalize_summary(item)
+            if summary is None:
+                continue
+            number = item.get("번호")
+            index = number - 1 if isinstance(number, int) and 1 <= number <= count else position
+            if index < count and items[index] is None:
+                items[index] = summary
+        return items
+
+    def _summarize_batch(self, chunks: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        청크 묶음을 한 번의 호출로 요약합니다.
+
+        배치 호출이 실패하거나 일부 항목을 해석할 수 없으면 해당 청크만 개별 호출로 다시 요약합니다.
+        """
+        if len(chunks) == 1:
+            return [self._summarize_chunk(chunks[0])]
+
+        try:
+            result = self._chat_completion(
+                self._build_batch_prompt(chunks),
+                max_tokens=CHUNK_SUMMARY_TOKENS * len(chunks),
+                temperature=0.3,
+                stage="chunk_summary"
+            )
+            items = self._parse_batch(result, len(chunks))
+        except CircuitOpenError:
+            raise
         except Exception as e:
-            raise Exception(f"요약 생성 중 오류 발생: {str(e)}")
+            log_error(e, {"stage": "chunk_summary_batch", "chunks": len(chunks)})
+            items = [None] * len(chunks)
 
-    def generate_questions(self, summary: str, topics: List[str]) -> str:
+        missing = [index for index, item in enumerate(items) if item is None]
+        if missing:
+            logger.warning("batch_fallback", chunks=len(chunks), missing=len(missing))
+        for index in missing:
+            items[index] = self._summarize_chunk(chunks[index])
+        return items
+
+    def _group_summaries(self, level: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
         """
-        요약과 주제를 바탕으로 핵심 개념 선택 문제를 생성합니다.
-        
+        요약 목록을 청크 크기 예산 안에서 순서대로 묶습니다.
+
+        단계마다 개수가 최소 절반으로 줄도록 한 묶음에 두 개 이상을 넣습니다.
+        """
+        groups = []
+        current = []
+        current_tokens = 0
+        for item in level:
+            tokens = self.chunker.estimate_tokens(item["요약"])
+            if len(current) >= 2 and current_tokens + tokens > self.chunk_size:
+                groups.append(current)
+                current = []
+                current_tokens = 0
+            current.append(item)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    def _merge_summaries(self, group: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 요약과 주제 목록을 하나의 요약과 주제 목록으로 합칩니다."""
+        topics = {}
+        for item in group:
+            topics.update(dict.fromkeys(item["핵심 주제"]))
+        topics = list(topics)
+
+        if len(group) == 1 and not self.chunker.exceeds(group[0]["요약"], self.chunk_size):
+            return group[0]
+
+        summaries_str = "\n".join(f"- {item['요약']}" for item in group)
+        topics_str = ", ".join(topics)
+        prompt = f"""다음 요약들을 2-3문장으로 압축하고, 주제 목록에서 가장 중요한 주제를 골라주세요.
+        반드시 아래 JSON 형식으로 작성해주세요:
+
+        {{
+            "요약": "2-3문장으로 압축한 요약",
+            "핵심 주제": ["주제1", "주제2", "주제3"]
+        }}
+
+        [요약]
+        {summaries_str}
+
+        [주제 목록]
+        {topics_str}
+        """
+
+        for use_cache, max_tokens in ((True, 300), (False, 600)):
+            result = self._chat_completion(
+                prompt, max_tokens=max_tokens, temperature=0.3, use_cache=use_cache, stage="reduce"
+            )
+            if not is_truncated(result):
+                break
+            logger.warning("invalid_model_output", stage="reduce", truncated=True, will_retry=use_cache)
+        else:
+            # 다시 요청해도 잘리면 반쪽 문장 대신 압축 전 요약들을 그대로 이어 붙임
+            return {"요약": " ".join(item["요약"] for item in group), "핵심 주제": topics}
+        try:
+            parsed = normalize_summary(loads_tolerant(result))
+        except json.JSONDecodeError:
+            parsed = None
+        if parsed is None:
+            # JSON이 아니면 응답 전체를 요약으로 쓰고 주제는 그대로 합침
+            return {"요약": strip_code_fences(result).strip(), "핵심 주제": topics}
+        return parsed
+
+    def generate_summary_and_topics(
+        self,
+        content: str,
+        progress: Optional[ProgressCallback] = None,
+        pages: Optional[List[str]] = None
+    ) -> str:
+        """
+        콘텐츠를 요약하고 핵심 주제를 추출합니다.
+
+        이미 요약한 문서(정규화 해시 기준)는 캐시된 결과를 그대로 반환합니다.
+
         Args:
-            summary: 콘텐츠 요약
-            topics: 핵심 주제 리스트
-            
+            content: 요약할 콘텐츠
+            progress: 청크 요약/축약 단계가 끝날 때마다 호출되는 콜백
+            pages: PDF의 페이지별 텍스트 (있으면 페이지마다 반복되는 머리글/바닥글을 지움)
+        """
+        document_key = self.fingerprint(content)
+        cached = self.summary_cache.get(document_key)
+        if cached is not None:
+            return cached
+
+        result = self._summarize_document(content, progress, pages)
+        self._cache_summary(document_key, result)
+        return result
+
+    def _cache_summary(self, document_key: str, result: str) -> None:
+        try:
+            parsed = json.loads(result)
+        except json.JSONDecodeError:
+            # 형식이 잘못된 응답은 캐시하지 않음
+            return
+        if isinstance(parsed, dict) and '요약' in parsed and '핵심 주제' in parsed:
+            self.summary_cache.set(document_key, result)
+
+    def summarize_pages(
+        self,
+        pages: Iterable[str],
+        progress: Optional[ProgressCallback] = None
+    ) -> str:
+        """
+        페이지 스트림을 추출과 동시에 요약합니다.
+
+        페이지 → 반복 줄 제거 → 스트리밍 청크 분할 → 중복 청크 제거 → 묶음 요약이
+        제너레이터로 이어져 있어, 뒤쪽 페이지를 추출하는 동안 앞쪽 청크의 요약 요청이 나갑니다.
+        요약 대기 중인 묶음이 max_concurrency * 2개를 넘으면 추출이 멈추므로 메모리는
+        문서 길이에 비례해 늘지 않습니다. 전체 텍스트가 필요한 사전 요약(PRESUMMARY)은 적용하지 않습니다.
+        결과는 이어 붙인 전체 텍스트의 fingerprint로 요약 캐시에 저장합니다.
+
         Returns:
-            JSON 형식의 질문 목록
+            요약 JSON 문자열
+        """
+        fingerprint = ContentFingerprint()
+        dedup_enabled = self.config.DEDUP.ENABLED
+        dedup_stats = {"removed_lines": 0, "removed_chunks": 0, "removed_characters": 0}
+
+        def observed(pages: Iterable[str]) -> Iterator[str]:
+            for page in pages:
+                fingerprint.update(page)
+                yield page
+
+        try:
+            stream: Iterable[str] = observed(pages)
+            if dedup_enabled:
+                stream = self.deduplicator.iter_strip_repeated_lines(stream, dedup_stats)
+            chunks: Iterable[str] = self.chunker.iter_split(stream, self._chunk_limit())
+            if dedup_enabled:
+                chunks = self.deduplicator.iter_unique_chunks(chunks, dedup_stats)
+
+            # 청크가 하나뿐인 짧은 문서는 전체 요약 한 번으로 처리
+            chunks = iter(chunks)
+            head = list(islice(chunks, 2))
+            if not head:
+                raise ContentProcessingError("처리된 콘텐츠가 없습니다.")
+            if len(head) == 1 and not self.chunker.exceeds(head[0], self.chunk_size):
+                self._report_dedup(dedup_stats, progress)
+                result = self._summarize_short(head[0])
+            else:
+                results = self._map_batches(self._pack_chunks(chain(head, chunks)), progress)
+                self._report_dedup(dedup_stats, progress)
+                result = self._reduce([parsed for parsed in results if parsed is not None], progress)
+        except QuestionGeneratorError:
+            raise
+        except Exception as e:
+            raise Exception(f"요약 생성 중 오류 발생: {str(e)}")
+
+        self._cache_summary(fingerprint.hexdigest(), result)
+        return result
+
+    def _condense(self, content: str, progress: Optional[ProgressCallback] = None) -> str:
+        """사전 요약이 켜져 있고 입력이 충분히 길면 추출 요약으로 줄입니다."""
+        presummary = self.config.PRESUMMARY
+        if not presummary.ENABLED or not self.chunker.exceeds(content, presummary.MIN_TOKENS):
+            return content
+
+        condensed, stats = self.presummarizer.condense(content)
+        logger.info("content_condensed", **stats)
+        if progress:
+            progress("condensed", stats)
+        return condensed
+
+    def _report_dedup(self, stats: Dict[str, int], progress: Optional[ProgressCallback] = None) -> None:
+        if not any(stats.values()):
+            return
+        logger.info("content_deduplicated", **stats)
+        if progress:
+            progress("deduplicated", stats)
+
+    def _map_batches(
+        self,
+        batches: Iterable[List[str]],
+        progress: Optional[ProgressCallback] = None,
+        total: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
         """
+        청크 묶음을 병렬로 요약하고 결과를 청크 순서대로 반환합니다.
+
+        대기 중이거나 실행 중인 묶음은 max_concurrency * 2개까지만 허용하므로, 묶음을 만드는 쪽
+        (스트리밍 추출)이 요약보다 빠르면 여기서 기다립니다.
+
+        Args:
+            total: 진행 이벤트에 보낼 전체 청크 수 (스트리밍에서는 알 수 없어 None)
+        """
+        slots = threading.BoundedSemaphore(self.max_concurrency * 2)
+        completed = {"count": 0}
+        lock = threading.Lock()
+
+        def done(future: Future) -> None:
+            slots.release()
+            if not progress or future.exception() is not None:
+                return
+            for parsed in future.result():
+                with lock:
+                    completed["count"] += 1
+                    count = completed["count"]
+                progress("chunk_summarized", {"completed": count, "total": total, "failed": parsed is None})
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for batch in batches:
+                slots.acquire()
+                # 요청별 사용량 계량기가 워커 스레드로 전달되도록 컨텍스트를 복사
+                future = executor.submit(copy_context().run, self._summarize_batch, batch)
+                future.add_done_callback(done)
+                futures.append(future)
+        return [parsed for future in futures for parsed in future.result()]
+
+    def _reduce(self, level: List[Dict[str, Any]], progress: Optional[ProgressCallback] = None) -> str:
+        """청크 요약들을 단계별로 축약해 최종 요약 JSON을 만듭니다."""
+        # 합친 요약이 청크 크기를 넘으면 단계별로 묶어서 병렬 축약
+        while len(level) > 1 and self.chunker.exceeds(
+            " ".join(item["요약"] for item in level), self.chunk_size
+        ):
+            groups = self._group_summaries(level)
+            workers = min(self.max_concurrency, len(groups))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(copy_context().run, self._merge_summaries, group)
+                    for group in groups
+                ]
+                level = [future.result() for future in futures]
+            if progress:
+                progress("summaries_reduced", {"remaining": len(level)})
+
+        if len(level) == 1 and self.chunker.exceeds(level[0]["요약"], self.chunk_size):
+            level = [self._merge_summaries(level)]
+
+        all_topics = {}
+        for item in level:
+            all_topics.update(dict.fromkeys(item["핵심 주제"]))
+
+        return json.dumps({
+            "요약": " ".join(item["요약"] for item in level),
+            "핵심 주제": list(all_topics)[:5]  # 상위 5개 주제만 선택
+        }, ensure_ascii=False)
+
+    def _summarize_short(self, content: str) -> str:
+        """청크로 나눌 필요가 없는 짧은 콘텐츠를 한 번에 요약합니다."""
+        prompt = f"""다음 콘텐츠를 요약하고 핵심 주제를 추출해주세요.
+        반드시 아래 JSON 형식으로 작성해주세요:
+
+        {{
+            "요약": "여기에 전체 내용 요약을 작성",
+            "핵심 주제": ["주제1", "주제2", "주제3"]
+        }}
+
+        분석할 콘텐츠:
+        \"\"\"{content}\"\"\"
+        """
+
+        parsed = self._request_summary(prompt, 500, "summary")
+        if parsed is None:
+            raise QuestionGeneratorError(
+                message="잘못된 요약 데이터 형식입니다.",
+                error_code="INVALID_SUMMARY_FORMAT"
+            )
+        return json.dumps(parsed, ensure_ascii=False)
+
+    def _summarize_document(
+        self,
+        content: str,
+        progress: Optional[ProgressCallback] = None,
+        pages: Optional[List[str]] = None
+    ) -> str:
+        """문서 전체에 대해 청크 요약과 통합 요약을 수행합니다."""
+        try:
+            dedup_enabled = self.config.DEDUP.ENABLED
+            dedup_stats = {"removed_lines": 0, "removed_chunks": 0, "removed_characters": 0}
+            # 반복 줄 제거는 실제 페이지 경계가 있는 PDF에만 적용 (빈 줄로 나눈 문단은 페이지가 아님)
+            if dedup_enabled and pages:
+                content, line_stats = self.deduplicator.strip_repeated_lines(pages)
+                dedup_stats.update(line_stats)
+
+            content = self._condense(content, progress)
+
+            # 텍스트가 충분히 짧으면 바로 처리
+            if not self.chunker.exceeds(content, self.chunk_size):
+                self._report_dedup(dedup_stats, progress)
+                return self._summarize_short(content)
+
+            # 텍스트가 너무 길면 나누어 처리
+            chunks = self.split_text(content)
+            if dedup_enabled:
+                chunks, chunk_stats = self.deduplicator.drop_duplicate_chunks(chunks)
+                dedup_stats["removed_chunks"] = chunk_stats["removed_chunks"]
+                dedup_stats["removed_characters"] += chunk_stats["removed_characters"]
+            self._report_dedup(dedup_stats, progress)
+            # 청크 요약을 병렬로 실행하되 결과는 청크 순서대로 받음
+            # (배치 모드에서는 작은 청크 여러 개를 한 요청으로 묶음)
+            results = self._map_batches(self._pack_chunks(chunks), progress, len(chunks))
+            return self._reduce([parsed for parsed in results if parsed is not None], progress)
+
+        except QuestionGeneratorError:
+            raise
+        except Exception as e:
+            raise Exception(f"요약 생성 중 오류 발생: {str(e)}")
+
+    def _build_question_prompt(self, summary: str, topics: List[str]) -> str:
+        """문제 생성 프롬프트를 만듭니다."""
         topics_str = "\n".join([f"- {topic}" for topic in topics])
         prompt = f"""당신은 교육 전문가이자 개념 분류에 능한 평가 디자이너입니다.
         주어진 요약문과 핵심 주제를 바탕으로 3개의 서로 다른 핵심 개념을 평가하는 문제를 생성해주세요.
@@ -253,17 +873,256 @@ class QuestionGenerator:
         [핵심 주제]
         {topics_str}
         """
+        return prompt
+
+    def _fit_question_summary(self, summary: str, topics: List[str]) -> str:
+        """문제 생성 프롬프트가 컨텍스트 윈도에 들어가도록 요약문을 자릅니다."""
+        overhead = self.count_tokens(self._build_question_prompt("", topics))
+        return self._fit_input(summary, "questions", self.max_tokens, overhead)
+
+    def _parse_questions(self, content: str, exclude: Collection[str] = ()) -> List[Dict[str, Any]]:
+        """
+        문제 생성 응답에서 스키마에 맞는 문제만 꺼냅니다.
+
+        잘린 응답에서도 완성된 문제는 건지며, ID가 exclude에 있는 문제(스트림에서 이미 보낸 문제)와
+        응답 안에서 중복된 문제는 건너뜁니다. (스트림 파서가 버린 항목이 있으면 순서로는 맞출 수 없음)
+        """
+        try:
+            data = loads_tolerant(content)
+        except json.JSONDecodeError:
+            data = None
+        items = data.get("questions") if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            items = JsonArrayStream("questions").feed(strip_code_fences(content))
 
-        response = openai.ChatCompletion.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
+        valid = [self._with_id(question) for question in map(normalize_question, items) if question]
+        if len(valid) < len(items):
+            logger.warning("invalid_questions_dropped", dropped=len(items) - len(valid))
+        seen = set(exclude)
+        questions = []
+        for question in valid:
+            if question["id"] not in seen:
+                seen.add(question["id"])
+                questions.append(question)
+        return questions
+
+    def _request_missing_questions(
+        self,
+        summary: str,
+        topics: List[str],
+        existing: List[Dict[str, Any]],
+        count: int
+    ) -> List[Dict[str, Any]]:
+        """부족한 문제 수만큼만 다시 요청합니다. (이미 받은 문제와 겹치지 않도록 안내)"""
+        logger.warning("questions_incomplete", received=len(existing), missing=count)
+        existing_str = "\n".join(f"- {question['질문']}" for question in existing) or "- (없음)"
+        prompt = self._build_question_prompt(summary, topics) + f"""
+        [이미 생성된 문제]
+        {existing_str}
+
+        위 문제와 겹치지 않는 다른 핵심 개념으로 {count}개의 문제만 같은 JSON 형식으로 작성해주세요.
+        """
+        content = self._chat_completion(
+            prompt,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            stage="questions"
+        )
+        return self._parse_questions(content)[:count]
+
+    def generate_questions(self, summary: str, topics: List[str]) -> str:
+        """
+        요약과 주제를 바탕으로 핵심 개념 선택 문제를 생성합니다.
+        
+        Args:
+            summary: 콘텐츠 요약
+            topics: 핵심 주제 리스트
+            
+        Returns:
+            JSON 형식의 질문 목록
+        """
+        summary = self._fit_question_summary(summary, topics)
+        question_key = make_cache_key(summary, topics)
+        cached = self.question_cache.get(question_key)
+        if cached is not None:
+            self.schedule_feedback(json.loads(cached)["questions"])
+            return cached
+
+        content = self._chat_completion(
+            self._build_question_prompt(summary, topics),
             max_tokens=self.max_tokens,
             temperature=self.temperature
         )
         
-        # 응답을 JSON 객체로 파싱하여 반환
-        result = json.loads(response.choices[0].message['content'])
-        return json.dumps(result, ensure_ascii=False)
+        # 응답을 관대하게 파싱하고, 형식이 맞지 않거나 잘려서 빠진 문제만 다시 요청
+        questions = self._parse_questions(content)
+        if len(questions) < QUESTION_COUNT:
+            questions += self._request_missing_questions(
+                summary, topics, questions, QUESTION_COUNT - len(questions)
+            )
+        if not questions:
+            raise QuestionGeneratorError(
+                message="잘못된 질문 데이터 형식입니다.",
+                error_code="INVALID_QUESTIONS_FORMAT"
+            )
+
+        result = json.dumps({"questions": questions}, ensure_ascii=False)
+        if len(questions) >= QUESTION_COUNT:
+            self.question_cache.set(question_key, result)
+        self.schedule_feedback(questions)
+        return result
+
+    def generate_questions_stream(self, summary: str, topics: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        generate_questions의 스트리밍 버전으로, 문제가 완성되는 대로 하나씩 내보냅니다.
+
+        Args:
+            summary: 콘텐츠 요약
+            topics: 핵심 주제 리스트
+
+        Yields:
+            파싱이 끝난 문제 객체
+        """
+        summary = self._fit_question_summary(summary, topics)
+        question_key = make_cache_key(summary, topics)
+        cached = self.question_cache.get(question_key)
+        if cached is not None:
+            questions = json.loads(cached)["questions"]
+            self.schedule_feedback(questions)
+            yield from questions
+            return
+
+        stream = JsonArrayStream("questions")
+        parts = []
+        questions = []
+        for delta in self._chat_completion_stream(
+            self._build_question_prompt(summary, topics),
+            max_tokens=self.max_tokens,
+            temperature=self.temperature
+        ):
+            parts.append(delta)
+            for item in stream.feed(delta):
+                question = normalize_question(item)
+                if question:
+                    question = self._with_id(question)
+                    questions.append(question)
+                    yield question
+
+        # 스트림 도중 꺼내지 못한 문제(잘린 응답 등)를 건지고, 부족한 문제만 다시 요청
+        remaining = self._parse_questions("".join(parts), exclude={question["id"] for question in questions})
+        if len(questions) + len(remaining) < QUESTION_COUNT:
+            remaining += self._request_missing_questions(
+                summary, topics, questions + remaining, QUESTION_COUNT - len(questions) - len(remaining)
+            )
+        for question in remaining:
+            questions.append(question)
+            yield question
+
+        if not questions:
+            raise QuestionGeneratorError(
+                message="잘못된 질문 데이터 형식입니다.",
+                error_code="INVALID_QUESTIONS_FORMAT"
+            )
+        if len(questions) >= QUESTION_COUNT:
+            self.question_cache.set(question_key, json.dumps({"questions": questions}, ensure_ascii=False))
+        self.schedule_feedback(questions)
+
+    @staticmethod
+    def _with_id(question: Dict[str, Any]) -> Dict[str, Any]:
+        """/feedback에서 미리 만든 피드백을 찾을 수 있도록 문제 ID를 붙입니다."""
+        return {**question, "id": question_id(question)}
+
+    def schedule_feedback(self, questions: List[Dict[str, Any]]) -> None:
+        """
+        FEEDBACK_PRECOMPUTE가 켜져 있으면 아직 피드백이 없는 문제들의
+        보기별 피드백을 백그라운드에서 한 번의 호출로 생성합니다.
+        """
+        if not self.config.FEEDBACK.PRECOMPUTE:
+            return
+        with self._feedback_lock:
+            missing = [
+                question for question in questions
+                if question.get("id")
+                and question["id"] not in self._feedback_pending
+                and self.feedback_cache.get(question["id"]) is None
+            ]
+            if not missing:
+                return
+            self._feedback_pending.update(question["id"] for question in missing)
+            if self._feedback_executor is None:
+                self._feedback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="feedback")
+            self._feedback_executor.submit(self._precompute_feedback, missing)
+
+    def _build_feedback_matrix_prompt(self, questions: List[Dict[str, Any]]) -> str:
+        """문제 세트의 모든 보기에 대한 피드백을 한 번에 요청하는 프롬프트를 만듭니다."""
+        blocks = []
+        for number, question in enumerate(questions, start=1):
+            options = "\n".join(
+                f"  {key}. {question['보기'][key]['질문']} (근접도 {question['보기'][key]['근접도']})"
+                for key in OPTION_KEYS
+            )
+            blocks.append(
+                f"[문제 {number}] {question['질문']}\n{options}\n  정답: {question['정답']}\n"
+                f"  해설: {question['해설']['정답_설명']} {question['해설']['오답_설명']}"
+            )
+        questions_str = "\n\n".join(blocks)
+        return f"""다음 문제들에서 학습자가 각 보기(A~E)를 골랐을 때 보여줄 피드백을 작성해주세요.
+        정답과 고른 보기의 근접도 차이를 바탕으로 친절하고 교육적인 피드백을 2-3문장으로 작성하고,
+        정답을 고른 경우에는 잘한 점과 핵심 개념을 짚어주세요.
+        반드시 아래 JSON 형식으로 작성해주세요:
+
+        {{
+            "feedback": [
+                {{"번호": 1, "A": "피드백", "B": "피드백", "C": "피드백", "D": "피드백", "E": "피드백"}}
+            ]
+        }}
+
+        {questions_str}
+        """
+
+    def _precompute_feedback(self, questions: List[Dict[str, Any]]) -> None:
+        """보기별 피드백을 생성해 문제 ID별로 저장합니다. 빠진 보기는 /feedback이 실시간으로 생성합니다."""
+        try:
+            content = self._chat_completion(
+                self._build_feedback_matrix_prompt(questions),
+                max_tokens=self.config.FEEDBACK.TOKENS_PER_CHOICE * len(OPTION_KEYS) * len(questions),
+                temperature=self.temperature,
+                stage="feedback"
+            )
+            data = loads_tolerant(content)
+            items = data.get("feedback") if isinstance(data, dict) else data
+            if not isinstance(items, list):
+                items = []
+            stored = 0
+            for position, item in enumerate(items):
+                if not isinstance(item, dict):
+                    continue
+                number = item.get("번호")
+                index = number - 1 if isinstance(number, int) and 1 <= number <= len(questions) else position
+                feedback = normalize_feedback(item)
+                if index < len(questions) and feedback:
+                    self.feedback_cache.set(questions[index]["id"], json.dumps(feedback, ensure_ascii=False))
+                    stored += 1
+            logger.info("feedback_precomputed", questions=len(questions), stored=stored)
+        except Exception as e:
+            log_error(e, {"stage": "feedback_precompute"})
+        finally:
+            with self._feedback_lock:
+                self._feedback_pending.difference_update(question["id"] for question in questions)
+
+    def lookup_feedback(self, question_id: str, choice: str) -> Optional[str]:
+        """미리 생성한 피드백을 조회합니다. 없으면 None을 반환합니다."""
+        stored = self.feedback_cache.get(question_id)
+        if stored is None:
+            return None
+        return json.loads(stored).get(choice.strip().upper())
+
+    def store_feedback(self, question_id: str, choice: str, feedback: str) -> None:
+        """실시간으로 생성한 피드백을 다음 조회를 위해 피드백 행렬에 추가합니다."""
+        stored = self.feedback_cache.get(question_id)
+        matrix = json.loads(stored) if stored else {}
+        matrix[choice.strip().upper()] = feedback
+        self.feedback_cache.set(question_id, json.dumps(matrix, ensure_ascii=False))
 
     def generate_multiple_choice(self, question: str) -> str:
         """이 메서드는 더 이상 사용되지 않습니다."""
@@ -281,16 +1140,21 @@ class QuestionGenerator:
         Returns:
             교육적 피드백
         """
-        prompt = f"""[질문]: {question}
+        def build_prompt(question: str) -> str:
+            return f"""[질문]: {question}
         [GPT 판단 수준]: {gpt_level}
         [사용자 선택 수준]: {user_level}
 
         이 차이를 바탕으로 친절하고 교육적인 피드백을 작성해주세요."""
 
-        response = openai.ChatCompletion.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=self.max_tokens,
-            temperature=self.temperature
+        question = self._fit_input(
+            question, "feedback", self.max_tokens, self.count_tokens(build_prompt(""))
         )
-        return response.choices[0].message['content'] 
\ No newline at end of file
+        prompt = build_prompt(question)
+
+        return self._chat_completion(
+            prompt,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            stage="feedback"
+        ) 
\ No newline at end of file
@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional
+import re
+from utils.cache import make_cache_key
+
+QUESTION_COUNT = 3  # 문제 생성 프롬프트가 요구하는 문제 수
+OPTION_KEYS = ("A", "B", "C", "D", "E")
+
+
+def _score(value: Any) -> Optional[int]:
+    """근접도를 0~100 정수로 바꿉니다. ("85", 85.0, "85점" 허용)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return max(0, min(100, int(round(value))))
+    if isinstance(value, str):
+        match = re.search(r'\d+(?:\.\d+)?', value)
+        if match:
+            return _score(float(match.group()))
+    return None
+
+
+def normalize_summary(data: Any) -> Optional[Dict[str, Any]]:
+    """
+    {"요약": str, "핵심 주제": [str, ...]} 형식인지 확인하고 정리된 사본을 반환합니다.
+
+    Returns:
+        정리된 요약 데이터 (형식이 맞지 않으면 None)
+    """
+    if not isinstance(data, dict):
+        return None
+    summary, topics = data.get("요약"), data.get("핵심 주제")
+    if isinstance(topics, str):
+        topics = [topic.strip() for topic in topics.split(",")]
+    if not isinstance(summary, str) or not summary.strip() or not isinstance(topics, list):
+        return None
+    return {
+        "요약": summary.strip(),
+        "핵심 주제": [str(topic).strip() for topic in topics if str(topic).strip()]
+    }
+
+
+def question_errors(item: Any) -> List[str]:
+    """문제 객체의 형식 오류 목록을 반환합니다. 비어 있으면 올바른 형식입니다."""
+    if not isinstance(item, dict):
+        return ["문제가 객체가 아닙니다."]
+    errors = []
+    if not isinstance(item.get("질문"), str) or not item["질문"].strip():
+        errors.append("질문이 없습니다.")
+
+    options = item.get("보기")
+    if not isinstance(options, dict) or set(options) != set(OPTION_KEYS):
+        errors.append("보기는 A~E 다섯 개여야 합니다.")
+    else:
+        for key, option in options.items():
+            if not isinstance(option, dict) or not isinstance(option.get("질문"), str):
+                errors.append(f"보기 {key}의 질문이 없습니다.")
+            elif not isinstance(option.get("근접도"), int) or not 0 <= option["근접도"] <= 100:
+                errors.append(f"보기 {key}의 근접도는 0~100 정수여야 합니다.")
+
+    if item.get("정답") not in OPTION_KEYS:
+        errors.append("정답은 A~E 중 하나여야 합니다.")
+
+    explanation = item.get("해설")
+    if not isinstance(explanation, dict) or not all(
+        isinstance(explanation.get(key), str) for key in ("정답_설명", "오답_설명")
+    ):
+        errors.append("해설에는 정답_설명과 오답_설명이 필요합니다.")
+    return errors
+
+
+def normalize_question(item: Any) -> Optional[Dict[str, Any]]:
+    """
+    사소한 형식 차이(문자열 근접도, 소문자 정답, 공백)를 고친 뒤 스키마를 검사합니다.
+
+    Returns:
+        정리된 문제 (고칠 수 없으면 None)
+    """
+    if not isinstance(item, dict):
+        return None
+    item = dict(item)
+    options = item.get("보기")
+    if isinstance(options, dict):
+        options = {str(key).strip().upper(): value for key, value in options.items()}
+        for key, option in options.items():
+            if isinstance(option, dict) and "근접도" in option:
+                options[key] = {**option, "근접도": _score(option["근접도"])}
+        item["보기"] = options
+    if isinstance(item.get("정답"), str):
+        item["정답"] = item["정답"].strip().upper()[:1]
+    return None if question_errors(item) else item
+
+
+def question_id(question: Dict[str, Any]) -> str:
+    """문제 내용으로 만든 안정적인 ID (같은 문제는 항상 같은 ID)"""
+    return make_cache_key({key: value for key, value in question.items() if key != "id"})[:16]
+
+
+def normalize_feedback(data: Any) -> Dict[str, str]:
+    """{"A": "피드백", ...}에서 올바른 보기의 피드백만 남깁니다."""
+    if not isinstance(data, dict):
+        return {}
+    return {
+        str(key).strip().upper(): value.strip()
+        for key, value in data.items()
+        if str(key).strip().upper() in OPTION_KEYS and isinstance(value, str) and value.strip()
+    }
@@ -0,0 +1,208 @@
+from typing import Dict, Iterable, Iterator, List, Tuple
+import os
+import re
+import numpy as np
+import tiktoken
+
+# 문단 경계
+PARAGRAPH_BREAKS = (b"\n\n", b"\r\n\r\n")
+# 문장 경계 (한국어 문서도 대부분 같은 문장부호를 사용)
+SENTENCE_BREAKS = (
+    b". ", b".\n", b"? ", b"?\n", b"! ", b"!\n",
+    "。".encode("utf-8"), "？".encode("utf-8"), "！".encode("utf-8"), "…".encode("utf-8")
+)
+# 최후의 수단으로 쓰는 공백 경계
+WORD_BREAKS = (b"\n", b" ")
+
+# 이보다 긴 텍스트는 CPU가 여러 개면 나눠서 동시에 인코딩 (tiktoken은 인코딩 중 GIL을 놓음)
+PARALLEL_MIN_CHARS = 1 << 20
+# 줄바꿈 바로 뒤 글자 앞: 여기서 나눠 인코딩해도 전체를 인코딩한 것과 토큰이 같음
+PIECE_BOUNDARY = re.compile(r"\n(?=\w)")
+
+# 인코딩 이름별 토큰 ID → 바이트 길이 테이블
+_token_length_tables: Dict[str, np.ndarray] = {}
+
+
+def _token_lengths(encoding: tiktoken.Encoding) -> np.ndarray:
+    """토큰 ID별 UTF-8 바이트 길이 테이블을 반환합니다."""
+    table = _token_length_tables.get(encoding.name)
+    if table is None:
+        lengths = []
+        for token in range(encoding.n_vocab):
+            try:
+                lengths.append(len(encoding.decode_single_token_bytes(token)))
+            except KeyError:
+                lengths.append(0)
+        table = _token_length_tables[encoding.name] = np.array(lengths, dtype=np.int64)
+    return table
+
+
+class TextChunker:
+    """
+    문서를 한 번만 인코딩하여 토큰 오프셋 기준으로 청크를 나누는 분할기
+
+    각 청크는 chunk_size 토큰 이내에서 문단, 문장, 공백 경계 순으로
+    가장 가까운 지점에 맞춰 잘립니다.
+    """
+    def __init__(self, encoding: tiktoken.Encoding) -> None:
+        self.encoding = encoding
+
+    def warm_up(self) -> None:
+        """토큰 길이 테이블을 미리 만듭니다."""
+        _token_lengths(self.encoding)
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """인코딩 없이 토큰 수를 어림합니다. (한글 약 1.2토큰/자, 영문 약 4자/토큰)"""
+        # BMP 범위의 비ASCII 문자는 UTF-8로 대부분 3바이트
+        non_ascii = (len(text.encode("utf-8")) - len(text)) // 2
+        ascii_chars = len(text) - non_ascii
+        return int(non_ascii * 1.2 + ascii_chars / 4) + 1
+
+    def exceeds(self, text: str, limit: int) -> bool:
+        """
+        텍스트가 limit 토큰을 넘는지 판단합니다.
+
+        어림값이 한도에서 충분히 멀면 인코딩을 건너뛰고,
+        애매한 구간에서만 정확한 토큰 수를 계산합니다.
+        """
+        estimate = self.estimate_tokens(text)
+        if estimate * 2 < limit:
+            return False
+        if estimate > limit * 2:
+            return True
+        return len(self.encoding.encode_ordinary(text)) > limit
+
+    def _encode(self, text: str) -> List[int]:
+        """
+        텍스트를 인코딩합니다. 아주 긴 텍스트는 CPU 수만큼 줄 경계에서 나눠 동시에 인코딩합니다.
+        """
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(text) < PARALLEL_MIN_CHARS:
+            return self.encoding.encode_ordinary(text)
+        pieces = []
+        start = 0
+        step = len(text) // workers
+        for _ in range(workers - 1):
+            match = PIECE_BOUNDARY.search(text, start + step)
+            if match is None:
+                break
+            pieces.append(text[start:match.end()])
+            start = match.end()
+        pieces.append(text[start:])
+        return [token for tokens in self.encoding.encode_ordinary_batch(pieces, num_threads=workers) for token in tokens]
+
+    def _offsets(self, text: str) -> Tuple[bytes, np.ndarray]:
+        """(UTF-8 바이트, 토큰 시작 바이트 위치 + 끝 위치) 를 반환합니다. 인코딩은 한 번만 합니다."""
+        tokens = np.array(self._encode(text), dtype=np.int64)
+        offsets = np.zeros(len(tokens) + 1, dtype=np.int64)
+        np.cumsum(_token_lengths(self.encoding)[tokens], out=offsets[1:])
+        return text.encode("utf-8"), offsets
+
+    def _cut(self, data: bytes, offsets: np.ndarray, chunk_size: int, final: bool) -> Tuple[List[str], int]:
+        """
+        미리 계산한 토큰 오프셋으로 청크를 자릅니다. (다시 인코딩하지 않음)
+
+        final이 아니면 뒤에 텍스트가 더 이어질 수 있으므로 chunk_size를 다 채운 청크만 자릅니다.
+
+        Returns:
+            (청크 리스트, 아직 자르지 않은 첫 토큰 위치)
+        """
+        chunks = []
+        start = 0
+        total = len(offsets) - 1
+        while start < total:
+            end = start + chunk_size
+            if end < total:
+                end = self._snap(data, offsets, start, end)
+            elif final:
+                end = total
+            else:
+                break
+
+            chunk = data[offsets[start]:offsets[end]].decode("utf-8", errors="ignore").strip()
+            if chunk:
+                chunks.append(chunk)
+            start = end
+        return chunks, start
+
+    def split(self, text: str, chunk_size: int) -> List[str]:
+        """
+        텍스트를 chunk_size 토큰 이하의 청크로 나눕니다.
+
+        Args:
+            text: 분할할 텍스트
+            chunk_size: 청크당 최대 토큰 수
+
+        Returns:
+            순서가 유지된 청크 리스트
+        """
+        data, offsets = self._offsets(text)
+        return self._cut(data, offsets, chunk_size, final=True)[0]
+
+    def iter_split(self, pieces: Iterable[str], chunk_size: int, separator: str = "\n\n") -> Iterator[str]:
+        """
+        페이지처럼 차례로 도착하는 텍스트 조각을 이어 붙이며 청크가 차는 대로 내보냅니다.
+
+        조각은 도착할 때 한 번만 인코딩하고 토큰 오프셋을 버퍼에 이어 붙이므로, 남은 부분을 다시
+        인코딩하지 않습니다. 버퍼가 청크 두 개 분량을 넘을 때마다 다 찬 청크를 잘라 내보내고
+        나머지만 남기므로, 메모리는 문서 길이와 관계없이 몇 개 청크 분량으로 유지됩니다.
+
+        Args:
+            pieces: 순서대로 도착하는 텍스트 조각
+            chunk_size: 청크당 최대 토큰 수
+            separator: 조각 사이에 넣을 구분자 (기본값은 문단 경계)
+        """
+        data = b""
+        offsets = np.zeros(1, dtype=np.int64)
+        for piece in pieces:
+            piece_data, piece_offsets = self._offsets(f"{separator}{piece}" if data else piece)
+            offsets = np.concatenate((offsets, piece_offsets[1:] + len(data)))
+            data += piece_data
+            if len(offsets) - 1 > chunk_size * 2:
+                chunks, start = self._cut(data, offsets, chunk_size, final=False)
+                yield from chunks
+                data = data[offsets[start]:]
+                offsets = offsets[start:] - offsets[start]
+        if data:
+            yield from self._cut(data, offsets, chunk_size, final=True)[0]
+
+    @staticmethod
+    def _snap(data: bytes, offsets: np.ndarray, start: int, end: int) -> int:
+        """end 토큰 이전의 가장 가까운 자연스러운 경계 토큰 위치를 찾습니다."""
+        start_byte = offsets[start]
+        limit_byte = offsets[end]
+        # 문단/문장 경계는 청크가 절반 이상 찼을 때만 사용
+        half_byte = start_byte + (limit_byte - start_byte) // 2
+
+        for breaks, lower in (
+            (PARAGRAPH_BREAKS, half_byte),
+            (SENTENCE_BREAKS, half_byte),
+            (WORD_BREAKS, start_byte + 1)
+        ):
+            # 문장부호처럼 공백이 아닌 부분은 앞 청크에 남기고 자름
+            cut_byte = -1
+            for mark in breaks:
+                position = data.rfind(mark, lower, limit_byte)
+                if position >= 0:
+                    cut_byte = max(cut_byte, position + len(mark.rstrip()))
+            if cut_byte < 0:
+                continue
+            cut = start + int(np.searchsorted(offsets[start:end + 1], cut_byte, side="right")) - 1
+            if cut > start:
+                return TextChunker._align(data, offsets, start, cut)
+
+        return TextChunker._align(data, offsets, start, end)
+
+    @staticmethod
+    def _align(data: bytes, offsets: np.ndarray, start: int, cut: int) -> int:
+        """멀티바이트 문자 중간에서 잘리지 않도록 토큰 위치를 앞당깁니다."""
+        aligned = cut
+        while aligned > start and data[offsets[aligned]] & 0xC0 == 0x80:
+            aligned -= 1
+        if aligned > start:
+            return aligned
+        # 한 글자가 청크 전체보다 긴 극단적인 경우에는 뒤쪽 문자 경계로 이동
+        while cut < len(offsets) - 1 and data[offsets[cut]] & 0xC0 == 0x80:
+            cut += 1
+        return cut
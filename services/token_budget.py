@@ -0,0 +1,163 @@
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+import threading
+from utils.exceptions import TokenBudgetExceededError
+
+T = TypeVar("T")
+
+# 모델 이름 접두어: (컨텍스트 윈도 토큰 수, 입력 1K 토큰당 USD, 출력 1K 토큰당 USD)
+# 긴 접두어가 먼저 일치하도록 조회합니다.
+MODEL_SPECS: Dict[str, Tuple[int, float, float]] = {
+    "gpt-4o-mini": (128000, 0.00015, 0.0006),
+    "gpt-4o": (128000, 0.0025, 0.01),
+    "gpt-4-turbo": (128000, 0.01, 0.03),
+    "gpt-4-32k": (32768, 0.06, 0.12),
+    "gpt-4": (8192, 0.03, 0.06),
+    "gpt-3.5-turbo-16k": (16385, 0.003, 0.004),
+    "gpt-3.5-turbo": (16385, 0.0005, 0.0015),
+    "gemini-1.5": (1048576, 0.00035, 0.00105),
+    "gemini-pro": (32760, 0.0005, 0.0015),
+    "stub": (16385, 0.0, 0.0)
+}
+DEFAULT_SPEC = (4096, 0.0, 0.0)  # 알 수 없는 모델은 보수적으로 계산
+
+
+class TokenBudget:
+    """
+    모델의 컨텍스트 윈도에 맞춰 입력/출력 토큰 한도를 계산하는 플래너
+
+    Args:
+        safety_margin: 메시지 포맷 오버헤드 등을 위해 비워 두는 토큰 수
+        min_completion_tokens: 응답에 최소한 남겨야 하는 토큰 수
+    """
+    def __init__(self, safety_margin: int = 64, min_completion_tokens: int = 128) -> None:
+        self.safety_margin = safety_margin
+        self.min_completion_tokens = min_completion_tokens
+
+    @staticmethod
+    def spec(model: str) -> Tuple[int, float, float]:
+        for prefix in sorted(MODEL_SPECS, key=len, reverse=True):
+            if model.startswith(prefix):
+                return MODEL_SPECS[prefix]
+        return DEFAULT_SPEC
+
+    def context_window(self, model: str) -> int:
+        return self.spec(model)[0]
+
+    def input_budget(self, model: str, completion_tokens: int, overhead_tokens: int = 0) -> int:
+        """응답 토큰과 프롬프트 고정부를 빼고 입력 텍스트에 쓸 수 있는 토큰 수를 반환합니다."""
+        return max(0, self.context_window(model) - completion_tokens - overhead_tokens - self.safety_margin)
+
+    def completion_limit(self, model: str, prompt_tokens: int, requested: int) -> int:
+        """
+        프롬프트 크기에 맞춰 max_tokens를 줄입니다.
+
+        Raises:
+            TokenBudgetExceededError: 프롬프트만으로 응답에 필요한 공간이 남지 않는 경우
+        """
+        available = self.context_window(model) - prompt_tokens - self.safety_margin
+        if available < min(requested, self.min_completion_tokens):
+            raise TokenBudgetExceededError(
+                "입력이 너무 길어 모델의 컨텍스트 한도를 초과합니다.",
+                details={
+                    "model": model,
+                    "prompt_tokens": prompt_tokens,
+                    "context_window": self.context_window(model)
+                }
+            )
+        return min(requested, available)
+
+    def cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        """예상 비용(USD)을 계산합니다."""
+        _, prompt_price, completion_price = self.spec(model)
+        return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000
+
+
+class UsageMeter:
+    """단계별 호출 수, 토큰 수, 예상 비용을 누적하는 계량기 (스레드 안전)"""
+    def __init__(self) -> None:
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        stage: str,
+        model: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cost: float = 0.0,
+        cached: bool = False
+    ) -> None:
+        """호출 한 번을 기록합니다. 캐시 응답은 토큰을 쓰지 않으므로 횟수만 셉니다."""
+        with self._lock:
+            usage = self._stages.setdefault(stage, {
+                "calls": 0,
+                "cached_calls": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "cost_usd": 0.0,
+                "models": []
+            })
+            if cached:
+                usage["cached_calls"] += 1
+                return
+            usage["calls"] += 1
+            usage["prompt_tokens"] += prompt_tokens
+            usage["completion_tokens"] += completion_tokens
+            usage["cost_usd"] += cost
+            if model not in usage["models"]:
+                usage["models"].append(model)
+
+    def summary(self) -> Dict[str, Any]:
+        """전체 합계와 단계별 사용량을 반환합니다."""
+        with self._lock:
+            stages = {
+                stage: {**usage, "models": list(usage["models"]), "cost_usd": round(usage["cost_usd"], 6)}
+                for stage, usage in self._stages.items()
+            }
+        totals = {
+            key: sum(usage[key] for usage in stages.values())
+            for key in ("calls", "cached_calls", "prompt_tokens", "completion_tokens")
+        }
+        totals["total_tokens"] = totals["prompt_tokens"] + totals["completion_tokens"]
+        totals["cost_usd"] = round(sum(usage["cost_usd"] for usage in stages.values()), 6)
+        return {**totals, "stages": stages}
+
+
+# 현재 요청의 사용량 계량기 (스레드 풀에는 contextvars.copy_context().run으로 전달)
+_current_usage: ContextVar[Optional[UsageMeter]] = ContextVar("llm_usage", default=None)
+
+
+def current_usage() -> Optional[UsageMeter]:
+    return _current_usage.get()
+
+
+@contextmanager
+def track_usage() -> Iterator[UsageMeter]:
+    """블록 안에서 일어난 LLM 호출을 새 계량기에 기록합니다."""
+    meter = UsageMeter()
+    token = _current_usage.set(meter)
+    try:
+        yield meter
+    finally:
+        _current_usage.reset(token)
+
+
+def run_with_usage(meter: UsageMeter, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """주어진 계량기를 현재 요청 계량기로 지정하고 func를 실행합니다. (다른 스레드에서 실행할 때 사용)"""
+    context = copy_context()
+    context.run(_current_usage.set, meter)
+    return context.run(func, *args, **kwargs)
+
+
+def iterate_with_usage(meter: UsageMeter, iterator: Iterator[T]) -> Iterator[T]:
+    """제너레이터의 각 단계를 주어진 계량기 컨텍스트에서 실행합니다."""
+    context = copy_context()
+    context.run(_current_usage.set, meter)
+    while True:
+        try:
+            item = context.run(next, iterator)
+        except StopIteration:
+            return
+        yield item
@@ -0,0 +1,60 @@
+from typing import Dict, Optional
+import base64
+import hashlib
+import os
+import threading
+import tiktoken
+from utils.exceptions import ConfigurationError
+
+VENDOR_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "vendor")
+# gpt-3.5-turbo / gpt-4 인코딩 (tiktoken 0.6 이상이 확인하는 것과 같은 해시)
+CL100K_PATH = os.path.join(VENDOR_DIR, "tiktoken", "cl100k_base.tiktoken")
+CL100K_SHA256 = "223921b76ee99bde995b7ff738513eef100fb51d18c93597a113bcffe865b2a7"
+CL100K_PATTERN = (
+    r"""(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"""
+)
+CL100K_SPECIAL_TOKENS: Dict[str, int] = {
+    "<|endoftext|>": 100257,
+    "<|fim_prefix|>": 100258,
+    "<|fim_middle|>": 100259,
+    "<|fim_suffix|>": 100260,
+    "<|endofprompt|>": 100276
+}
+
+_encoding: Optional[tiktoken.Encoding] = None
+_lock = threading.Lock()
+
+
+def _load_vendored() -> tiktoken.Encoding:
+    with open(CL100K_PATH, "rb") as file:
+        contents = file.read()
+    if hashlib.sha256(contents).hexdigest() != CL100K_SHA256:
+        raise ConfigurationError(f"토큰 인코딩 파일이 손상되었습니다: {CL100K_PATH}")
+    ranks = {
+        base64.b64decode(token): int(rank)
+        for token, rank in (line.split() for line in contents.splitlines() if line)
+    }
+    return tiktoken.Encoding(
+        name="cl100k_base",
+        pat_str=CL100K_PATTERN,
+        mergeable_ranks=ranks,
+        special_tokens=CL100K_SPECIAL_TOKENS
+    )
+
+
+def get_encoding() -> tiktoken.Encoding:
+    """
+    프로세스 전체가 함께 쓰는 cl100k_base 인코딩을 반환합니다.
+
+    처음 호출할 때 저장소에 포함된 BPE 파일(vendor/tiktoken)로 만들므로 네트워크를 쓰지 않습니다.
+    파일이 없으면 tiktoken 기본 방식(캐시 또는 다운로드)으로 불러옵니다.
+    """
+    global _encoding
+    if _encoding is None:
+        with _lock:
+            if _encoding is None:
+                if os.path.exists(CL100K_PATH):
+                    _encoding = _load_vendored()
+                else:
+                    _encoding = tiktoken.get_encoding("cl100k_base")
+    return _encoding
@@ -0,0 +1,265 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import json
+import os
+import sqlite3
+import threading
+import time
+from googleapiclient.errors import HttpError
+from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled, YouTubeTranscriptApi
+from youtube_transcript_api.formatters import TextFormatter
+from utils.cache import PersistentCache, thread_connection
+from utils.exceptions import ContentProcessingError
+from utils.logger import logger, log_error
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")  # Data API 할당량은 태평양 시간 자정에 초기화
+except Exception:
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+# Data API 메서드별 할당량 비용 (단위)
+QUOTA_COSTS = {"videos.list": 1}
+QUOTA_REASONS = ("quotaExceeded", "dailyLimitExceeded", "rateLimitExceeded")
+QUOTA_MESSAGE = "YouTube API 할당량이 초과되었습니다. 잠시 후 다시 시도해주세요."
+
+
+class QuotaLedger:
+    """
+    YouTube Data API 일일 할당량 장부 (SQLite)
+
+    gunicorn 워커들이 같은 파일을 공유하며, 호출 전에 reserve()로 비용을 기록합니다.
+    하루 사용량이 daily_limit - reserve_units에 닿으면 더 이상 호출하지 않아
+    실제 할당량 초과(403) 전에 멈춥니다. 날짜는 할당량이 초기화되는 태평양 시간 기준입니다.
+    """
+    def __init__(self, path: str, daily_limit: int = 10000, reserve_units: int = 500) -> None:
+        self.path = path
+        self.daily_limit = daily_limit
+        self.reserve_units = reserve_units
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._setup()
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결을 반환합니다."""
+        return thread_connection(self._local, self.path)
+
+    def _setup(self) -> None:
+        self._connection().execute("""
+            CREATE TABLE IF NOT EXISTS youtube_quota (
+                day TEXT PRIMARY KEY,
+                used INTEGER NOT NULL DEFAULT 0,
+                calls INTEGER NOT NULL DEFAULT 0,
+                rejected INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+    @staticmethod
+    def today() -> str:
+        return datetime.now(QUOTA_TIMEZONE).strftime("%Y-%m-%d")
+
+    @property
+    def budget(self) -> int:
+        return max(0, self.daily_limit - self.reserve_units)
+
+    def reserve(self, units: int) -> bool:
+        """오늘 예산 안이면 units를 사용량에 더하고 True, 넘으면 거절 횟수만 늘리고 False를 반환합니다."""
+        day = self.today()
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT OR IGNORE INTO youtube_quota (day) VALUES (?)", (day,))
+            used = conn.execute("SELECT used FROM youtube_quota WHERE day = ?", (day,)).fetchone()["used"]
+            if used + units > self.budget:
+                conn.execute("UPDATE youtube_quota SET rejected = rejected + 1 WHERE day = ?", (day,))
+                return False
+            conn.execute(
+                "UPDATE youtube_quota SET used = used + ?, calls = calls + 1 WHERE day = ?",
+                (units, day)
+            )
+            return True
+
+    def exhaust(self) -> None:
+        """API가 할당량 초과(403)를 알린 경우 오늘 남은 예산을 모두 쓴 것으로 기록합니다."""
+        day = self.today()
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT OR IGNORE INTO youtube_quota (day) VALUES (?)", (day,))
+            conn.execute("UPDATE youtube_quota SET used = MAX(used, ?) WHERE day = ?", (self.daily_limit, day))
+
+    def stats(self) -> Dict[str, Any]:
+        """오늘의 사용량/호출/거절 횟수를 반환합니다."""
+        day = self.today()
+        row = self._connection().execute(
+            "SELECT used, calls, rejected FROM youtube_quota WHERE day = ?", (day,)
+        ).fetchone()
+        used, calls, rejected = (row["used"], row["calls"], row["rejected"]) if row else (0, 0, 0)
+        return {
+            "day": day,
+            "used": used,
+            "budget": self.budget,
+            "daily_limit": self.daily_limit,
+            "calls": calls,
+            "rejected": rejected
+        }
+
+
+class YouTubeFetcher:
+    """
+    유튜브 동영상 정보/자막 수집기
+
+    Data API의 동영상 정보와 자막을 동시에 가져오고, 둘 다 video_id로 영구 캐시에 저장합니다.
+    많이 쓰이는 강의 동영상은 API를 호출하지 않고 캐시에서 바로 처리합니다.
+    Data API 호출은 QuotaLedger로 비용을 먼저 기록하고, 예산을 넘으면 호출하지 않습니다.
+
+    Args:
+        youtube: googleapiclient YouTube 서비스를 반환하는 함수 (처음 동영상 정보를 가져올 때 호출)
+        metadata_cache: 동영상 정보 캐시
+        transcript_cache: 자막 캐시
+        ledger: 할당량 장부
+        languages: 우선할 자막 언어 순서
+        workers: 동시에 가져올 작업 수 (모든 요청이 함께 사용)
+        timeout: Data API 요청 타임아웃 (초)
+    """
+    def __init__(
+        self,
+        youtube: Callable[[], Any],
+        metadata_cache: PersistentCache,
+        transcript_cache: PersistentCache,
+        ledger: QuotaLedger,
+        languages: Tuple[str, ...] = ("ko", "en"),
+        workers: int = 4,
+        timeout: float = 15.0
+    ) -> None:
+        self.youtube = youtube
+        self.metadata_cache = metadata_cache
+        self.transcript_cache = transcript_cache
+        self.ledger = ledger
+        self.languages = languages
+        self.workers = workers
+        self.timeout = timeout
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                self._pool_pid = os.getpid()
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="youtube")
+            return self._pool
+
+    def _http(self) -> Any:
+        """스레드별 HTTP 연결 (httplib2.Http는 스레드 안전하지 않음)"""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            import httplib2
+            http = self._local.http = httplib2.Http(timeout=self.timeout)
+        return http
+
+    def metadata(self, video_id: str) -> Dict[str, str]:
+        """
+        동영상 제목과 설명을 반환합니다.
+
+        Raises:
+            ContentProcessingError: 동영상이 없거나, 할당량이 부족하거나, API 오류가 난 경우
+        """
+        cached = self.metadata_cache.get(video_id)
+        if cached:
+            return json.loads(cached)
+        if not self.ledger.reserve(QUOTA_COSTS["videos.list"]):
+            logger.warning("youtube_quota_throttled", video_id=video_id, **self.ledger.stats())
+            raise ContentProcessingError(QUOTA_MESSAGE, {"video_id": video_id})
+
+        try:
+            response = self.youtube().videos().list(part='snippet', id=video_id).execute(http=self._http())
+        except HttpError as e:
+            if e.resp.status == 403:
+                if any(reason in str(e.content) for reason in QUOTA_REASONS):
+                    self.ledger.exhaust()
+                    raise ContentProcessingError(QUOTA_MESSAGE, {"video_id": video_id})
+                raise ContentProcessingError("YouTube API 키가 유효하지 않거나 할당량이 초과되었습니다.")
+            if e.resp.status == 404:
+                raise ContentProcessingError("동영상을 찾을 수 없습니다.")
+            log_error(e, {"video_id": video_id})
+            raise ContentProcessingError("동영상 정보를 가져오는 중 오류가 발생했습니다.")
+
+        if not response['items']:
+            raise ContentProcessingError("동영상을 찾을 수 없습니다.")
+        snippet = response['items'][0]['snippet']
+        metadata = {
+            "title": snippet.get('title', '제목 없음'),
+            "description": snippet.get('description', '설명 없음')
+        }
+        self.metadata_cache.set(video_id, json.dumps(metadata, ensure_ascii=False))
+        return metadata
+
+    def _find_transcript(self, video_id: str) -> Any:
+        """선호 언어 자막, 없으면 직접 만든 자막, 그다음 자동 생성 자막 순으로 고릅니다."""
+        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+        try:
+            return transcript_list.find_transcript(list(self.languages))
+        except NoTranscriptFound:
+            pass
+        transcripts = sorted(transcript_list, key=lambda transcript: transcript.is_generated)
+        return transcripts[0] if transcripts else None
+
+    def transcript(self, video_id: str) -> Dict[str, str]:
+        """
+        자막을 {"status", "text"}로 반환합니다.
+        status는 ok, not_found(자막 없음), disabled(자막 비활성화), none(자막 목록이 비어 있음), error 중 하나이며
+        error가 아닌 결과는 캐시합니다.
+        """
+        cached = self.transcript_cache.get(video_id)
+        if cached:
+            return json.loads(cached)
+        try:
+            transcript = self._find_transcript(video_id)
+            if transcript:
+                result = {"status": "ok", "text": TextFormatter().format_transcript(transcript.fetch()).strip()}
+            else:
+                result = {"status": "not_found", "text": ""}
+        except TranscriptsDisabled:
+            result = {"status": "disabled", "text": ""}
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "transcript are disabled" in error_msg:
+                result = {"status": "disabled", "text": ""}
+            elif "no transcript" in error_msg:
+                result = {"status": "none", "text": ""}
+            else:
+                log_error(e, {"video_id": video_id, "stage": "youtube_transcript"})
+                return {"status": "error", "text": ""}
+        self.transcript_cache.set(video_id, json.dumps(result, ensure_ascii=False))
+        return result
+
+    def fetch(self, video_id: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        동영상 정보와 자막을 동시에 가져옵니다.
+
+        Raises:
+            ContentProcessingError: 동영상 정보를 가져오지 못한 경우 (자막 결과는 그래도 캐시됨)
+        """
+        started_at = time.monotonic()
+        transcript_future = self._executor().submit(self.transcript, video_id)
+        try:
+            metadata = self.metadata(video_id)
+        finally:
+            transcript = transcript_future.result()
+        logger.info(
+            "youtube_fetched",
+            video_id=video_id,
+            transcript=transcript["status"],
+            duration=round(time.monotonic() - started_at, 3)
+        )
+        return metadata, transcript
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "quota": self.ledger.stats(),
+            "metadata_cache": self.metadata_cache.stats(),
+            "transcript_cache": self.transcript_cache.stats()
+        }
@@ -0,0 +1,97 @@
+import json
+import random
+import re
+import time
+from types import SimpleNamespace
+
+import openai
+import pytest
+
+from services.question_generator import QuestionGenerator
+from utils.cache import PersistentCache
+
+
+def make_response(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message={"content": content})])
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """청크가 여러 개로 나뉘도록 작은 청크 크기를 쓰는 생성기"""
+    generator = QuestionGenerator()
+    generator.chunk_size = 50
+    generator.max_concurrency = 4
+    path = str(tmp_path / "cache.db")
+    generator.cache = PersistentCache(path, namespace="chat_completion")
+    generator.summary_cache = PersistentCache(path, namespace="document_summary")
+    generator.question_cache = PersistentCache(path, namespace="question_set")
+    generator.feedback_cache = PersistentCache(path, namespace="feedback_matrix")
+    return generator
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    """청크 번호를 요약으로 돌려주는 가짜 ChatCompletion"""
+    def create(model, messages, max_tokens, temperature, **kwargs):
+        prompt = messages[0]["content"]
+        # 응답 순서가 뒤섞이도록 임의로 지연
+        time.sleep(random.uniform(0, 0.02))
+        numbers = re.findall(r"문단(\d+)", prompt)
+        if "압축" in prompt:
+            create.merges += 1
+            topics = re.findall(r"주제\d+", prompt.split("[주제 목록]")[1])
+            return make_response(json.dumps({
+                "요약": "압축",
+                "핵심 주제": topics[:1]
+            }, ensure_ascii=False))
+        return make_response(json.dumps({
+            "요약": f"요약{numbers[0]}" + " 세부 설명" * create.summary_length,
+            "핵심 주제": [f"주제{numbers[0]}"]
+        }, ensure_ascii=False))
+
+    create.calls = 0
+    create.merges = 0
+    create.summary_length = 0
+
+    def counting_create(**kwargs):
+        create.calls += 1
+        return create(**kwargs)
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", counting_create)
+    return create
+
+
+def make_question(index: int) -> dict:
+    """스키마에 맞는 문제 객체"""
+    return {
+        "질문": f"문제{index}",
+        "보기": {key: {"질문": f"보기{key}", "근접도": 90 - 10 * i} for i, key in enumerate("ABCDE")},
+        "정답": "A",
+        "해설": {"정답_설명": "정답 설명", "오답_설명": "오답 설명"}
+    }
+
+
+def make_pdf(pages) -> bytes:
+    """페이지마다 한 줄의 ASCII 텍스트가 있는 최소 PDF를 만듭니다."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = b"BT /F1 12 Tf 72 720 Td (" + text.encode("latin-1") + b") Tj ET"
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d >>" % len(pages)
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return out
@@ -1,5 +1,8 @@
 import pytest
+import json
 import os
+import re
+import time
 from app import create_app
 from config import get_config
 
@@ -10,6 +13,18 @@ def setup_test_env():
     yield
     os.environ.pop("FLASK_ENV", None)
 
+@pytest.fixture(autouse=True)
+def question_bank(monkeypatch, tmp_path):
+    """테스트마다 빈 문제 은행 사용"""
+    from routes import generator
+    from services.question_bank import QuestionBank
+
+    bank = QuestionBank(str(tmp_path / "question_bank.db"))
+    services = generator.get_services()
+    monkeypatch.setattr(services, "question_bank", bank)
+    monkeypatch.setattr(services.pipeline, "question_bank", bank)
+    return bank
+
 @pytest.fixture
 def app():
     """테스트 애플리케이션 픽스처"""
@@ -40,4 +55,161 @@ def test_error_handling(client):
     
     data = response.get_json()
     assert data["error"] == True
-    assert "message" in data 
\ No newline at end of file
+    assert "message" in data 
+def test_process_stream_emits_progress_events(client, monkeypatch):
+    """스트리밍 엔드포인트가 단계별 SSE 이벤트를 보내는지 테스트"""
+    from routes import generator
+
+    def fake_summary(content, progress=None, pages=None):
+        progress("chunk_summarized", {"completed": 1, "total": 1, "failed": False})
+        return json.dumps({"요약": "요약", "핵심 주제": ["주제"]}, ensure_ascii=False)
+
+    def fake_questions(summary, topics):
+        yield {"질문": "첫 번째"}
+        yield {"질문": "두 번째"}
+
+    monkeypatch.setattr(generator.get_services().question_generator, "generate_summary_and_topics", fake_summary)
+    monkeypatch.setattr(generator.get_services().question_generator, "generate_questions_stream", fake_questions)
+
+    response = client.post('/process/stream', json={"type": "text", "content": "본문"})
+
+    assert response.mimetype == "text/event-stream"
+    events = re.findall(r"^event: (\w+)$", response.get_data(as_text=True), re.MULTILINE)
+    assert events == ["extracted", "chunk_summarized", "summary", "question", "question", "done"]
+
+def test_process_stream_reports_validation_error(client):
+    """스트리밍 엔드포인트가 오류를 error 이벤트로 보내는지 테스트"""
+    response = client.post('/process/stream', json={"type": "text", "content": ""})
+
+    body = response.get_data(as_text=True)
+    assert "event: error" in body
+    assert "VALIDATION_ERROR" in body
+
+def test_jobs_submit_and_poll(client, monkeypatch, tmp_path):
+    """작업을 등록하면 바로 ID를 받고 조회로 결과를 확인하는지 테스트"""
+    from routes import generator
+    from services.job_queue import JobQueue, JobStore
+
+    def handler(payload, progress):
+        return {"summary": payload["content"], "topics": [], "questions": []}
+
+    queue = JobQueue(JobStore(str(tmp_path / "jobs.db")), handler, workers=1, poll_interval=0.05)
+    monkeypatch.setattr(generator.get_services(), "job_queue", queue)
+
+    response = client.post('/jobs', json={"type": "text", "content": "본문"})
+    assert response.status_code == 202
+    job_id = response.get_json()["job_id"]
+
+    for _ in range(100):
+        data = client.get(f'/jobs/{job_id}').get_json()
+        if data["status"] == "succeeded":
+            break
+        time.sleep(0.02)
+    assert data["result"]["summary"] == "본문"
+
+    assert client.get('/jobs/unknown').status_code == 404
+
+def test_feedback_serves_precomputed_entry(client, monkeypatch, tmp_path):
+    """미리 만든 피드백이 있으면 LLM 호출 없이 반환하고, 없으면 실시간 생성 후 저장하는지 테스트"""
+    from routes import generator
+    from utils.cache import PersistentCache
+
+    qg = generator.get_services().question_generator
+    monkeypatch.setattr(qg, "feedback_cache", PersistentCache(str(tmp_path / "cache.db"), namespace="feedback_matrix"))
+    qg.feedback_cache.set("q1", json.dumps({"A": "미리 만든 피드백"}, ensure_ascii=False))
+    live_calls = []
+
+    def fake_feedback(question, gpt_level, user_level):
+        live_calls.append(user_level)
+        return "실시간 피드백"
+
+    monkeypatch.setattr(qg, "generate_feedback", fake_feedback)
+    body = {"question": "질문", "question_id": "q1", "gpt_level": "A"}
+
+    precomputed = client.post('/feedback', json={**body, "user_level": "A"}).get_json()
+    live = client.post('/feedback', json={**body, "user_level": "B"}).get_json()
+    stored = client.post('/feedback', json={**body, "user_level": "B"}).get_json()
+
+    assert precomputed == {"feedback": "미리 만든 피드백", "source": "precomputed"}
+    assert live == {"feedback": "실시간 피드백", "source": "live"}
+    assert stored == {"feedback": "실시간 피드백", "source": "precomputed"}
+    assert live_calls == ["B"]
+
+def test_process_reuses_question_bank_set(client, monkeypatch, question_bank):
+    """같은 문서를 다시 처리하면 문제 은행의 세트를 재사용하고 검색으로 찾을 수 있는지 테스트"""
+    from routes import generator
+    from tests.conftest import make_question
+
+    calls = []
+
+    def fake_summary(content, progress=None, pages=None):
+        calls.append("summary")
+        return json.dumps({"요약": "광합성 과정 요약", "핵심 주제": ["광합성", "엽록체"]}, ensure_ascii=False)
+
+    def fake_questions(summary, topics):
+        calls.append("questions")
+        return json.dumps({"questions": [make_question(0)]}, ensure_ascii=False)
+
+    monkeypatch.setattr(generator.get_services().question_generator, "generate_summary_and_topics", fake_summary)
+    monkeypatch.setattr(generator.get_services().question_generator, "generate_questions", fake_questions)
+    body = {"type": "text", "content": "식물의 광합성"}
+
+    first = client.post('/process', json=body).get_json()
+    second = client.post('/process', json=body).get_json()
+    fresh = client.post('/process?reuse=false', json=body).get_json()
+
+    assert calls == ["summary", "questions", "summary", "questions"]
+    assert not first["reused"] and second["reused"] and not fresh["reused"]
+    assert second["question_set_id"] == first["question_set_id"]
+    assert second["questions"] == first["questions"]
+
+    by_hash = client.get(f'/bank/documents/{first["document_hash"]}').get_json()
+    assert [s["id"] for s in by_hash["sets"]] == [first["question_set_id"]]
+    found = client.get('/bank/search', query_string={"q": "광합성은"}).get_json()
+    assert found["sets"][0]["topics"] == ["광합성", "엽록체"]
+    assert client.get('/bank/search').status_code == 400
+
+def test_process_batch_runs_items_concurrently(client, monkeypatch):
+    """배치 항목이 병렬로 처리되고 항목별 오류와 병합 결과를 반환하는지 테스트"""
+    from routes import generator
+    from tests.conftest import make_question
+
+    def fake_summary(content, progress=None, pages=None):
+        time.sleep(0.2)
+        return json.dumps({"요약": f"{content} 요약", "핵심 주제": [content, "공통"]}, ensure_ascii=False)
+
+    def fake_questions(summary, topics):
+        return json.dumps({"questions": [make_question(len(topics))]}, ensure_ascii=False)
+
+    services = generator.get_services()
+    monkeypatch.setattr(services.question_generator, "generate_summary_and_topics", fake_summary)
+    monkeypatch.setattr(services.question_generator, "generate_questions", fake_questions)
+    monkeypatch.setattr(services.pipeline, "batch_workers", 4)
+    monkeypatch.setattr(services.pipeline, "_batch_executor", None)
+    items = [{"type": "text", "content": f"문서{i}"} for i in range(3)] + [{"type": "pdf", "file": "missing"}]
+
+    started = time.monotonic()
+    data = client.post('/process/batch', json={"items": items, "merge": True}).get_json()
+
+    assert time.monotonic() - started < 0.5
+    assert [item["status"] for item in data["items"]] == ["succeeded"] * 3 + ["failed"]
+    assert "파일이 제공되지 않았습니다" in data["items"][3]["error"]
+    assert (data["succeeded"], data["failed"]) == (3, 1)
+    assert data["merged"]["topics"] == ["문서0", "공통", "문서1", "문서2"]
+    assert data["merged"]["sources"] == [0, 1, 2]
+    assert client.post('/process/batch', json={"items": []}).status_code == 400
+
+def test_route_services_are_built_on_first_use():
+    """라우트 모듈 임포트만으로는 서비스 객체를 만들지 않고 warm_up에서 만드는지 테스트"""
+    import subprocess
+    import sys
+
+    probe = (
+        "import app\n"
+        "from routes import generator\n"
+        "assert generator.get_services.cache_info().currsize == 0\n"
+        "app.warm_up()\n"
+        "assert generator.get_services.cache_info().currsize == 1\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", probe], cwd=root, check=True, env=dict(os.environ, FLASK_ENV="testing"))
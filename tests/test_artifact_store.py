@@ -0,0 +1,117 @@
+import io
+import sqlite3
+
+from services import content_processor
+from services.artifact_store import ArtifactStore, ArtifactWriter, upload_key
+from services.content_processor import ContentProcessor
+from services.pipeline import QuestionPipeline
+from tests.conftest import make_pdf
+
+
+def test_page_ranges_and_size_cap_eviction(tmp_path):
+    """페이지 범위 조회와 용량 초과 시 오래 사용되지 않은 문서부터 지우는지 테스트"""
+    store = ArtifactStore(str(tmp_path / "artifacts.db"), max_bytes=10_000)
+    pages = [ArtifactStore.compress_page(f"page {i} " + "x" * i) for i in range(5)]
+    store.put("a", pages, {"pages": 5})
+
+    assert list(store.iter_pages("a", 1, 3)) == ["page 1 x", "page 2 xx"]
+    assert store.get("a") == {"pages": 5}
+
+    big = [ArtifactStore.compress_page(str(i) * 4000) for i in range(200)]
+    store.max_bytes = sum(len(page) for page in big) + 1
+    store.put("b", big, {"pages": 200})
+
+    assert store.get("a") is None and list(store.iter_pages("a")) == []
+    assert store.stats()["documents"] == 1
+    assert not store.put("c", big * 2, {"pages": 400})  # 한도보다 큰 문서는 저장하지 않음
+
+
+def test_repeat_upload_skips_parsing(tmp_path, monkeypatch):
+    """같은 업로드 파일은 PDF를 다시 파싱하지 않고 저장된 페이지를 쓰는지 테스트"""
+    processor = ContentProcessor()
+    processor.artifacts = ArtifactStore(str(tmp_path / "artifacts.db"))
+    data = make_pdf(["one", " ", "two"])
+
+    first, metadata = processor.process_pdf_with_metadata(io.BytesIO(data))
+    assert not metadata["cached"] and metadata["sha256"] == upload_key(io.BytesIO(data))
+    assert processor.artifacts.get(metadata["sha256"])["empty_pages"] == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("PDF를 다시 파싱함")
+
+    monkeypatch.setattr(processor.pdf_extractor, "iter_pages", fail)
+    second, cached = processor.process_pdf_with_metadata(io.BytesIO(data))
+
+    assert second == first == "one\n\ntwo"
+    assert cached["cached"] and (cached["pages"], cached["empty_pages"]) == (3, 1)
+
+
+def test_get_does_not_write_and_access_is_flushed_before_eviction(tmp_path):
+    """조회는 쓰기 잠금 없이 끝나고, 모아 둔 사용 시각은 다음 저장의 정리 순서에 반영되는지 테스트"""
+    store = ArtifactStore(str(tmp_path / "artifacts.db"))
+    old, new = [ArtifactStore.compress_page(str(i) * 4000) for i in range(2)]
+    store.put("old", [old], {"pages": 1})
+    store.put("new", [new], {"pages": 1})
+
+    writer = sqlite3.connect(store.path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        assert store.get("old") == {"pages": 1}
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+    store.max_bytes = len(old) + len(new) + 1
+    store.put("third", [ArtifactStore.compress_page("x")], {"pages": 1})
+
+    assert store.contains("old") and not store.contains("new")
+
+
+def test_pipeline_hashes_each_upload_once(generator, tmp_path, monkeypatch):
+    """스트리밍 여부 판단과 추출에서 업로드 파일을 한 번만 해시하는지 테스트"""
+    hashed = []
+
+    def counting_upload_key(source):
+        hashed.append(source)
+        return upload_key(source)
+
+    monkeypatch.setattr(content_processor, "upload_key", counting_upload_key)
+    monkeypatch.setattr(generator, "generate_summary_and_topics", lambda *args: '{"요약": "요약", "핵심 주제": ["주제"]}')
+    monkeypatch.setattr(generator, "summarize_pages", lambda pages, progress=None: (
+        list(pages) and '{"요약": "요약", "핵심 주제": ["주제"]}'
+    ))
+    monkeypatch.setattr(generator, "generate_questions", lambda summary, topics: '{"questions": []}')
+    processor = ContentProcessor()
+    processor.artifacts = ArtifactStore(str(tmp_path / "artifacts.db"))
+    pipeline = QuestionPipeline(processor, generator, stream_pdf=True)
+    data = make_pdf(["one", "two"])
+
+    for _ in range(2):  # 처음 올린 파일(스트리밍)과 다시 올린 파일(저장된 추출 결과)
+        hashed.clear()
+        pipeline.run('pdf', None, io.BytesIO(data), reuse=False)
+        assert len(hashed) == 1
+
+
+def test_first_extraction_writes_pages_as_they_arrive(tmp_path, monkeypatch):
+    """처음 추출하는 PDF는 페이지를 모아 두지 않고 기록하며, 끝나기 전이나 실패하면 조회되지 않는지 테스트"""
+    monkeypatch.setattr(ArtifactWriter, "BATCH_BYTES", 1)
+    processor = ContentProcessor()
+    processor.artifacts = ArtifactStore(str(tmp_path / "artifacts.db"))
+    data = make_pdf(["one", "two", "three"])
+    key = upload_key(io.BytesIO(data))
+
+    def stored_pages():
+        return processor.artifacts._connection().execute(
+            "SELECT COUNT(*) FROM artifact_pages WHERE sha256 = ?", (key,)
+        ).fetchone()[0]
+
+    metadata = {}
+    pages = processor.iter_pdf_pages(io.BytesIO(data), metadata, key)
+    assert next(pages) == "one" and next(pages) == "two"
+    assert stored_pages() >= 1 and processor.artifacts.get(key) is None
+    pages.close()
+    assert stored_pages() == 0
+
+    assert list(processor.iter_pdf_pages(io.BytesIO(data), metadata, key)) == ["one", "two", "three"]
+    assert processor.artifacts.get(key)["pages"] == 3
+    assert list(processor.artifacts.iter_pages(key)) == ["one", "two", "three"]
@@ -0,0 +1,72 @@
+import json
+
+from config import get_config
+from services.bulk_runner import BulkRunner, discover_files, read_url_list
+from services.pipeline import create_pipeline
+
+
+class FakePipeline:
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.calls = []
+
+    def run(self, content_type, content, file=None, progress=None, reuse=None):
+        self.calls.append(content)
+        if content in self.fail:
+            raise ValueError("처리 실패")
+        return {"summary": content, "topics": [], "questions": []}
+
+
+def test_bulk_run_resumes_from_checkpoint(tmp_path):
+    """완료된 문서는 다시 처리하지 않고 실패한 문서와 새 문서만 처리하는지 테스트"""
+    docs = tmp_path / "docs"
+    (docs / "unit1").mkdir(parents=True)
+    (docs / "unit1" / "a.txt").write_text("문서A", encoding="utf-8")
+    (docs / "b.md").write_text("문서B", encoding="utf-8")
+    (docs / "copy.txt").write_text("문서A", encoding="utf-8")
+    (docs / "skip.csv").write_text("x", encoding="utf-8")
+    output = str(tmp_path / "out.jsonl")
+
+    pipeline = FakePipeline(fail={"문서B"})
+    records = list(BulkRunner(pipeline, output, workers=2).run(discover_files(str(docs))))
+    assert sorted(pipeline.calls) == ["문서A", "문서B"]
+    assert sorted(record["status"] for record in records) == ["failed", "succeeded"]
+
+    (docs / "c.txt").write_text("문서C", encoding="utf-8")
+    pipeline = FakePipeline()
+    list(BulkRunner(pipeline, output, workers=2).run(discover_files(str(docs))))
+    assert sorted(pipeline.calls) == ["문서B", "문서C"]
+
+    lines = [json.loads(line) for line in open(output, encoding="utf-8")]
+    assert len(lines) == 4
+    assert sum(line["status"] == "succeeded" for line in lines) == 3
+
+
+def test_checkpoint_ignores_truncated_line(tmp_path):
+    output = str(tmp_path / "out.jsonl")
+    with open(output + ".checkpoint", "w", encoding="utf-8") as file:
+        file.write("url:https://a.example\nurl:https://b.exa")
+    assert BulkRunner(FakePipeline(), output).completed() == {"url:https://a.example"}
+
+
+def test_read_url_list_detects_youtube(tmp_path):
+    urls = tmp_path / "urls.txt"
+    urls.write_text("# 목록\nhttps://youtu.be/abc\n\nhttps://example.com/page\n", encoding="utf-8")
+    assert [(s.content_type, s.source) for s in read_url_list(str(urls))] == [
+        ("youtube", "https://youtu.be/abc"),
+        ("website", "https://example.com/page")
+    ]
+
+
+def test_create_pipeline_applies_bank_and_batch_settings(tmp_path):
+    """일괄 생성 CLI와 웹 서버가 함께 쓰는 파이프라인이 재사용/배치/스트리밍 설정을 따르는지 테스트"""
+    config = get_config().copy(deep=True)
+    config.QUESTION_BANK.PATH = str(tmp_path / "bank.db")
+    config.QUESTION_BANK.REUSE = False
+    config.BATCH.WORKERS = 7
+    config.PDF.STREAMING = False
+
+    pipeline = create_pipeline(object(), object(), config)
+
+    assert (pipeline.reuse, pipeline.batch_workers, pipeline.stream_pdf) == (False, 7, False)
+    assert pipeline.question_bank.path == config.QUESTION_BANK.PATH
@@ -0,0 +1,96 @@
+import sqlite3
+import time
+
+import pytest
+
+from utils.cache import PersistentCache, make_cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PersistentCache(str(tmp_path / "cache.db"), max_entries=3, ttl_seconds=60)
+
+
+def test_get_and_set_counts_hits_and_misses(cache):
+    """저장한 값을 다시 읽고 적중/미스를 집계하는지 테스트"""
+    key = make_cache_key("gpt-4", [{"role": "user", "content": "안녕"}], 500, 0.3)
+
+    assert cache.get(key) is None
+    cache.set(key, "응답")
+    assert cache.get(key) == "응답"
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_cache_key_depends_on_parameters():
+    """파라미터가 다르면 다른 키가 만들어지는지 테스트"""
+    messages = [{"role": "user", "content": "안녕"}]
+    assert make_cache_key("gpt-4", messages, 500, 0.3) != make_cache_key("gpt-4", messages, 500, 0.7)
+
+
+def test_expired_entries_are_not_returned(cache):
+    """TTL이 지난 항목은 미스로 처리되는지 테스트"""
+    cache.set("key", "value", ttl_seconds=0.01)
+    time.sleep(0.05)
+
+    assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    """용량을 넘으면 가장 오래 사용하지 않은 항목이 제거되는지 테스트"""
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+        time.sleep(0.01)
+    cache.get("a")
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.get("d") == "d"
+
+
+def test_get_does_not_take_the_write_lock(cache):
+    """다른 워커가 쓰기 잠금을 잡고 있어도 조회는 기다리지 않고, 사용 기록은 모아서 반영되는지 테스트"""
+    cache.set("key", "value")
+    writer = sqlite3.connect(cache.path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.monotonic()
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+        assert time.monotonic() - started < 1
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_disabled_cache_is_bypassed(tmp_path):
+    """비활성화된 캐시는 아무것도 저장하지 않는지 테스트"""
+    cache = PersistentCache(str(tmp_path / "cache.db"), enabled=False)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert not (tmp_path / "cache.db").exists()
+
+
+def test_workers_share_the_same_file(tmp_path):
+    """같은 파일을 여는 다른 인스턴스와 캐시를 공유하는지 테스트"""
+    path = str(tmp_path / "cache.db")
+    PersistentCache(path).set("key", "value")
+
+    assert PersistentCache(path).get("key") == "value"
+
+
+def test_forked_worker_opens_its_own_connection(cache, monkeypatch):
+    """preload 후 fork된 워커는 부모의 SQLite 연결을 쓰지 않고 새로 연결하는지 테스트"""
+    cache.set("key", "value")
+    parent = cache._connection()
+
+    monkeypatch.setattr("utils.cache.os.getpid", lambda: -1)
+    child = cache._connection()
+
+    assert child is not parent
+    assert cache.get("key") == "value"
@@ -0,0 +1,66 @@
+import json
+
+from services.deduplicator import Deduplicator
+
+
+def test_repeated_headers_footers_and_page_numbers_are_removed():
+    """페이지마다 반복되는 머리글, 바닥글, 쪽 번호만 지우는지 테스트"""
+    pages = [
+        f"2021 교육과정 안내\n본문 {i} 고유한 내용 문장 {i * 7}.\n- {i + 1} -\nPage {i + 1} of 10"
+        for i in range(10)
+    ]
+
+    cleaned, stats = Deduplicator().strip_repeated_lines(pages)
+
+    assert stats["removed_lines"] == 30
+    assert "교육과정 안내" not in cleaned
+    assert "Page" not in cleaned
+    for i in range(10):
+        assert f"본문 {i} 고유한 내용 문장 {i * 7}." in cleaned
+
+
+def test_text_with_few_pages_is_left_alone():
+    """페이지가 적으면 반복 줄을 판단하지 않는지 테스트"""
+    pages = ["머리글\n본문 하나", "머리글\n본문 둘"]
+    assert Deduplicator().strip_repeated_lines(pages) == (
+        "\n\n".join(pages), {"removed_lines": 0, "removed_characters": 0}
+    )
+
+
+def test_numbered_headings_are_kept(generator, fake_openai):
+    """"Step 1" 같은 번호 붙은 제목은 쪽 번호로 보지 않고, 페이지가 없는 텍스트는 반복 줄을 지우지 않는지 테스트"""
+    pages = [f"Step {i}\n문단{i} 단계별 설명 문장 {i * 3}.\n{i} / 5" for i in range(1, 6)]
+
+    cleaned, stats = Deduplicator().strip_repeated_lines(pages)
+
+    assert stats["removed_lines"] == 5
+    assert all(f"Step {i}" in cleaned for i in range(1, 6))
+
+    content = "\n\n".join(f"Step {i}\n문단{i} 단계별 설명 문장 {i * 3}." for i in range(1, 6))
+    events = {}
+    generator._summarize_document(content, lambda event, data: events.update({event: data}))
+    assert "deduplicated" not in events
+
+
+def test_near_duplicate_chunks_are_dropped_in_order():
+    """거의 같은 청크는 버리고 고유한 청크는 순서대로 남기는지 테스트"""
+    base = " ".join(f"광합성 과정의 {i}단계에서 빛 에너지가 쓰인다." for i in range(40))
+    chunks = [base, "세포 호흡은 전혀 다른 주제를 다룬다. " * 5, base.replace("39단계", "마지막 단계")]
+
+    kept, stats = Deduplicator().drop_duplicate_chunks(chunks)
+
+    assert kept == chunks[:2]
+    assert stats["removed_chunks"] == 1
+
+
+def test_duplicate_chunks_are_not_summarized(generator, fake_openai):
+    """반복된 문단은 요약 호출 없이 건너뛰고 진행 이벤트로 알리는지 테스트"""
+    paragraph = " ".join(f"문단{i}" for i in range(40))
+    content = "\n\n".join([paragraph] * 6)
+    events = {}
+
+    json.loads(generator._summarize_document(content, lambda event, data: events.update({event: data})))
+
+    removed = events["deduplicated"]["removed_chunks"]
+    assert removed >= len(generator.split_text(content)) // 2
+    assert fake_openai.calls - fake_openai.merges == len(generator.split_text(content)) - removed
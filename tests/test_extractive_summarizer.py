@@ -0,0 +1,50 @@
+import json
+
+from services.extractive_summarizer import ExtractiveSummarizer
+
+
+def test_korean_terms_use_character_bigrams():
+    """조사가 붙은 한국어 어절도 같은 색인어를 공유하는지 테스트"""
+    assert set(ExtractiveSummarizer.terms("광합성은")) & set(ExtractiveSummarizer.terms("광합성을"))
+    assert ExtractiveSummarizer.terms("The cells and the ATP") == ["cells", "atp"]
+
+
+def test_condense_keeps_central_sentences_within_budget():
+    """주제 문장을 남기고 관련 없는 문장을 버리며 예산을 지키는지 테스트"""
+    topic = [
+        "광합성은 엽록체에서 빛 에너지를 화학 에너지로 바꾼다.",
+        "엽록체의 광합성은 빛 에너지로 포도당을 만든다.",
+        "Photosynthesis converts light energy in chloroplasts.",
+        "광합성에서 빛 에너지는 포도당의 화학 에너지가 된다."
+    ]
+    noise = [f"오늘 점심 메뉴 {i}번은 김치찌개였다." for i in range(20)]
+    text = " ".join(topic + noise)
+
+    condensed, stats = ExtractiveSummarizer(ratio=0.3).condense(text)
+
+    assert stats["condensed_tokens"] <= stats["original_tokens"] * 0.3 + 30
+    assert stats["kept_sentences"] < stats["sentences"]
+    assert "광합성" in condensed
+    # 원래 순서 유지
+    lines = condensed.split("\n")
+    assert lines == sorted(lines, key=text.index)
+
+
+def test_short_text_is_returned_unchanged():
+    """한 문장짜리 입력은 그대로 반환하는지 테스트"""
+    text = "짧은 문장 하나."
+    assert ExtractiveSummarizer().condense(text)[0] == text
+
+
+def test_presummary_reduces_map_phase_calls(generator, fake_openai, monkeypatch):
+    """사전 요약을 켜면 긴 문서의 청크 요약 호출 수가 줄어드는지 테스트"""
+    content = "\n\n".join(f"문단{i} " + "중복된 설명 문장이다. " * 6 for i in range(8))
+    monkeypatch.setattr(generator.config.PRESUMMARY, "ENABLED", True)
+    monkeypatch.setattr(generator.config.PRESUMMARY, "MIN_TOKENS", 100)
+    events = []
+
+    result = json.loads(generator._summarize_document(content, lambda event, data: events.append(event)))
+
+    assert events[0] == "condensed"
+    assert fake_openai.calls < 8
+    assert result["핵심 주제"]
@@ -0,0 +1,42 @@
+import pytest
+
+from services.html_extractor import HtmlExtractor, decode_html
+
+PAGE = """<html><head><title> 광합성 </title><script>var tracking = 1;</script></head><body>
+<header><a href="/">홈</a> <a href="/about">소개</a></header>
+<div id="cookie-banner"><p>이 사이트는 쿠키를 사용합니다. 계속 이용하면 동의한 것으로 간주합니다.</p></div>
+<div class="layout">
+<div class="sidebar"><ul><li><a href="/1">다른 기사로 이동하는 긴 링크 텍스트입니다</a></li></ul></div>
+<article class="post"><h1>광합성의 원리</h1>
+<p>광합성은 식물이 빛 에너지를 이용하여, 이산화탄소와 물로부터 포도당을 만드는 과정이다.
+<p>엽록체의 틸라코이드에서 명반응이 일어나고, 스트로마에서 캘빈 회로가 진행된다.
+<ul><li>명반응: ATP와 NADPH 생성, 물의 광분해</li></ul>
+</article>
+<div class="comments"><p>댓글: 좋은 글 감사합니다, 잘 읽었습니다. 다음 글도 기대할게요.</p></div>
+</div>
+<footer><p>© 2024 과학 뉴스. 무단 전재 및 재배포 금지.</p></footer></body></html>"""
+
+
+@pytest.mark.parametrize("use_lxml", [True, False])
+def test_keeps_main_content_and_drops_boilerplate(use_lxml):
+    """메뉴/쿠키 배너/사이드바/댓글/푸터를 버리고 본문만 순서대로 남기는지 테스트"""
+    content = HtmlExtractor(use_lxml=use_lxml).extract(PAGE)
+
+    assert content.title == "광합성"
+    assert content.blocks == [
+        "광합성의 원리",
+        "광합성은 식물이 빛 에너지를 이용하여, 이산화탄소와 물로부터 포도당을 만드는 과정이다.",
+        "엽록체의 틸라코이드에서 명반응이 일어나고, 스트로마에서 캘빈 회로가 진행된다.",
+        "명반응: ATP와 NADPH 생성, 물의 광분해"
+    ]
+
+
+def test_short_page_without_candidates_keeps_all_text():
+    content = HtmlExtractor().extract("<p>짧은 문장</p><h2>제목</h2>")
+    assert content.blocks == ["짧은 문장", "제목"]
+
+
+def test_decode_html_uses_meta_charset():
+    html = '<html><head><meta charset="euc-kr"></head><body>한글</body></html>'.encode("euc-kr")
+    assert "한글" in decode_html(html)
+    assert "한글" in decode_html("한글".encode("utf-8"), "utf-8")
@@ -0,0 +1,80 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services.http_fetcher import HttpFetcher
+from utils.cache import PersistentCache
+from utils.exceptions import ContentProcessingError
+
+PAGE = "<html><head><title>제목</title></head><body><p>본문 문단</p></body></html>".encode("utf-8")
+
+
+class Handler(BaseHTTPRequestHandler):
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        Handler.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/page":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(PAGE)))
+            self.end_headers()
+            self.wfile.write(PAGE)
+        elif self.path == "/huge":
+            # Content-Length 없이 계속 보내는 응답
+            self.send_response(200)
+            self.end_headers()
+            for _ in range(100):
+                self.wfile.write(b"x" * 1024)
+        elif self.path == "/slow":
+            time.sleep(1)
+            self.send_response(200)
+            self.end_headers()
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    Handler.requests = []
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_revalidates_cached_page_with_etag(server, tmp_path):
+    """ETag가 있는 응답을 캐시하고, 다시 가져올 때 304면 캐시된 본문을 쓰는지 테스트"""
+    fetcher = HttpFetcher(cache=PersistentCache(str(tmp_path / "cache.db"), namespace="http_response"))
+
+    first = fetcher.fetch(f"{server}/page")
+    second = fetcher.fetch(f"{server}/page")
+
+    assert first.content == second.content == PAGE and first.encoding == "utf-8"
+    assert not first.cached and second.cached
+    assert Handler.requests == [("/page", None), ("/page", '"v1"')]
+
+
+def test_size_cap_timeout_and_http_errors(server):
+    """크기 한도, 읽기 타임아웃, 오류 응답을 ContentProcessingError로 알리는지 테스트"""
+    fetcher = HttpFetcher(max_bytes=10 * 1024, read_timeout=0.2)
+
+    with pytest.raises(ContentProcessingError, match="너무 큽니다"):
+        fetcher.fetch(f"{server}/huge")
+    with pytest.raises(ContentProcessingError, match="시간이 초과"):
+        fetcher.fetch(f"{server}/slow")
+    with pytest.raises(ContentProcessingError, match="404"):
+        fetcher.fetch(f"{server}/missing")
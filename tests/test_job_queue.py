@@ -0,0 +1,128 @@
+import time
+
+import pytest
+
+from services.job_queue import JobQueue, JobStore, MAX_ATTEMPTS, QUEUED, RUNNING, SUCCEEDED, FAILED
+from utils.exceptions import JobQueueFullError, ValidationError
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.db"), max_queue=2, stale_seconds=60)
+
+
+def wait_for(store, job_id, statuses=(SUCCEEDED, FAILED), timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = store.get(job_id)
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.02)
+    raise AssertionError("작업이 제시간에 끝나지 않았습니다.")
+
+
+def test_claim_marks_oldest_job_running(store):
+    """가장 오래된 대기 작업부터 한 번만 할당되는지 테스트"""
+    first = store.create({"type": "text", "content": "첫 번째"})
+    store.create({"type": "text", "content": "두 번째"})
+
+    claimed = store.claim()
+
+    assert claimed["id"] == first["id"]
+    assert claimed["status"] == RUNNING
+    assert store.claim()["payload"]["content"] == "두 번째"
+    assert store.claim() is None
+
+
+def test_queue_depth_is_limited(store):
+    """대기열 한도를 넘으면 JobQueueFullError가 발생하는지 테스트"""
+    store.create({"type": "text"})
+    store.create({"type": "text"})
+
+    with pytest.raises(JobQueueFullError):
+        store.create({"type": "text"})
+
+
+def test_stale_running_jobs_are_requeued(store):
+    """갱신이 멈춘 실행 중 작업이 다시 대기열로 돌아가는지 테스트"""
+    job = store.create({"type": "text"})
+    store.claim()
+    store.stale_seconds = 0
+
+    assert store.requeue_stale() == 1
+    assert store.get(job["id"])["status"] == QUEUED
+
+
+def test_worker_pool_runs_jobs_and_records_progress(store):
+    """워커가 작업을 실행하고 진행 상황과 결과를 저장하는지 테스트"""
+    def handler(payload, progress):
+        progress("extracted", {"characters": len(payload["content"])})
+        if payload["content"] == "실패":
+            raise ValidationError("텍스트가 없습니다.")
+        return {"summary": payload["content"]}
+
+    queue = JobQueue(store, handler, workers=2, poll_interval=0.05)
+    ok = queue.submit({"type": "text", "content": "본문"})
+    bad = queue.submit({"type": "text", "content": "실패"})
+
+    ok = wait_for(store, ok["id"])
+    bad = wait_for(store, bad["id"])
+
+    assert ok["status"] == SUCCEEDED
+    assert ok["result"] == {"summary": "본문"}
+    assert ok["progress"] == {"stage": "extracted", "characters": 2}
+    assert bad["status"] == FAILED
+    assert bad["error"]["error_code"] == "VALIDATION_ERROR"
+
+
+def test_late_result_from_requeued_attempt_is_discarded(store):
+    """다시 대기열로 돌아간 작업의 이전 실행은 결과를 덮어쓰지 못하는지 테스트"""
+    job = store.create({"type": "text"})
+    first = store.claim()
+    store.stale_seconds = 0
+    store.requeue_stale()
+    second = store.claim()
+
+    assert not store.finish(job["id"], first["attempts"], {"summary": "이전 실행"})
+    assert not store.fail(job["id"], first["attempts"], {"message": "이전 실행"})
+    assert store.get(job["id"])["status"] == RUNNING
+    assert store.finish(job["id"], second["attempts"], {"summary": "새 실행"})
+    assert store.get(job["id"])["result"] == {"summary": "새 실행"}
+
+
+def test_heartbeat_keeps_long_step_from_being_requeued(store):
+    """진행 이벤트 없이 오래 걸리는 작업도 생존 신호 덕분에 다시 실행되지 않는지 테스트"""
+    store.stale_seconds = 0.3
+    requeued = []
+
+    def handler(payload, progress):
+        time.sleep(0.6)
+        requeued.append(store.requeue_stale())
+        return {"summary": payload["content"]}
+
+    queue = JobQueue(store, handler, workers=1, poll_interval=0.05, heartbeat_interval=0.05)
+    job = wait_for(store, queue.submit({"type": "text", "content": "본문"})["id"])
+
+    assert requeued == [0]
+    assert (job["status"], job["attempts"]) == (SUCCEEDED, 1)
+
+
+def test_cleanup_runs_only_when_job_is_terminal(store, tmp_path):
+    """작업이 끝났을 때만 정리 함수가 불리고, 반복 중단된 작업도 정리되는지 테스트"""
+    cleaned = []
+    queue = JobQueue(store, lambda payload, progress: {}, workers=1, poll_interval=0.05, cleanup=cleaned.append)
+    done = wait_for(store, queue.submit({"type": "text", "file_path": "done.pdf"})["id"])
+    assert done["status"] == SUCCEEDED
+    assert cleaned == [{"type": "text", "file_path": "done.pdf"}]
+
+    stuck = JobStore(str(tmp_path / "stuck.db"), stale_seconds=0)
+    job = stuck.create({"type": "pdf", "file_path": "stuck.pdf"})
+    for _ in range(MAX_ATTEMPTS - 1):
+        stuck.claim()
+        assert stuck.abandon_stale() == []
+        assert stuck.requeue_stale() == 1
+    stuck.claim()
+
+    abandoned = stuck.abandon_stale()
+    assert [item["payload"]["file_path"] for item in abandoned] == ["stuck.pdf"]
+    assert stuck.get(job["id"])["error"]["error_code"] == "JOB_ABANDONED"
@@ -0,0 +1,98 @@
+import json
+
+import openai
+import pytest
+
+from services.question_generator import QuestionGenerator
+from services.question_schema import normalize_question, question_errors
+from tests.conftest import make_question, make_response
+from utils.exceptions import QuestionGeneratorError
+from utils.json_stream import JsonArrayStream, loads_tolerant
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('```json\n{"a": [1, 2,], // 주석\n "b": True}\n```', {"a": [1, 2], "b": True}),
+    ('결과입니다: {"요약": "첫 줄\n둘째 줄", "핵심 주제": ["x"]} 이상입니다.', {"요약": "첫 줄\n둘째 줄", "핵심 주제": ["x"]}),
+    ('{"a": 1 /* 설명 */, "b": None,}', {"a": 1, "b": None}),
+    ('{"요약": "중간에 잘린 요약', {"요약": "중간에 잘린 요약"}),
+    ('[{"번호": 1}, {"번호": 2, "요약": "x", "핵심', [{"번호": 1}, {"번호": 2, "요약": "x"}]),
+])
+def test_loads_tolerant_repairs_common_defects(text, expected):
+    """코드 펜스, 주석, 끝 쉼표, 잘린 출력 등을 고쳐 해석하는지 테스트"""
+    assert loads_tolerant(text) == expected
+
+
+def test_loads_tolerant_raises_when_nothing_to_salvage():
+    with pytest.raises(json.JSONDecodeError):
+        loads_tolerant("JSON이 아닌 응답")
+
+
+def test_stream_items_tolerate_trailing_commas():
+    """스트림 항목 안의 끝 쉼표도 고쳐서 꺼내는지 테스트"""
+    stream = JsonArrayStream("questions")
+    assert stream.feed('```json\n{"questions": [{"질문": "하나", "정답": "A",}, ') == [{"질문": "하나", "정답": "A"}]
+
+
+def test_question_schema_normalizes_minor_differences():
+    """문자열 근접도와 소문자 정답은 고치고, 보기가 빠진 문제는 거부하는지 테스트"""
+    question = make_question(0)
+    question["보기"]["B"]["근접도"] = "70점"
+    question["정답"] = " a"
+
+    normalized = normalize_question(question)
+
+    assert normalized["보기"]["B"]["근접도"] == 70
+    assert normalized["정답"] == "A"
+
+    del question["보기"]["E"]
+    assert normalize_question(question) is None
+    assert "보기는 A~E 다섯 개여야 합니다." in question_errors(question)
+
+
+def test_truncated_question_set_requests_only_missing_questions(generator, monkeypatch):
+    """잘린 응답에서 완성된 문제는 살리고 빠진 개수만 다시 요청하는지 테스트"""
+    full = json.dumps({"questions": [make_question(i) for i in range(3)]}, ensure_ascii=False)
+    truncated = "```json\n" + full[:full.index('"문제2"') + 10]
+    prompts = []
+
+    def create(model, messages, **kwargs):
+        prompts.append(messages[0]["content"])
+        if len(prompts) == 1:
+            return make_response(truncated)
+        return make_response(json.dumps({"questions": [make_question(9)]}, ensure_ascii=False))
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", create)
+
+    questions = json.loads(generator.generate_questions("요약", ["주제"]))["questions"]
+
+    assert [question["질문"] for question in questions] == ["문제0", "문제1", "문제9"]
+    assert "1개의 문제만" in prompts[1]
+    assert "- 문제0" in prompts[1]
+
+
+def test_truncated_summary_is_requested_again_and_not_cached(generator, monkeypatch):
+    """요약 문자열이 닫히지 않은 잘린 응답은 받아들이지 않고 한도를 늘려 다시 요청하는지 테스트"""
+    complete = json.dumps({"요약": "광합성은 빛 에너지를 쓴다.", "핵심 주제": ["광합성"]}, ensure_ascii=False)
+    responses = ['{"요약": "광합성은 빛 에너지를', complete]
+    limits = []
+
+    def create(model, messages, max_tokens, **kwargs):
+        limits.append(max_tokens)
+        return make_response(responses[len(limits) - 1])
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", create)
+
+    assert json.loads(generator.generate_summary_and_topics("광합성 글"))["요약"] == "광합성은 빛 에너지를 쓴다."
+    assert limits[1] == limits[0] * 2
+
+    responses[1] = responses[0]
+    limits.clear()
+    with pytest.raises(QuestionGeneratorError):
+        generator.generate_summary_and_topics("다른 글")
+    assert generator.summary_cache.get(generator.fingerprint("다른 글")) is None
+
+
+def test_truncated_batch_item_is_left_for_retry():
+    """잘린 배치 응답에서 쓰다 만 마지막 항목은 버리는지 테스트"""
+    result = '[{"번호": 1, "요약": "하나", "핵심 주제": ["a"]}, {"번호": 2, "요약": "둘은 중간에'
+    assert QuestionGenerator._parse_batch(result, 2) == [{"요약": "하나", "핵심 주제": ["a"]}, None]
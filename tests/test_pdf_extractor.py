@@ -0,0 +1,48 @@
+import io
+
+import PyPDF2
+
+from services.content_processor import ContentProcessor
+from services.pdf_extractor import PdfExtractor
+from tests.conftest import make_pdf
+
+
+def test_parallel_extraction_keeps_page_order(tmp_path):
+    """프로세스 풀로 나눠 추출해도 페이지 순서가 유지되는지 테스트"""
+    texts = [f"Page number {i}" for i in range(10)]
+    path = tmp_path / "book.pdf"
+    path.write_bytes(make_pdf(texts))
+    extractor = PdfExtractor(min_parallel_pages=4, workers=2, pages_per_task=3)
+
+    pages, metadata = extractor.extract(str(path))
+    uploaded, _ = extractor.extract(io.BytesIO(path.read_bytes()))
+
+    assert pages == texts == uploaded
+    assert metadata["parallel"] and metadata["pages"] == 10
+    assert len(metadata["page_seconds"]) == 10
+
+
+def test_small_pdf_stays_in_process_and_isolates_bad_page(monkeypatch):
+    """작은 PDF는 현재 프로세스에서 추출하고, 실패한 페이지만 비워 두는지 테스트"""
+    original = PyPDF2.PageObject.extract_text
+
+    def extract_text(page, *args, **kwargs):
+        text = original(page, *args, **kwargs)
+        if text == "broken":
+            raise ValueError("bad content stream")
+        return text
+
+    monkeypatch.setattr(PyPDF2.PageObject, "extract_text", extract_text)
+    extractor = PdfExtractor(min_parallel_pages=32, workers=4)
+
+    pages, metadata = extractor.extract(io.BytesIO(make_pdf(["first", "broken", "third"])))
+
+    assert pages == ["first", "", "third"]
+    assert not metadata["parallel"]
+    assert metadata["failed_pages"] == [2]
+
+
+def test_content_processor_reports_page_metadata():
+    text, metadata = ContentProcessor().process_pdf_with_metadata(io.BytesIO(make_pdf(["one", " ", "two"])))
+    assert text == "one\n\ntwo"
+    assert (metadata["pages"], metadata["empty_pages"]) == (3, 1)
@@ -0,0 +1,34 @@
+from services.question_bank import QuestionBank
+from tests.conftest import make_question
+
+
+def test_add_is_idempotent_and_lookup_by_fingerprint(tmp_path):
+    """같은 문서의 같은 문제 세트는 한 번만 저장되고 문서 해시로 최신순 조회되는지 테스트"""
+    bank = QuestionBank(str(tmp_path / "bank.db"))
+    first = bank.add("doc1", "요약", ["주제"], [make_question(0)], "text")
+    assert bank.add("doc1", "요약", ["주제"], [make_question(0)], "text") == first
+    second = bank.add("doc1", "요약", ["주제"], [make_question(1)], "text")
+
+    assert [s["id"] for s in bank.find_by_fingerprint("doc1")] == [second, first]
+    assert bank.latest("doc1")["questions"][0]["보기"]["A"]["근접도"] == make_question(1)["보기"]["A"]["근접도"]
+    assert bank.latest("doc2") is None
+    assert bank.stats() == {"enabled": True, "sets": 2, "documents": 1}
+
+
+def test_search_matches_korean_keywords_with_particles(tmp_path):
+    """조사가 붙은 키워드와 여러 키워드 검색, 주제 우선 정렬 테스트"""
+    bank = QuestionBank(str(tmp_path / "bank.db"))
+    topic_hit = bank.add("doc1", "세포 호흡에 관한 글", ["인공지능", "기계 학습"], [make_question(0)])
+    summary_hit = bank.add("doc2", "인공지능의 역사를 다룬 글", ["역사"], [make_question(1)])
+    bank.add("doc3", "경제 성장", ["GDP", "Inflation"], [make_question(2)])
+
+    assert [s["id"] for s in bank.search("인공지능은")] == [topic_hit, summary_hit]
+    assert [s["id"] for s in bank.search("인공지능 학습")] == [topic_hit]
+    assert [s["fingerprint"] for s in bank.search("inflation")] == ["doc3"]
+    assert bank.search('"') == []
+
+
+def test_disabled_bank_stores_nothing(tmp_path):
+    bank = QuestionBank(str(tmp_path / "bank.db"), enabled=False)
+    assert bank.add("doc1", "요약", ["주제"], [make_question(0)]) is None
+    assert bank.search("주제") == []
@@ -0,0 +1,238 @@
+import json
+import re
+
+import openai
+
+from services.question_generator import QuestionGenerator
+from services.question_schema import question_id
+from tests.conftest import make_question, make_response
+from utils.cache import PersistentCache
+from utils.json_stream import JsonArrayStream
+from utils.rate_limiter import RateLimiter
+
+
+def test_map_phase_keeps_chunk_order(generator, fake_openai):
+    """병렬 요약 결과가 청크 순서대로 합쳐지는지 테스트"""
+    content = "\n\n".join(f"문단{i} " + "내용 " * 12 for i in range(8))
+    chunk_count = len(generator.split_text(content))
+    assert chunk_count == 8
+
+    result = json.loads(generator.generate_summary_and_topics(content))
+
+    expected = " ".join(f"요약{i}" for i in range(chunk_count))
+    assert result["요약"] == expected
+    assert result["핵심 주제"] == [f"주제{i}" for i in range(min(chunk_count, 5))]
+
+
+def test_rate_limiter_waits_when_requests_exhausted():
+    """요청 버킷이 비면 리필될 때까지 대기하는지 테스트"""
+    limiter = RateLimiter(requests_per_minute=600)
+    for _ in range(600):
+        assert limiter.acquire() == 0
+
+    waited = limiter.acquire()
+    assert 0 < waited <= 0.2
+
+
+def test_rate_limiter_clamps_oversized_token_requests():
+    """TPM 용량보다 큰 요청도 무한 대기하지 않는지 테스트"""
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=6000)
+    assert limiter.acquire(tokens=100000) == 0
+
+
+def test_repeated_calls_are_served_from_cache(generator, fake_openai):
+    """같은 콘텐츠를 다시 요약하면 API를 호출하지 않는지 테스트"""
+    content = "\n\n".join(f"문단{i} " + "내용 " * 12 for i in range(8))
+
+    first = generator._summarize_document(content)
+    calls = fake_openai.calls
+    second = generator._summarize_document(content)
+
+    assert second == first
+    assert fake_openai.calls == calls
+    assert generator.cache.stats()["hits"] == 8
+
+
+def test_summarized_document_skips_map_reduce(generator, fake_openai):
+    """공백만 다른 같은 문서는 문서 캐시에서 바로 요약을 반환하는지 테스트"""
+    content = "\n\n".join(f"문단{i} " + "내용 " * 12 for i in range(8))
+
+    first = generator.generate_summary_and_topics(content)
+    calls = fake_openai.calls
+    second = generator.generate_summary_and_topics("  " + content.replace("\n\n", "\n \n") + "\n")
+
+    assert second == first
+    assert fake_openai.calls == calls
+    assert generator.cache.stats()["hits"] == 0
+    assert generator.summary_cache.stats()["hits"] == 1
+
+
+def test_long_summaries_are_reduced_level_by_level(generator, fake_openai):
+    """합친 요약이 길면 묶음 단위로 병렬 축약하고 주제도 합치는지 테스트"""
+    fake_openai.summary_length = 10
+    content = "\n\n".join(f"문단{i} " + "내용 " * 12 for i in range(16))
+
+    result = json.loads(generator.generate_summary_and_topics(content))
+
+    # 16개 요약 → 2개씩 묶인 8개 축약 (한 단계로 예산 안에 들어옴)
+    assert fake_openai.merges == 8
+    assert result["요약"] == " ".join(["압축"] * 8)
+    assert result["핵심 주제"] == ["주제0", "주제2", "주제4", "주제6", "주제8"]
+    assert not generator.chunker.exceeds(result["요약"], generator.chunk_size)
+
+
+def test_json_array_stream_yields_items_as_they_close():
+    """일부만 도착한 JSON에서도 닫힌 배열 항목을 바로 꺼내는지 테스트"""
+    stream = JsonArrayStream("questions")
+
+    assert stream.feed('{"questions": [{"질문": "첫 번째 {괄호}", ') == []
+    assert stream.feed('"정답": "A"}, {"질문": "두') == [{"질문": "첫 번째 {괄호}", "정답": "A"}]
+    assert stream.feed('번째 \\"인용\\"", "정답": "B"}]}') == [{"질문": '두번째 "인용"', "정답": "B"}]
+
+
+def test_generate_questions_stream_yields_each_question(generator, monkeypatch):
+    """문제 생성 스트림이 문제를 하나씩 내보내고 결과를 캐시하는지 테스트"""
+    questions = {"questions": [make_question(i) for i in range(3)]}
+    text = json.dumps(questions, ensure_ascii=False)
+
+    def create(stream=False, **kwargs):
+        assert stream
+        return iter(
+            {"choices": [{"delta": {"content": text[i:i + 7]}}]}
+            for i in range(0, len(text), 7)
+        )
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", create)
+
+    streamed = list(generator.generate_questions_stream("요약", ["주제"]))
+
+    assert [{k: v for k, v in q.items() if k != "id"} for q in streamed] == questions["questions"]
+    assert all(q["id"] == question_id(q) for q in streamed)
+    assert json.loads(generator.generate_questions("요약", ["주제"])) == {"questions": streamed}
+
+
+def test_generate_questions_stream_skips_sent_questions_by_id(generator, monkeypatch):
+    """스트림 파서가 앞 항목을 버려도 최종 파싱에서 이미 보낸 문제를 다시 보내지 않는지 테스트"""
+    from services import question_generator
+
+    questions = [make_question(i) for i in range(3)]
+    text = json.dumps({"questions": questions}, ensure_ascii=False)
+
+    class DroppingStream(JsonArrayStream):
+        def feed(self, chunk):
+            items = super().feed(chunk)
+            if items and not getattr(self, "dropped", False):
+                self.dropped = True
+                return items[1:]
+            return items
+
+    monkeypatch.setattr(question_generator, "JsonArrayStream", DroppingStream)
+    monkeypatch.setattr(openai.ChatCompletion, "create", lambda stream=False, **kwargs: iter(
+        [{"choices": [{"delta": {"content": text}}]}]
+    ))
+
+    streamed = list(generator.generate_questions_stream("요약", ["주제"]))
+
+    assert sorted(q["질문"] for q in streamed) == sorted(q["질문"] for q in questions)
+    assert len({q["id"] for q in streamed}) == 3
+
+
+def test_stages_use_model_tiers(generator, monkeypatch):
+    """청크 요약은 빠른 모델, 문제 생성은 고성능 모델로 호출하는지 테스트"""
+    models = []
+
+    def create(model, messages, **kwargs):
+        models.append(model)
+        return make_response(json.dumps({
+            "요약": "요약",
+            "핵심 주제": ["주제"],
+            "questions": [make_question(i) for i in range(3)]
+        }))
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", create)
+    monkeypatch.setitem(generator.config.LLM.STAGE_MODELS, "feedback", "gpt-4o")
+
+    generator._summarize_chunk("문단0 내용")
+    generator.generate_questions("요약", ["주제"])
+    generator.generate_feedback("질문", "90", "80")
+
+    assert models == ["gpt-3.5-turbo", generator.config.OPENAI.MODEL, "gpt-4o"]
+
+
+def test_stub_backend_returns_pipeline_shaped_json(generator, monkeypatch):
+    """stub 백엔드가 네트워크 없이 요약과 문제 세트를 만드는지 테스트"""
+    monkeypatch.setitem(generator.config.LLM.STAGE_MODELS, "summary", "stub:stub-fast")
+    monkeypatch.setitem(generator.config.LLM.STAGE_MODELS, "questions", "stub:stub-strong")
+
+    summary = json.loads(generator.generate_summary_and_topics("광합성은 빛 에너지를 화학 에너지로 바꾼다. 엽록체에서 일어난다."))
+    questions = json.loads(generator.generate_questions(summary["요약"], summary["핵심 주제"]))
+
+    assert summary["핵심 주제"]
+    assert len(questions["questions"]) == 3
+    assert set(questions["questions"][0]["보기"]) == set("ABCDE")
+    assert "stub" in generator.stats()["api"]
+
+
+def test_parse_batch_tolerates_prose_and_missing_items():
+    """배치 응답의 앞뒤 설명, 번호 순서 뒤섞임, 잘못된 항목을 처리하는지 테스트"""
+    result = '결과입니다:\n[{"번호": 3, "요약": "셋", "핵심 주제": ["c"]}, {"번호": 1, "요약": "하나", "핵심 주제": ["a"]}, {"번호": 2, "요약": 5}]'
+
+    items = QuestionGenerator._parse_batch(result, 3)
+
+    assert items == [{"요약": "하나", "핵심 주제": ["a"]}, None, {"요약": "셋", "핵심 주제": ["c"]}]
+    assert QuestionGenerator._parse_batch("JSON 아님", 2) == [None, None]
+
+
+def test_batch_mode_packs_chunks_and_falls_back_per_item(generator, monkeypatch):
+    """배치 모드에서 청크를 묶어 호출하고 빠진 항목만 개별 호출하는지 테스트"""
+    prompts = []
+
+    def create(model, messages, **kwargs):
+        prompt = messages[0]["content"]
+        prompts.append(prompt)
+        numbers = re.findall(r"문단(\d+)", prompt)
+        if "[조각 " in prompt:
+            # 첫 번째 조각의 결과를 빠뜨림
+            return make_response(json.dumps([
+                {"번호": position, "요약": f"요약{number}", "핵심 주제": [f"주제{number}"]}
+                for position, number in enumerate(numbers, start=1) if position > 1
+            ], ensure_ascii=False))
+        return make_response(json.dumps({"요약": f"요약{numbers[0]}", "핵심 주제": [f"주제{numbers[0]}"]}))
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", create)
+    monkeypatch.setattr(generator.config.LLM, "BATCH_CHUNKS", 4)
+    content = "\n\n".join(f"문단{i} " + "내용 " * 12 for i in range(8))
+
+    result = json.loads(generator._summarize_document(content))
+
+    assert result["요약"] == " ".join(f"요약{i}" for i in range(8))
+    # 4개씩 2번의 배치 호출 + 빠진 항목 2개의 개별 호출
+    assert sum("[조각 " in prompt for prompt in prompts) == 2
+    assert len(prompts) == 4
+
+
+def test_feedback_matrix_is_precomputed_once(generator, monkeypatch):
+    """문제 세트의 보기별 피드백을 한 번의 호출로 미리 만들고 조회하는지 테스트"""
+    monkeypatch.setattr(generator.config.FEEDBACK, "PRECOMPUTE", True)
+    questions = [{**make_question(i), "id": f"q{i}"} for i in range(2)]
+    matrix = {"feedback": [
+        {"번호": number, **{key: f"{number}{key} 피드백" for key in "ABCDE"}}
+        for number in (2, 1)
+    ]}
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return make_response("```json\n" + json.dumps(matrix, ensure_ascii=False) + "\n```")
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", create)
+
+    generator.schedule_feedback(questions)
+    generator._feedback_executor.shutdown(wait=True)
+    generator._feedback_executor = None
+    generator.schedule_feedback(questions)
+
+    assert len(calls) == 1
+    assert generator.lookup_feedback("q0", "c") == "1C 피드백"
+    assert generator.lookup_feedback("q1", "A") == "2A 피드백"
+    assert generator.lookup_feedback("q2", "A") is None
@@ -0,0 +1,112 @@
+import openai
+import pytest
+
+from services.llm_backends import classify_openai_error, openai_retry_after
+from utils.exceptions import CircuitOpenError
+from utils.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    ResilientCaller,
+    RETRY,
+    THROTTLE
+)
+
+
+def make_caller(**kwargs):
+    options = dict(
+        classify=classify_openai_error,
+        retry_after=openai_retry_after,
+        max_retries=3,
+        base_delay=0.001,
+        max_delay=0.01
+    )
+    options.update(kwargs)
+    return ResilientCaller(**options)
+
+
+def failing(errors, result="ok"):
+    """errors를 차례로 발생시킨 뒤 result를 반환하는 함수"""
+    errors = list(errors)
+
+    def func():
+        if errors:
+            raise errors.pop(0)
+        return result
+    return func
+
+
+def test_retries_transient_errors_until_success():
+    """일시적인 오류는 재시도 후 성공하는지 테스트"""
+    caller = make_caller()
+    func = failing([
+        openai.error.RateLimitError("too many requests", headers={"retry-after": "0.001"}),
+        openai.error.APIError("server error", http_status=502)
+    ])
+
+    assert caller.call(func) == "ok"
+    stats = caller.stats()
+    assert stats["retries"] == 2
+    assert stats["throttles"] == 1
+    assert stats["failures"] == 1
+    assert stats["circuit_state"] == CircuitBreaker.CLOSED
+
+
+def test_non_retryable_errors_are_raised_immediately():
+    """요청 자체의 오류는 재시도하지 않는지 테스트"""
+    caller = make_caller()
+    func = failing([openai.error.InvalidRequestError("bad request", param=None)])
+
+    with pytest.raises(openai.error.InvalidRequestError):
+        caller.call(func)
+    assert caller.stats()["retries"] == 0
+
+
+def test_circuit_opens_after_persistent_failures():
+    """오류가 계속되면 서킷이 열려 바로 실패하는지 테스트"""
+    caller = make_caller(max_retries=0, breaker=CircuitBreaker(failure_threshold=2, recovery_seconds=60))
+    func = failing([openai.error.ServiceUnavailableError("down")] * 5)
+
+    for _ in range(2):
+        with pytest.raises(openai.error.ServiceUnavailableError):
+            caller.call(func)
+
+    with pytest.raises(CircuitOpenError):
+        caller.call(func)
+    assert caller.stats()["circuit_state"] == CircuitBreaker.OPEN
+    assert caller.stats()["rejected"] == 1
+
+
+def test_half_open_circuit_closes_after_successful_probe():
+    """복구 시간이 지나면 시험 호출 성공으로 서킷이 닫히는지 테스트"""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0)
+    breaker.record_failure()
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_concurrency_limit_follows_aimd():
+    """속도 제한 시 한도를 절반으로 줄이고 성공 시 천천히 늘리는지 테스트"""
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+    assert 4 < limiter.limit < 6
+
+
+def test_openai_errors_are_classified():
+    """OpenAI 예외 분류 테스트"""
+    assert classify_openai_error(openai.error.RateLimitError("slow down")) == THROTTLE
+    assert classify_openai_error(openai.error.Timeout("timeout")) == RETRY
+    assert classify_openai_error(openai.error.APIError("bad gateway", http_status=502)) == RETRY
+    assert classify_openai_error(openai.error.AuthenticationError("no key")) is None
+    assert classify_openai_error(
+        openai.error.RateLimitError("quota", code="insufficient_quota")
+    ) is None
@@ -0,0 +1,134 @@
+import io
+import json
+import threading
+import time
+
+import openai
+
+from services.artifact_store import ArtifactStore
+from services.content_processor import ContentProcessor
+from services.pipeline import QuestionPipeline
+from services.question_bank import QuestionBank
+from services.question_generator import ContentFingerprint, QuestionGenerator
+from tests.conftest import make_pdf, make_question, make_response
+
+
+def make_pages(count):
+    return [f"문단{i} " + "내용 " * 12 for i in range(count)]
+
+
+def test_summarize_pages_overlaps_extraction(generator, fake_openai, monkeypatch):
+    """뒤쪽 페이지를 추출하기 전에 앞쪽 청크 요약이 시작되고 결과는 전체 요약과 같은지 테스트"""
+    pages = make_pages(12)
+    events = []
+    create = openai.ChatCompletion.create
+
+    def recording_create(**kwargs):
+        events.append("call")
+        return create(**kwargs)
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", recording_create)
+
+    def slow_pages():
+        for page in pages:
+            time.sleep(0.01)
+            events.append("page")
+            yield page
+
+    streamed = json.loads(generator.summarize_pages(slow_pages()))
+
+    assert events.index("call") < len(pages)
+    assert streamed["요약"] == " ".join(f"요약{i}" for i in range(len(pages)))
+    content = "\n\n".join(pages)
+    assert generator.summary_cache.get(QuestionGenerator.fingerprint(content)) is not None
+
+
+def test_summarize_pages_applies_backpressure(generator, monkeypatch):
+    """요약이 밀리면 페이지 추출이 멈추는지 테스트"""
+    generator.max_concurrency = 1
+    release = threading.Event()
+    consumed = []
+
+    def blocked_create(**kwargs):
+        release.wait(5)
+        return make_response(json.dumps({"요약": "요약", "핵심 주제": ["주제"]}, ensure_ascii=False))
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", blocked_create)
+
+    def pages():
+        for page in make_pages(40):
+            consumed.append(page)
+            yield page
+
+    worker = threading.Thread(target=generator.summarize_pages, args=(pages(),))
+    worker.start()
+    time.sleep(0.3)
+    consumed_while_blocked = len(consumed)
+    release.set()
+    worker.join(5)
+
+    assert consumed_while_blocked < 40
+    assert len(consumed) == 40
+
+
+def test_content_fingerprint_matches_joined_text():
+    pages = ["첫 페이지\n본문", "", "둘째  페이지"]
+    fingerprint = ContentFingerprint()
+    for page in pages:
+        fingerprint.update(page)
+    assert fingerprint.hexdigest() == QuestionGenerator.fingerprint("\n\n".join(pages))
+
+
+def test_pipeline_streams_pdf_and_matches_document_hash(generator, monkeypatch):
+    """스트리밍 PDF 처리 결과의 문서 해시가 전체 추출 방식과 같은지 테스트"""
+    monkeypatch.setattr(generator, "generate_questions", lambda summary, topics: json.dumps(
+        {"questions": [make_question(0)]}, ensure_ascii=False
+    ))
+    monkeypatch.setattr(openai.ChatCompletion, "create", lambda **kwargs: make_response(
+        json.dumps({"요약": "요약", "핵심 주제": ["주제"]}, ensure_ascii=False)
+    ))
+    processor = ContentProcessor()
+    pdf = make_pdf([f"Section {i} explains {name} in detail" for i, name in enumerate(["cells", "atoms", "waves", "stars", "rocks"])])
+    events = []
+
+    result = QuestionPipeline(processor, generator, stream_pdf=True).run(
+        'pdf', None, io.BytesIO(pdf), lambda event, data: events.append((event, data))
+    )
+
+    text, _ = processor.process_pdf_with_metadata(io.BytesIO(pdf))
+    assert result["document_hash"] == QuestionGenerator.fingerprint(text)
+    extracted = dict(events)["extracted"]
+    assert (extracted["pages"], extracted["characters"]) == (5, len(text))
+    assert [event for event, _ in events][-2:] == ["summary", "questions"]
+
+
+def test_repeat_pdf_upload_reuses_bank_without_llm_calls(generator, tmp_path, monkeypatch):
+    """같은 PDF를 다시 올리면 캐시가 꺼져 있어도 문제 은행의 세트를 LLM 호출 없이 재사용하는지 테스트"""
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        if "questions" in kwargs["messages"][0]["content"]:
+            return make_response(json.dumps(
+                {"questions": [make_question(i) for i in range(3)]}, ensure_ascii=False
+            ))
+        return make_response(json.dumps({"요약": "요약", "핵심 주제": ["주제"]}, ensure_ascii=False))
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", create)
+    for name in ("cache", "summary_cache", "question_cache", "feedback_cache"):
+        monkeypatch.setattr(getattr(generator, name), "enabled", False)
+    processor = ContentProcessor()
+    processor.artifacts = ArtifactStore(str(tmp_path / "artifacts.db"))
+    pipeline = QuestionPipeline(
+        processor, generator, QuestionBank(str(tmp_path / "bank.db")), stream_pdf=True
+    )
+    pdf = make_pdf([f"Section {i} explains {name} in detail" for i, name in enumerate(["cells", "atoms", "waves"])])
+
+    first = pipeline.run('pdf', None, io.BytesIO(pdf))
+    assert calls and not first["reused"]
+
+    calls.clear()
+    second = pipeline.run('pdf', None, io.BytesIO(pdf))
+
+    assert calls == []
+    assert second["reused"] and second["question_set_id"] == first["question_set_id"]
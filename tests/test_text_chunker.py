@@ -0,0 +1,112 @@
+import random
+import time
+
+import pytest
+
+from services import text_chunker
+from services.text_chunker import TextChunker
+from services.tokenizer import get_encoding
+
+KOREAN = "인공지능은 인간의 학습능력과 추론능력을 컴퓨터로 구현하려는 기술이다. "
+ENGLISH = "Machine learning is a field of study in artificial intelligence. "
+
+# 10 MB 분할 지연 예산 (benchmarks/chunking.py와 같은 방식으로 만든 한국어/영어 혼합 문서)
+# 단일 코어 측정값: 전체 인코딩 0.8-0.9초, split/iter_split 0.9-1.1초 (부하 시 1.5-1.9초, 1.9-2.1초)
+# "1초 훨씬 미만" 목표는 달성하지 못함: 정확한 토큰 한도를 위해 전체 인코딩이 한 번은 필요해 그 시간이 하한
+SPLIT_BUDGET_SECONDS = 2.5
+SPLIT_OVERHEAD_RATIO = 1.5  # 전체 인코딩 한 번 대비 분할 시간
+
+
+@pytest.fixture(scope="module")
+def encoding():
+    return get_encoding()
+
+
+@pytest.fixture
+def chunker(encoding):
+    return TextChunker(encoding)
+
+
+def test_chunks_stay_within_chunk_size(chunker, encoding):
+    """모든 청크가 chunk_size 이하인지 테스트"""
+    text = "\n\n".join((KOREAN + ENGLISH) * (i % 5 + 1) for i in range(50))
+
+    chunks = chunker.split(text, 100)
+
+    assert len(chunks) > 1
+    assert all(len(encoding.encode(chunk)) <= 100 for chunk in chunks)
+    assert "".join(chunks).replace(" ", "").replace("\n", "") == \
+        text.replace(" ", "").replace("\n", "")
+
+
+def test_chunks_end_on_korean_sentence_boundary(chunker):
+    """문단 구분이 없는 한국어 텍스트를 문장 경계에서 자르는지 테스트"""
+    text = KOREAN * 40
+
+    chunks = chunker.split(text, 100)
+
+    assert len(chunks) > 1
+    assert all(chunk.endswith("기술이다.") for chunk in chunks)
+
+
+def test_text_without_boundaries_is_not_broken_mid_character(chunker):
+    """경계가 없는 긴 한글도 글자가 깨지지 않게 자르는지 테스트"""
+    text = "가나다라마바사" * 300
+
+    chunks = chunker.split(text, 50)
+
+    assert "".join(chunks) == text
+
+
+def test_exceeds_uses_estimate_far_from_limit(chunker):
+    """한도에서 먼 텍스트는 어림값만으로 판단하는지 테스트"""
+    assert not chunker.exceeds("짧은 텍스트", 1000)
+    assert chunker.exceeds(KOREAN * 500, 1000)
+    assert chunker.estimate_tokens(KOREAN) > chunker.estimate_tokens(ENGLISH) / 2
+
+
+def test_vendored_encoding_matches_cl100k(encoding):
+    """저장소에 포함된 BPE 파일로 만든 인코딩이 cl100k_base와 같은 토큰을 내는지 테스트"""
+    assert encoding.name == "cl100k_base"
+    assert encoding.encode("hello world") == [15339, 1917]
+    assert encoding.encode("<|endoftext|>", allowed_special="all") == [100257]
+
+
+def test_iter_split_matches_split_and_parallel_encode(chunker, encoding, monkeypatch):
+    """조각별로 한 번만 인코딩한 스트리밍 분할과 여러 CPU로 나눠 인코딩한 분할이 전체 분할과 같은지 테스트"""
+    pages = ["\n\n".join(KOREAN * (i % 3 + 1) + ENGLISH * (i % 4 + 1) for i in range(page, page + 4)) for page in range(30)]
+    text = "\n\n".join(pages)
+    expected = chunker.split(text, 100)
+
+    assert list(chunker.iter_split(pages, 100)) == expected
+
+    monkeypatch.setattr(text_chunker, "PARALLEL_MIN_CHARS", 100)
+    monkeypatch.setattr(text_chunker.os, "cpu_count", lambda: 4)
+    assert chunker._encode(text) == encoding.encode_ordinary(text)
+    assert chunker.split(text, 100) == expected
+
+
+def test_ten_megabyte_split_stays_within_latency_budget(chunker, encoding):
+    """10 MB 문서의 분할 시간이 예산 안이고 전체 인코딩 한 번에 가까운지 테스트"""
+    rnd = random.Random(0)
+    words = (KOREAN + ENGLISH).split()
+    pages, size = [], 0
+    while size < 10 * 1024 * 1024:
+        page = "\n\n".join(
+            " ".join(rnd.choice(words) + (str(rnd.randint(0, 999)) if rnd.random() < 0.1 else "") for _ in range(80))
+            for _ in range(8)
+        )
+        pages.append(page)
+        size += len(page.encode("utf-8")) + 2
+    text = "\n\n".join(pages)
+
+    def measure(step):
+        started_at = time.perf_counter()
+        step()
+        return time.perf_counter() - started_at
+
+    encode_seconds = measure(lambda: encoding.encode_ordinary(text))
+    for step in (lambda: chunker.split(text, 1000), lambda: list(chunker.iter_split(pages, 1000))):
+        seconds = measure(step)
+        assert seconds < SPLIT_BUDGET_SECONDS
+        assert seconds < encode_seconds * SPLIT_OVERHEAD_RATIO
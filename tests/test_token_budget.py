@@ -0,0 +1,68 @@
+import openai
+import pytest
+
+from services.token_budget import TokenBudget, UsageMeter, track_usage
+from utils.exceptions import TokenBudgetExceededError
+from tests.conftest import make_response
+
+
+def test_completion_limit_shrinks_to_fit_context_window():
+    """프롬프트가 크면 max_tokens를 남은 컨텍스트만큼 줄이는지 테스트"""
+    budget = TokenBudget(safety_margin=64)
+
+    assert budget.completion_limit("gpt-4", 1000, 2000) == 2000
+    assert budget.completion_limit("gpt-4", 7000, 2000) == 8192 - 7000 - 64
+    with pytest.raises(TokenBudgetExceededError):
+        budget.completion_limit("gpt-4", 8100, 2000)
+
+
+def test_model_spec_prefers_longest_prefix():
+    """모델 이름은 가장 긴 접두어 기준으로 조회되는지 테스트"""
+    budget = TokenBudget()
+
+    assert budget.context_window("gpt-4o-mini-2024-07-18") == 128000
+    assert budget.context_window("gpt-4-0613") == 8192
+    assert budget.context_window("unknown-model") == 4096
+    assert budget.cost("gpt-4", 1000, 1000) == pytest.approx(0.09)
+
+
+def test_usage_meter_counts_cached_calls_without_tokens():
+    """캐시 응답은 호출 수만 세고 토큰과 비용은 더하지 않는지 테스트"""
+    meter = UsageMeter()
+    meter.record("questions", "gpt-4", 100, 50, 0.006)
+    meter.record("questions", "gpt-4", cached=True)
+
+    summary = meter.summary()
+    assert summary["calls"] == 1
+    assert summary["cached_calls"] == 1
+    assert summary["total_tokens"] == 150
+    assert summary["stages"]["questions"]["models"] == ["gpt-4"]
+
+
+def test_parallel_chunk_calls_are_recorded_per_request(generator, fake_openai):
+    """워커 스레드에서 실행된 청크 요약도 요청 계량기에 단계별로 기록되는지 테스트"""
+    content = "\n\n".join(f"문단{i} " + "내용 " * 12 for i in range(8))
+
+    with track_usage() as meter:
+        generator.generate_summary_and_topics(content)
+
+    stages = meter.summary()["stages"]
+    assert stages["chunk_summary"]["calls"] == 8
+    assert stages["chunk_summary"]["models"] == ["gpt-3.5-turbo"]
+    assert stages["chunk_summary"]["prompt_tokens"] > 0
+    assert generator.stats()["usage"]["calls"] >= 8
+
+
+def test_oversized_feedback_input_is_trimmed(generator, monkeypatch):
+    """컨텍스트 윈도를 넘는 입력은 호출 전에 잘라내는지 테스트"""
+    prompts = []
+
+    def create(model, messages, max_tokens, **kwargs):
+        prompts.append(messages[0]["content"])
+        assert len(generator.encoding.encode(messages[0]["content"])) + max_tokens <= 8192
+        return make_response("피드백")
+
+    monkeypatch.setattr(openai.ChatCompletion, "create", create)
+
+    assert generator.generate_feedback("긴 질문 " * 10000, "90", "80") == "피드백"
+    assert len(prompts[0]) < len("긴 질문 " * 10000)
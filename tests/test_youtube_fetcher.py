@@ -0,0 +1,94 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from services import youtube_fetcher
+from services.youtube_fetcher import QUOTA_MESSAGE, QuotaLedger, YouTubeFetcher
+from utils.cache import PersistentCache
+from utils.exceptions import ContentProcessingError
+
+
+class FakeYouTube:
+    """videos().list().execute()만 흉내 내는 Data API 서비스"""
+    def __init__(self, delay=0.0, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = []
+
+    def videos(self):
+        return self
+
+    def list(self, part, id):
+        self.calls.append(id)
+        return self
+
+    def execute(self, http=None):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {"items": [{"snippet": {"title": f"강의 {self.calls[-1]}", "description": "설명"}}]}
+
+
+@pytest.fixture
+def transcripts(monkeypatch):
+    """자막 API 호출 횟수를 세는 가짜 list_transcripts"""
+    calls = []
+
+    def list_transcripts(video_id):
+        calls.append(video_id)
+        time.sleep(0.2)
+        transcript = SimpleNamespace(is_generated=False, fetch=lambda: [{"text": "자막 내용", "start": 0, "duration": 1}])
+        return SimpleNamespace(find_transcript=lambda languages: transcript)
+
+    monkeypatch.setattr(youtube_fetcher.YouTubeTranscriptApi, "list_transcripts", list_transcripts)
+    return calls
+
+
+def make_fetcher(tmp_path, youtube, daily_limit=10000, reserve=0):
+    path = str(tmp_path / "cache.db")
+    return YouTubeFetcher(
+        lambda: youtube,
+        PersistentCache(path, namespace="youtube_metadata"),
+        PersistentCache(path, namespace="youtube_transcript"),
+        QuotaLedger(str(tmp_path / "quota.db"), daily_limit, reserve)
+    )
+
+
+def test_fetches_concurrently_then_serves_from_cache(tmp_path, transcripts):
+    """정보와 자막을 동시에 가져오고, 같은 동영상은 API 호출 없이 캐시에서 가져오는지 테스트"""
+    youtube = FakeYouTube(delay=0.2)
+    fetcher = make_fetcher(tmp_path, youtube)
+
+    started_at = time.monotonic()
+    metadata, transcript = fetcher.fetch("abc")
+    elapsed = time.monotonic() - started_at
+    again = fetcher.fetch("abc")
+
+    assert elapsed < 0.35
+    assert metadata["title"] == "강의 abc" and transcript == {"status": "ok", "text": "자막 내용"}
+    assert again == (metadata, transcript)
+    assert youtube.calls == ["abc"] and transcripts == ["abc"]
+    assert fetcher.stats()["quota"]["used"] == 1
+
+
+def test_quota_ledger_throttles_before_exhaustion(tmp_path, transcripts):
+    """예산을 다 쓰면 API를 호출하지 않고, 403 할당량 초과를 받으면 오늘 예산을 소진 처리하는지 테스트"""
+    youtube = FakeYouTube()
+    fetcher = make_fetcher(tmp_path, youtube, daily_limit=3, reserve=1)
+
+    fetcher.metadata("a")
+    fetcher.metadata("b")
+    with pytest.raises(ContentProcessingError, match="할당량"):
+        fetcher.metadata("c")
+    assert youtube.calls == ["a", "b"]
+    assert fetcher.ledger.stats()["rejected"] == 1
+
+    response = SimpleNamespace(status=403, reason="Forbidden")
+    quota_error = HttpError(response, b'{"error": {"errors": [{"reason": "quotaExceeded"}]}}')
+    exhausted = make_fetcher(tmp_path / "other", FakeYouTube(error=quota_error))
+    with pytest.raises(ContentProcessingError) as error:
+        exhausted.metadata("d")
+    assert error.value.message == QUOTA_MESSAGE
+    assert not exhausted.ledger.reserve(1)
@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+# fork 전에 열린 연결: 자식 프로세스에서 닫으면 부모가 쓰는 WAL 파일을 정리할 수 있으므로 닫지 않고 보관
+_inherited_connections: List[sqlite3.Connection] = []
+
+
+def thread_connection(local: threading.local, path: str) -> sqlite3.Connection:
+    """
+    스레드별 SQLite 연결을 반환합니다. (WAL 모드, 자동 커밋)
+    gunicorn preload로 fork된 워커는 부모 프로세스가 연 연결을 쓰지 않고 새로 연결합니다.
+    """
+    conn = getattr(local, "conn", None)
+    if conn is not None and local.pid != os.getpid():
+        _inherited_connections.append(conn)
+        conn = None
+    if conn is None:
+        conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        local.conn, local.pid = conn, os.getpid()
+    return conn
+
+
+def make_cache_key(*parts: Any) -> str:
+    """JSON으로 직렬화할 수 있는 값들로 SHA-256 캐시 키를 만듭니다."""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PersistentCache:
+    """
+    SQLite 기반의 디스크 캐시
+
+    gunicorn 워커들이 같은 파일을 공유하며, 항목 수가 max_entries를
+    넘으면 가장 오래 사용되지 않은 항목부터 제거(LRU)합니다.
+    namespace로 용도별 항목을 구분합니다.
+
+    조회는 쓰기 트랜잭션 없이 SELECT만 하고, 사용 시각과 적중/미스 횟수는 메모리에 모았다가
+    FLUSH_EVERY건 또는 FLUSH_SECONDS초마다(그리고 저장/통계 조회 시) 한 트랜잭션으로 기록합니다.
+    """
+    FLUSH_EVERY = 64
+    FLUSH_SECONDS = 5.0
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str = "default",
+        max_entries: int = 10000,
+        ttl_seconds: Optional[int] = None,
+        enabled: bool = True
+    ) -> None:
+        self.path = path
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._local = threading.local()
+        self._pending_lock = threading.Lock()
+        self._pending_access: Dict[str, float] = {}
+        self._pending_counts = {"hits": 0, "misses": 0}
+        self._flushed_at = time.monotonic()
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._setup()
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결을 반환합니다."""
+        return thread_connection(self._local, self.path)
+
+    def _setup(self) -> None:
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_cache_entries_lru
+            ON cache_entries (namespace, last_access)
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_stats (
+                namespace TEXT PRIMARY KEY,
+                hits INTEGER NOT NULL DEFAULT 0,
+                misses INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute(
+            "INSERT OR IGNORE INTO cache_stats (namespace) VALUES (?)",
+            (self.namespace,)
+        )
+
+    def _write_pending(self, conn: sqlite3.Connection) -> None:
+        """
+        모아 둔 사용 시각과 적중/미스 횟수를 기록하고 만료된 항목을 지웁니다.
+        (호출하는 쪽의 쓰기 트랜잭션 안에서 실행)
+        """
+        with self._pending_lock:
+            access, self._pending_access = self._pending_access, {}
+            counts, self._pending_counts = self._pending_counts, {"hits": 0, "misses": 0}
+            self._flushed_at = time.monotonic()
+        if access:
+            conn.executemany(
+                "UPDATE cache_entries SET last_access = MAX(last_access, ?) WHERE namespace = ? AND key = ?",
+                [(accessed_at, self.namespace, key) for key, accessed_at in access.items()]
+            )
+        if counts["hits"] or counts["misses"]:
+            conn.execute(
+                "UPDATE cache_stats SET hits = hits + ?, misses = misses + ? WHERE namespace = ?",
+                (counts["hits"], counts["misses"], self.namespace)
+            )
+        conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+            (self.namespace, time.time())
+        )
+
+    def flush(self) -> None:
+        """모아 둔 사용 시각과 적중/미스 횟수를 한 트랜잭션으로 기록합니다."""
+        if not self.enabled:
+            return
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._write_pending(conn)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 값을 조회합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값, 없거나 만료되었으면 None
+        """
+        if not self.enabled:
+            return None
+
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+            (self.namespace, key)
+        ).fetchone()
+        now = time.time()
+        # 만료된 항목은 여기서 지우지 않고 다음 기록 때 정리
+        hit = row is not None and (row[1] is None or row[1] > now)
+
+        with self._pending_lock:
+            if hit:
+                self._pending_access[key] = now
+            self._pending_counts["hits" if hit else "misses"] += 1
+            due = (
+                sum(self._pending_counts.values()) >= self.FLUSH_EVERY
+                or time.monotonic() - self._flushed_at >= self.FLUSH_SECONDS
+            )
+        if due:
+            self.flush()
+        return row[0] if hit else None
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        """
+        값을 저장하고 용량을 넘는 항목을 정리합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 문자열
+            ttl_seconds: 항목별 유효 시간 (없으면 기본값 사용)
+        """
+        if not self.enabled:
+            return
+
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # 정리 전에 최근 사용 시각을 반영해 LRU 순서를 맞춤
+            self._write_pending(conn)
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (self.namespace, key, value, expires_at, now)
+            )
+            count = conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()[0]
+            if count > self.max_entries:
+                conn.execute(
+                    """
+                    DELETE FROM cache_entries WHERE namespace = ? AND key IN (
+                        SELECT key FROM cache_entries WHERE namespace = ?
+                        ORDER BY last_access LIMIT ?
+                    )
+                    """,
+                    (self.namespace, self.namespace, count - self.max_entries)
+                )
+
+    def delete(self, key: str) -> None:
+        """항목을 삭제합니다."""
+        if not self.enabled:
+            return
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """모든 워커를 합산한 적중/미스 횟수와 현재 항목 수를 반환합니다."""
+        if not self.enabled:
+            return {"hits": 0, "misses": 0, "entries": 0}
+
+        self.flush()
+        conn = self._connection()
+        hits, misses = conn.execute(
+            "SELECT hits, misses FROM cache_stats WHERE namespace = ?",
+            (self.namespace,)
+        ).fetchone()
+        entries = conn.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,)
+        ).fetchone()[0]
+        return {"hits": hits, "misses": misses, "entries": entries}
@@ -69,4 +69,74 @@ class ConfigurationError(QuestionGeneratorError):
             error_code="CONFIGURATION_ERROR",
             status_code=500,
             details=details
-        ) 
\ No newline at end of file
+        )
+
+class JobQueueFullError(QuestionGeneratorError):
+    """작업 대기열이 가득 찬 경우의 예외"""
+    def __init__(
+        self,
+        message: str,
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        super().__init__(
+            message=message,
+            error_code="JOB_QUEUE_FULL",
+            status_code=429,
+            details=details
+        )
+
+class JobNotFoundError(QuestionGeneratorError):
+    """존재하지 않는 작업을 조회한 경우의 예외"""
+    def __init__(
+        self,
+        message: str,
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        super().__init__(
+            message=message,
+            error_code="JOB_NOT_FOUND",
+            status_code=404,
+            details=details
+        )
+
+class ArtifactNotFoundError(QuestionGeneratorError):
+    """저장되지 않은 추출 결과를 조회한 경우의 예외"""
+    def __init__(
+        self,
+        message: str,
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        super().__init__(
+            message=message,
+            error_code="ARTIFACT_NOT_FOUND",
+            status_code=404,
+            details=details
+        )
+
+class CircuitOpenError(QuestionGeneratorError):
+    """외부 API 장애로 서킷 브레이커가 열린 경우의 예외"""
+    def __init__(
+        self,
+        message: str,
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        super().__init__(
+            message=message,
+            error_code="CIRCUIT_OPEN",
+            status_code=503,
+            details=details
+        )
+
+class TokenBudgetExceededError(QuestionGeneratorError):
+    """프롬프트가 모델의 컨텍스트 한도를 넘는 경우의 예외"""
+    def __init__(
+        self,
+        message: str,
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        super().__init__(
+            message=message,
+            error_code="TOKEN_BUDGET_EXCEEDED",
+            status_code=413,
+            details=details
+        )
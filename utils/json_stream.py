@@ -0,0 +1,236 @@
+import json
+import re
+from typing import Any, List, Optional
+
+
+class JsonArrayStream:
+    """
+    스트리밍되는 JSON 텍스트에서 특정 키의 배열 항목을 완성되는 대로 꺼내는 파서
+
+    예: '{"questions": [{...}, {...' 처럼 일부만 도착한 상태에서도
+    닫힌 항목은 바로 반환합니다. key가 None이면 처음 나오는 배열의 항목을 꺼냅니다.
+    """
+    def __init__(self, key: Optional[str] = None) -> None:
+        self.key = key
+        self.buffer = ""
+        self.cursor: Optional[int] = None  # 배열 안에서 다음에 검사할 위치
+        self.item_start: Optional[int] = None
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.closed = False
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        새로 도착한 텍스트를 추가하고 완성된 배열 항목들을 반환합니다.
+
+        Args:
+            text: 새로 수신한 텍스트 조각
+
+        Returns:
+            이번 호출에서 새로 완성된 항목 리스트
+        """
+        self.buffer += text
+        if self.closed:
+            return []
+
+        if self.cursor is None:
+            pattern = r'"%s"\s*:\s*\[' % re.escape(self.key) if self.key is not None else r'\['
+            match = re.search(pattern, self.buffer)
+            if not match:
+                return []
+            self.cursor = match.end()
+
+        items = []
+        buffer = self.buffer
+        position = self.cursor
+        while position < len(buffer):
+            char = buffer[position]
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == "\\":
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in "{[":
+                if self.depth == 0:
+                    self.item_start = position
+                self.depth += 1
+            elif char in "}]":
+                if self.depth == 0:
+                    # 배열 자체가 닫힘
+                    self.closed = True
+                    position += 1
+                    break
+                self.depth -= 1
+                if self.depth == 0:
+                    try:
+                        items.append(loads_tolerant(buffer[self.item_start:position + 1]))
+                    except json.JSONDecodeError:
+                        pass
+                    self.item_start = None
+
+            position += 1
+
+        self.cursor = position
+        return items
+
+
+FENCE_PATTERN = re.compile(r"```[a-zA-Z]*[ \t]*\n?(.*?)(?:```|$)", re.DOTALL)
+PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def strip_code_fences(text: str) -> str:
+    """마크다운 코드 펜스(```json ... ```) 안의 내용만 남깁니다."""
+    match = FENCE_PATTERN.search(text)
+    return match.group(1) if match else text
+
+
+def _close(out: List[str], stack: List[str]) -> str:
+    text = "".join(out).rstrip()
+    if text.endswith(","):
+        text = text[:-1]
+    elif text.endswith(":"):
+        text += " null"
+    return text + "".join("}" if opener == "{" else "]" for opener in reversed(stack))
+
+
+def repair_json(text: str) -> List[str]:
+    """
+    모델이 만든 JSON의 흔한 결함을 고친 후보 문자열들을 반환합니다.
+
+    - 코드 펜스와 앞뒤 설명 문장 제거
+    - // 및 /* */ 주석, 닫는 괄호 앞의 쉼표 제거
+    - 문자열 안의 줄바꿈 이스케이프, True/False/None 변환
+    - 잘린 출력은 (1) 열린 문자열과 괄호를 그대로 닫은 것,
+      (2) 마지막으로 완성된 항목까지만 남기고 닫은 것 두 가지 후보를 만듭니다.
+    """
+    text = strip_code_fences(text)
+    starts = [index for index in (text.find("{"), text.find("[")) if index >= 0]
+    if not starts:
+        return [text]
+
+    out: List[str] = []
+    stack: List[str] = []
+    safe: Optional[tuple] = None  # (출력 길이, 괄호 스택): 완성된 항목 직후 위치
+    in_string = False
+    escape = False
+    position = min(starts)
+    while position < len(text):
+        char = text[position]
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+            elif char == "\n":
+                char = "\\n"
+            elif char == "\t":
+                char = "\\t"
+            out.append(char)
+            position += 1
+            continue
+
+        if text.startswith("//", position):
+            newline = text.find("\n", position)
+            position = len(text) if newline < 0 else newline
+            continue
+        if text.startswith("/*", position):
+            end = text.find("*/", position + 2)
+            position = len(text) if end < 0 else end + 2
+            continue
+
+        literal = next(
+            (word for word in PYTHON_LITERALS
+             if text.startswith(word, position) and not text[position + len(word):position + len(word) + 1].isalnum()),
+            None
+        )
+        if literal:
+            out.append(PYTHON_LITERALS[literal])
+            position += len(literal)
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append(char)
+        elif char in "}]":
+            # 닫는 괄호 앞의 쉼표 제거
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            # 짝이 맞지 않는 닫는 괄호는 열린 괄호에 맞춰 바꿈
+            opener = stack.pop()
+            out.append("}" if opener == "{" else "]")
+            position += 1
+            if not stack:
+                return ["".join(out)]
+            safe = (len(out), list(stack))
+            continue
+        elif char == "," and stack:
+            safe = (len(out), list(stack))
+        out.append(char)
+        position += 1
+
+    # 출력이 중간에 잘린 경우
+    candidates = [_close(out + (['"'] if in_string else []), stack)]
+    if safe:
+        candidates.append(_close(out[:safe[0]], safe[1]))
+    return candidates
+
+
+def is_truncated(text: str) -> bool:
+    """
+    모델 출력의 JSON이 끝나기 전에 끊겼는지(열린 문자열이나 괄호가 남았는지) 확인합니다.
+    응답 길이 한도에 걸린 출력은 repair_json으로 닫을 수는 있어도 마지막 값이 반쪽입니다.
+    """
+    text = strip_code_fences(text)
+    starts = [index for index in (text.find("{"), text.find("[")) if index >= 0]
+    if not starts:
+        return False
+    depth = 0
+    in_string = False
+    escape = False
+    for char in text[min(starts):]:
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return False
+    return True
+
+
+def loads_tolerant(text: str) -> Any:
+    """
+    json.loads를 먼저 시도하고, 실패하면 repair_json의 후보를 차례로 시도합니다.
+
+    Raises:
+        json.JSONDecodeError: 어떤 후보로도 해석할 수 없는 경우
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        error = e
+    for candidate in repair_json(text):
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+    raise error
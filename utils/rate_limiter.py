@@ -0,0 +1,73 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """일정한 속도로 채워지는 토큰 버킷"""
+    def __init__(self, capacity: float, refill_per_second: float) -> None:
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+            self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount 만큼 꺼내기 위해 기다려야 하는 시간(초)을 반환합니다."""
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_per_second
+
+
+class RateLimiter:
+    """
+    분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 제한하는 스레드 안전 리미터
+
+    여러 스레드가 동시에 API를 호출해도 설정한 한도를 넘지 않도록
+    호출 직전에 acquire()로 필요한 만큼 대기합니다.
+    """
+    def __init__(self, requests_per_minute: int, tokens_per_minute: Optional[int] = None) -> None:
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+            if tokens_per_minute else None
+        )
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        요청 1건과 tokens 만큼의 토큰을 확보할 때까지 대기합니다.
+
+        Args:
+            tokens: 이번 호출에서 사용할 것으로 예상되는 토큰 수
+
+        Returns:
+            실제로 대기한 시간(초)
+        """
+        if self.tokens:
+            # 버킷 용량보다 큰 요청은 영원히 대기하지 않도록 용량으로 제한
+            tokens = min(tokens, self.tokens.capacity)
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.requests.refill(now)
+                wait = self.requests.wait_time(1)
+                if self.tokens:
+                    self.tokens.refill(now)
+                    wait = max(wait, self.tokens.wait_time(tokens))
+
+                if wait <= 0:
+                    self.requests.tokens -= 1
+                    if self.tokens:
+                        self.tokens.tokens -= tokens
+                    return waited
+
+            time.sleep(wait)
+            waited += wait
@@ -0,0 +1,194 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+from utils.exceptions import CircuitOpenError
+from utils.logger import logger
+
+T = TypeVar("T")
+
+# classify()가 반환하는 오류 종류
+THROTTLE = "throttle"  # 429 등 속도 제한: 재시도하고 동시성을 줄임
+RETRY = "retry"        # 일시적인 서버/네트워크 오류: 재시도
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 임계값을 넘으면 일정 시간 호출을 차단하는 서킷 브레이커
+
+    closed → (연속 실패) → open → (recovery_seconds 경과) → half_open
+    half_open 상태에서는 시험 호출 하나만 허용하고, 성공하면 closed로 돌아갑니다.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_seconds: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지 반환합니다."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_seconds:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.state = self.CLOSED
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("circuit_opened", failures=self.failures)
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 방식으로 동시 호출 수를 조절하는 리미터
+
+    성공할 때마다 한도를 1/한도 만큼 늘리고(가산 증가),
+    속도 제한 응답을 받으면 한도를 절반으로 줄입니다(승산 감소).
+    """
+    def __init__(self, max_limit: int, min_limit: int = 1) -> None:
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(float(self.min_limit), self.limit / 2)
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class ResilientCaller:
+    """
+    외부 API 호출을 재시도, 지수 백오프(지터 포함), 적응형 동시성 제한,
+    서킷 브레이커로 감싸는 공용 호출기
+
+    Args:
+        classify: 예외를 THROTTLE, RETRY 또는 None(재시도 불가)으로 분류하는 함수
+        retry_after: 예외에서 Retry-After 대기 시간(초)을 꺼내는 함수
+    """
+    def __init__(
+        self,
+        classify: Callable[[Exception], Optional[str]],
+        retry_after: Optional[Callable[[Exception], Optional[float]]] = None,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_concurrency: int = 4,
+        breaker: Optional[CircuitBreaker] = None
+    ) -> None:
+        self.classify = classify
+        self.retry_after = retry_after or (lambda error: None)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.concurrency = AdaptiveConcurrencyLimiter(max_concurrency)
+        self.breaker = breaker or CircuitBreaker()
+        self.counters = {"calls": 0, "retries": 0, "throttles": 0, "failures": 0, "rejected": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간을 계산합니다. (지수 증가 + 지터)"""
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def call(self, func: Callable[[], T]) -> T:
+        """
+        func를 호출하고, 일시적인 오류면 재시도합니다.
+
+        Raises:
+            CircuitOpenError: 서킷 브레이커가 열려 있는 경우
+            Exception: 재시도할 수 없거나 재시도 횟수를 모두 쓴 경우 마지막 예외
+        """
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.allow():
+                self._count("rejected")
+                raise CircuitOpenError(
+                    "외부 API 오류가 계속되어 요청을 일시적으로 중단했습니다. 잠시 후 다시 시도해주세요.",
+                    details={"retry_in": self.breaker.recovery_seconds}
+                )
+
+            self.concurrency.acquire()
+            self._count("calls")
+            try:
+                result = func()
+            except Exception as e:
+                kind = self.classify(e)
+                self.concurrency.release(throttled=kind == THROTTLE)
+                if kind is None:
+                    # 요청 자체의 문제이므로 서비스는 정상으로 간주
+                    self.breaker.record_success()
+                    raise
+
+                self.breaker.record_failure()
+                self._count("throttles" if kind == THROTTLE else "failures")
+                if attempt == self.max_retries:
+                    raise
+
+                delay = self.retry_after(e)
+                delay = min(delay, self.max_delay) if delay is not None else self.backoff(attempt)
+                self._count("retries")
+                logger.warning(
+                    "api_call_retry",
+                    attempt=attempt + 1,
+                    kind=kind,
+                    delay=round(delay, 2),
+                    error=str(e)
+                )
+                time.sleep(delay)
+            else:
+                self.concurrency.release()
+                self.breaker.record_success()
+                return result
+
+        raise AssertionError("unreachable")
+
+    def stats(self) -> Dict[str, Any]:
+        """재시도/속도 제한/실패 횟수와 서킷 브레이커, 동시성 한도 상태를 반환합니다."""
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            **counters,
+            "circuit_state": self.breaker.state,
+            "concurrency_limit": int(self.concurrency.limit),
+            "in_flight": self.concurrency.in_flight
+        }